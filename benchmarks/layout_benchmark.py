@@ -0,0 +1,44 @@
+import sys
+import time
+from qtpy.QtWidgets import QApplication
+from src.pyqttoast import Toast
+
+
+SHOWN_COUNT = 50
+UPDATE_COUNT = 100
+
+
+def show_toasts() -> float:
+    """Show the maximum amount of toasts one after another
+
+    :return: elapsed time in seconds
+    """
+
+    start = time.perf_counter()
+    for i in range(SHOWN_COUNT):
+        toast = Toast()
+        toast.setTitle('Toast {}'.format(i))
+        toast.setText('Line\n' * (i % 3 + 1))
+        toast.setFadeInDuration(0)
+        toast.show()
+    return time.perf_counter() - start
+
+
+def update_positions() -> float:
+    """Reposition the whole stack of shown toasts repeatedly
+
+    :return: elapsed time in seconds
+    """
+
+    start = time.perf_counter()
+    for i in range(UPDATE_COUNT):
+        Toast.setOffset(20 + i % 2, 45)
+    return time.perf_counter() - start
+
+
+# QT_QPA_PLATFORM=offscreen python -m benchmarks.layout_benchmark
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    Toast.setMaximumOnScreen(SHOWN_COUNT)
+    print('Showing {} toasts:           {:8.2f} ms'.format(SHOWN_COUNT, show_toasts() * 1000))
+    print('Repositioning the stack {} times: {:8.2f} ms'.format(UPDATE_COUNT, update_positions() * 1000))
@@ -0,0 +1,46 @@
+import sys
+import time
+from qtpy.QtWidgets import QApplication
+from src.pyqttoast import Toast
+
+
+CYCLES = 300
+
+
+def run_cycles(pooling_enabled: bool) -> tuple[float, int]:
+    """Show and hide toasts one after another
+
+    :param pooling_enabled: whether the toasts are taken from the pool
+    :return: average show latency in milliseconds and amount of toasts created
+    """
+
+    Toast.reset()
+    Toast.setPoolingEnabled(pooling_enabled)
+    # Every toast is kept alive so that the ids of different toasts cannot collide
+    used_toasts = []
+    total_time = 0
+
+    for i in range(CYCLES):
+        start = time.perf_counter()
+        toast = Toast.obtain() if pooling_enabled else Toast()
+        toast.setTitle('Benchmark')
+        toast.setText('Toast number {}'.format(i))
+        toast.setFadeInDuration(0)
+        toast.setFadeOutDuration(0)
+        toast.show()
+        total_time += time.perf_counter() - start
+
+        used_toasts.append(toast)
+        toast.hide()
+        QApplication.processEvents()
+
+    return total_time / CYCLES * 1000, len({id(toast) for toast in used_toasts})
+
+
+# QT_QPA_PLATFORM=offscreen python -m benchmarks.pool_benchmark
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    for pooling_enabled in (False, True):
+        latency, created_count = run_cycles(pooling_enabled)
+        print('Pooling {:3}: {:6.3f} ms average show latency, {} toasts created for {} cycles'
+              .format('on' if pooling_enabled else 'off', latency, created_count, CYCLES))
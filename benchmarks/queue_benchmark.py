@@ -0,0 +1,82 @@
+import time
+from src.pyqttoast.toast_queue import ToastQueue
+
+
+QUEUED_COUNT = 10000
+
+
+class Item:
+    pass
+
+
+def drain_list(items: list) -> float:
+    """Drain a plain list the way the queue was drained before
+
+    :param items: items to queue
+    :return: elapsed time in seconds
+    """
+
+    queue = list(items)
+    start = time.perf_counter()
+    while len(queue) > 0:
+        queue.pop(0)
+    return time.perf_counter() - start
+
+
+def drain_toast_queue(items: list) -> float:
+    """Drain a ToastQueue
+
+    :param items: items to queue
+    :return: elapsed time in seconds
+    """
+
+    queue = ToastQueue()
+    for item in items:
+        queue.append(item)
+    start = time.perf_counter()
+    while queue.popleft() is not None:
+        pass
+    return time.perf_counter() - start
+
+
+def cancel_list(items: list) -> float:
+    """Cancel every second item of a plain list
+
+    :param items: items to queue
+    :return: elapsed time in seconds
+    """
+
+    queue = list(items)
+    start = time.perf_counter()
+    for item in items[::2]:
+        if item in queue:
+            queue.remove(item)
+    return time.perf_counter() - start
+
+
+def cancel_toast_queue(items: list) -> float:
+    """Cancel every second item of a ToastQueue
+
+    :param items: items to queue
+    :return: elapsed time in seconds
+    """
+
+    queue = ToastQueue()
+    for item in items:
+        queue.append(item)
+    start = time.perf_counter()
+    for item in items[::2]:
+        if item in queue:
+            queue.remove(item)
+    return time.perf_counter() - start
+
+
+# python -m benchmarks.queue_benchmark
+if __name__ == '__main__':
+    items = [Item() for i in range(QUEUED_COUNT)]
+    print('Draining {} queued toasts'.format(QUEUED_COUNT))
+    print('  list.pop(0):          {:8.2f} ms'.format(drain_list(items) * 1000))
+    print('  ToastQueue.popleft(): {:8.2f} ms'.format(drain_toast_queue(items) * 1000))
+    print('Cancelling {} queued toasts'.format(QUEUED_COUNT // 2))
+    print('  list.remove():        {:8.2f} ms'.format(cancel_list(items) * 1000))
+    print('  ToastQueue.remove():  {:8.2f} ms'.format(cancel_toast_queue(items) * 1000))
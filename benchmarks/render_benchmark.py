@@ -0,0 +1,52 @@
+import sys
+import time
+from qtpy.QtWidgets import QApplication, QWidget
+from src.pyqttoast import Toast, ToastRenderMode
+
+
+TOASTS = 200
+REPAINTS = 200
+
+
+def run(render_mode: ToastRenderMode) -> tuple[float, int, float]:
+    """Create toasts and repaint a shown one
+
+    :param render_mode: render mode of the toasts
+    :return: average construction time in milliseconds, widgets per toast,
+        and average repaint time in milliseconds
+    """
+
+    Toast.reset()
+    Toast.setRenderMode(render_mode)
+    toasts = []
+
+    start = time.perf_counter()
+    for i in range(TOASTS):
+        toasts.append(Toast())
+    construction_time = (time.perf_counter() - start) / TOASTS * 1000
+    widget_count = len(toasts[0].findChildren(QWidget)) + 1
+
+    toast = toasts[0]
+    toast.setTitle('Benchmark')
+    toast.setText('Repainted toast')
+    toast.setFadeInDuration(0)
+    toast.show()
+    QApplication.processEvents()
+
+    start = time.perf_counter()
+    for i in range(REPAINTS):
+        toast.repaint()
+    repaint_time = (time.perf_counter() - start) / REPAINTS * 1000
+
+    for toast in toasts:
+        toast.deleteLater()
+    return construction_time, widget_count, repaint_time
+
+
+# QT_QPA_PLATFORM=offscreen python -m benchmarks.render_benchmark
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    for render_mode in (ToastRenderMode.WIDGETS, ToastRenderMode.PAINTED):
+        construction_time, widget_count, repaint_time = run(render_mode)
+        print('{:7}: {:6.3f} ms per toast created, {:2} widgets per toast, {:6.3f} ms per repaint'
+              .format(render_mode.name, construction_time, widget_count, repaint_time))
@@ -0,0 +1,40 @@
+import sys
+import time
+from qtpy.QtWidgets import QApplication
+from src.pyqttoast import Toast
+
+
+TEXT_LENGTHS = [10, 50, 200, 1000]
+REPETITIONS = 5
+
+
+def show_latency(word_count: int) -> float:
+    """Show toasts that have to be word wrapped to reach the minimum height
+
+    :param word_count: amount of words in the text
+    :return: average show latency in seconds
+    """
+
+    text = ' '.join('word{}'.format(i) for i in range(word_count))
+    total_time = 0
+
+    for i in range(REPETITIONS):
+        Toast.reset()
+        toast = Toast()
+        toast.setTitle('Title')
+        toast.setText(text)
+        toast.setMinimumHeight(150)
+        toast.setFadeInDuration(0)
+
+        start = time.perf_counter()
+        toast.show()
+        total_time += time.perf_counter() - start
+
+    return total_time / REPETITIONS
+
+
+# QT_QPA_PLATFORM=offscreen python -m benchmarks.wrap_benchmark
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    for word_count in TEXT_LENGTHS:
+        print('{:5} words: {:8.2f} ms average show latency'.format(word_count, show_latency(word_count) * 1000))
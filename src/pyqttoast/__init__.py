@@ -1 +1,2 @@
-from .toast import Toast, ToastPreset, ToastIcon, ToastPosition, ToastButtonAlignment
+from .toast import (Toast, ToastPreset, ToastIcon, ToastPosition, ToastButtonAlignment,
+                    ToastQueueOverflowPolicy, ToastRenderMode, ToastSpec)
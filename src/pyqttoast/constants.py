@@ -2,8 +2,15 @@ from qtpy.QtGui import QColor
 
 
 UPDATE_POSITION_DURATION = 200
-DURATION_BAR_UPDATE_INTERVAL = 1
+DURATION_BAR_MAXIMUM_UPDATE_RATE = 60
 DROP_SHADOW_SIZE = 5
+DURATION_BAR_HEIGHT = 4
+DROP_SHADOW_ALPHAS = (3, 5, 6, 9, 10)
+DROP_SHADOW_BORDER_RADIUS = 8
+RECOLORED_PIXMAP_CACHE_SIZE = 64
+TEXT_METRICS_CACHE_SIZE = 512
+PRECOMPUTE_COUNT = 3
+MAXIMUM_WIDGET_SIZE = 16777215
 SUCCESS_ACCENT_COLOR = QColor('#3E9141')
 WARNING_ACCENT_COLOR = QColor('#E8B849')
 ERROR_ACCENT_COLOR = QColor('#BA2626')
@@ -1,28 +1,53 @@
-from qtpy.QtGui import QPixmap, QColor, QImage, qRgba
+from qtpy.QtCore import Qt, QSize
+from qtpy.QtGui import QPixmap, QColor, QImage, QPainter, QPaintDevice, QGuiApplication
 from .toast_enums import ToastIcon
-from .os_utils import OSUtils
+from .resource_utils import ResourceUtils
+from .lru_cache import LRUCache
+from .constants import RECOLORED_PIXMAP_CACHE_SIZE
 
 
 class IconUtils:
 
+    # Bundled icons (decoded lazily and shared by all toasts)
+    __icons = {}
+    __icon_file_names = {
+        ToastIcon.SUCCESS: 'success.png',
+        ToastIcon.WARNING: 'warning.png',
+        ToastIcon.ERROR: 'error.png',
+        ToastIcon.INFORMATION: 'information.png',
+        ToastIcon.CLOSE: 'close.png'
+    }
+
+    # Recolored pixmaps shared by all toasts
+    __pixmap_cache = LRUCache(RECOLORED_PIXMAP_CACHE_SIZE)
+
     @staticmethod
     def get_icon_from_enum(enum_icon: ToastIcon):
         """Get a QPixmap from a ToastIcon
+        (the icon is only decoded once and then shared)
 
         :param enum_icon: ToastIcon
         :return: pixmap of the ToastIcon
         """
 
-        if enum_icon == ToastIcon.SUCCESS:
-            return QPixmap(OSUtils.get_current_directory() + '/icons/success.png')
-        elif enum_icon == ToastIcon.WARNING:
-            return QPixmap(OSUtils.get_current_directory() + '/icons/warning.png')
-        elif enum_icon == ToastIcon.ERROR:
-            return QPixmap(OSUtils.get_current_directory() + '/icons/error.png')
-        elif enum_icon == ToastIcon.INFORMATION:
-            return QPixmap(OSUtils.get_current_directory() + '/icons/information.png')
-        elif enum_icon == ToastIcon.CLOSE:
-            return QPixmap(OSUtils.get_current_directory() + '/icons/close.png')
+        if enum_icon not in IconUtils.__icon_file_names:
+            return None
+
+        icon = IconUtils.__icons.get(enum_icon)
+        if icon is None:
+            icon = QPixmap()
+            icon.loadFromData(ResourceUtils.read_binary('icons/' + IconUtils.__icon_file_names[enum_icon]))
+            IconUtils.__icons[enum_icon] = icon
+
+        # Implicitly shared copy, so modifying it does not affect the stored icon
+        return QPixmap(icon)
+
+    @staticmethod
+    def preload_icons():
+        """Decode all bundled icons so that no toast has to load them from disk"""
+
+        for enum_icon in IconUtils.__icon_file_names:
+            IconUtils.get_icon_from_enum(enum_icon)
 
     @staticmethod
     def recolor_image(image: QImage, color: QColor):
@@ -33,16 +58,112 @@ class IconUtils:
         :return: recolored image
         """
 
-        # Loop through every pixel
-        for x in range(0, image.width()):
-            for y in range(0, image.height()):
-                # Get current color of the pixel
-                current_color = image.pixelColor(x, y)
-                # Replace the rgb values with rgb of new color and keep alpha the same
-                new_color_r = color.red()
-                new_color_g = color.green()
-                new_color_b = color.blue()
-                new_color = QColor.fromRgba(
-                    qRgba(new_color_r, new_color_g, new_color_b, current_color.alpha()))
-                image.setPixelColor(x, y, new_color)
+        if image.isNull():
+            return QImage()
+
+        # QPainter can only paint on 32-bit images
+        if (image.format() != QImage.Format.Format_ARGB32_Premultiplied
+                and image.format() != QImage.Format.Format_ARGB32):
+            image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        else:
+            image = image.copy()
+
+        IconUtils.__fill_keep_alpha(image, color)
         return image
+
+    @staticmethod
+    def recolor_pixmap(pixmap: QPixmap, color: QColor):
+        """Take a pixmap and return a copy with the colors changed
+
+        :param pixmap: pixmap to recolor
+        :param color: new color
+        :return: recolored pixmap
+        """
+
+        if pixmap.isNull():
+            return QPixmap()
+
+        pixmap = pixmap.copy()
+        IconUtils.__fill_keep_alpha(pixmap, color)
+        return pixmap
+
+    @staticmethod
+    def get_recolored_pixmap(icon: QPixmap, size: QSize, color: QColor,
+                             device_pixel_ratio: float = None):
+        """Get a recolored version of an icon scaled to a size (cached)
+
+        :param icon: source icon
+        :param size: target size of the icon
+        :param color: new color
+        :param device_pixel_ratio: device pixel ratio the pixmap is created for
+            (defaults to the device pixel ratio of the application)
+        :return: recolored pixmap
+        """
+
+        if device_pixel_ratio is None:
+            device_pixel_ratio = QGuiApplication.instance().devicePixelRatio()
+
+        key = (icon.cacheKey(), size.width(), size.height(), color.rgb(), device_pixel_ratio)
+        pixmap = IconUtils.__pixmap_cache.get(key)
+
+        if pixmap is None:
+            pixmap = IconUtils.recolor_pixmap(IconUtils.__scale_pixmap(icon, size, device_pixel_ratio), color)
+            IconUtils.__pixmap_cache.put(key, pixmap)
+        return pixmap
+
+    @staticmethod
+    def __scale_pixmap(icon: QPixmap, size: QSize, device_pixel_ratio: float) -> QPixmap:
+        """Scale an icon down to a size in device independent pixels
+        (like QIcon.pixmap(), but for any device pixel ratio and not only the application's)
+
+        :param icon: source icon
+        :param size: target size of the icon
+        :param device_pixel_ratio: device pixel ratio the pixmap is created for
+        :return: scaled pixmap (never larger than the source icon)
+        """
+
+        device_size = QSize(round(size.width() * device_pixel_ratio),
+                            round(size.height() * device_pixel_ratio))
+        scaled_size = QSize(icon.size())
+        if scaled_size.width() > device_size.width() or scaled_size.height() > device_size.height():
+            scaled_size.scale(device_size, Qt.AspectRatioMode.KeepAspectRatio)
+
+        if scaled_size != icon.size():
+            pixmap = icon.scaled(scaled_size, Qt.AspectRatioMode.IgnoreAspectRatio,
+                                 Qt.TransformationMode.SmoothTransformation)
+        else:
+            pixmap = QPixmap(icon)
+
+        # Small source icons can not fill the whole ratio
+        if size.width() > 0:
+            device_pixel_ratio = max(1.0, min(device_pixel_ratio, scaled_size.width() / size.width()))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+    @staticmethod
+    def get_pixmap_cache() -> LRUCache:
+        """Get the cache of recolored pixmaps (e.g. to read hit / miss counts or clear it)
+
+        :return: recolored pixmap cache
+        """
+
+        return IconUtils.__pixmap_cache
+
+    @staticmethod
+    def __fill_keep_alpha(device: QPaintDevice, color: QColor):
+        """Replace the rgb values of every pixel with the rgb values
+        of a color and keep the alpha the same (in a single native pass)
+
+        :param device: image or pixmap to recolor in place
+        :param color: new color
+        """
+
+        # QPainter can not paint on a null image or pixmap
+        if device.width() == 0 or device.height() == 0:
+            return
+
+        painter = QPainter(device)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        painter.fillRect(0, 0, device.width(), device.height(),
+                         QColor(color.red(), color.green(), color.blue()))
+        painter.end()
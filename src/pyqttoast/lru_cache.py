@@ -0,0 +1,94 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+
+    def __init__(self, maximum_size: int = 128):
+        """Create a new LRUCache instance
+
+        :param maximum_size: maximum amount of entries before the least recently used one is evicted
+        """
+
+        self.__entries = OrderedDict()
+        self.__maximum_size = maximum_size
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        return key in self.__entries
+
+    def get(self, key, default=None):
+        """Get the value of an entry and mark it as recently used
+
+        :param key: key of the entry
+        :param default: value returned if there is no entry for the key
+        :return: cached value or default
+        """
+
+        if key in self.__entries:
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+            return self.__entries[key]
+
+        self.__misses += 1
+        return default
+
+    def put(self, key, value):
+        """Add or replace an entry and evict the least recently used ones if full
+
+        :param key: key of the entry
+        :param value: value to cache
+        """
+
+        self.__entries[key] = value
+        self.__entries.move_to_end(key)
+        self.__evict()
+
+    def clear(self):
+        """Remove all entries and reset the hit and miss counters"""
+
+        self.__entries.clear()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get_hits(self) -> int:
+        """Get the amount of lookups that found an entry
+
+        :return: hit count
+        """
+
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """Get the amount of lookups that did not find an entry
+
+        :return: miss count
+        """
+
+        return self.__misses
+
+    def get_maximum_size(self) -> int:
+        """Get the maximum amount of entries
+
+        :return: maximum size
+        """
+
+        return self.__maximum_size
+
+    def set_maximum_size(self, maximum_size: int):
+        """Set the maximum amount of entries (evicts entries if necessary)
+
+        :param maximum_size: new maximum size
+        """
+
+        self.__maximum_size = maximum_size
+        self.__evict()
+
+    def __evict(self):
+        """Evict the least recently used entries until the size limit is met"""
+
+        while len(self.__entries) > max(self.__maximum_size, 0):
+            self.__entries.popitem(last=False)
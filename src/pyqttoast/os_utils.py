@@ -3,11 +3,15 @@ import os
 
 class OSUtils:
 
+    __current_directory = None
+
     @staticmethod
     def get_current_directory():
-        """Get the current directory path
+        """Get the current directory path (resolved only once)
 
         :return: directory path
         """
 
-        return os.path.dirname(os.path.realpath(__file__))
+        if OSUtils.__current_directory is None:
+            OSUtils.__current_directory = os.path.dirname(os.path.realpath(__file__))
+        return OSUtils.__current_directory
@@ -0,0 +1,114 @@
+import os
+from .os_utils import OSUtils
+
+
+# Bundled files that can be compiled into a resource module
+RESOURCE_FILES = [
+    'css/drop_shadow.css',
+    'css/toast.css',
+    'icons/close.png',
+    'icons/error.png',
+    'icons/information.png',
+    'icons/success.png',
+    'icons/warning.png'
+]
+
+
+class ResourceUtils:
+
+    __compiled_resources = None
+    __compiled_resources_loaded = False
+    __stylesheets = {}
+
+    @staticmethod
+    def read_binary(path: str) -> bytes:
+        """Read a bundled resource, preferring the compiled resource module
+        (if available) over the file system
+
+        :param path: path of the resource relative to the package directory
+        :return: content of the resource
+        """
+
+        compiled_resources = ResourceUtils.__get_compiled_resources()
+        if compiled_resources is not None and path in compiled_resources:
+            return compiled_resources[path]
+
+        with open(os.path.join(OSUtils.get_current_directory(), path), 'rb') as file:
+            return file.read()
+
+    @staticmethod
+    def read_text(path: str) -> str:
+        """Read a bundled text resource (e.g. a stylesheet)
+
+        :param path: path of the resource relative to the package directory
+        :return: content of the resource
+        """
+
+        return ResourceUtils.read_binary(path).decode('utf-8')
+
+    @staticmethod
+    def get_stylesheet(path: str) -> str:
+        """Get a bundled stylesheet (only read once per process)
+
+        :param path: path of the stylesheet relative to the package directory
+        :return: stylesheet
+        """
+
+        stylesheet = ResourceUtils.__stylesheets.get(path)
+        if stylesheet is None:
+            stylesheet = ResourceUtils.read_text(path)
+            ResourceUtils.__stylesheets[path] = stylesheet
+        return stylesheet
+
+    @staticmethod
+    def clear_stylesheet_cache():
+        """Clear the cached stylesheets so that they are read again
+        the next time they are needed (e.g. after changing the theme files)"""
+
+        ResourceUtils.__stylesheets.clear()
+
+    @staticmethod
+    def compile_resources(output_path: str = None) -> str:
+        """Embed all bundled files into an importable python module, so that
+        the icons and stylesheets can be loaded without any file system access
+        (e.g. for frozen applications or zipapps)
+
+        :param output_path: path of the generated module
+            (defaults to compiled_resources.py inside the package directory)
+        :return: path of the generated module
+        """
+
+        if output_path is None:
+            output_path = os.path.join(OSUtils.get_current_directory(), 'compiled_resources.py')
+
+        lines = ['# Generated by ResourceUtils.compile_resources(), do not edit\n',
+                 '\n',
+                 'RESOURCES = {\n']
+        for path in RESOURCE_FILES:
+            with open(os.path.join(OSUtils.get_current_directory(), path), 'rb') as file:
+                lines.append('    {!r}: {!r},\n'.format(path, file.read()))
+        lines.append('}\n')
+
+        with open(output_path, 'w') as file:
+            file.writelines(lines)
+
+        # Use the new module the next time a resource is read
+        ResourceUtils.__compiled_resources_loaded = False
+        ResourceUtils.clear_stylesheet_cache()
+        return output_path
+
+    @staticmethod
+    def __get_compiled_resources() -> dict | None:
+        """Get the resources of the compiled resource module
+
+        :return: dict mapping relative paths to content or None if not compiled
+        """
+
+        if not ResourceUtils.__compiled_resources_loaded:
+            ResourceUtils.__compiled_resources_loaded = True
+            try:
+                from . import compiled_resources
+                ResourceUtils.__compiled_resources = compiled_resources.RESOURCES
+            except ImportError:
+                ResourceUtils.__compiled_resources = None
+        return ResourceUtils.__compiled_resources
@@ -0,0 +1,60 @@
+from qtpy.QtCore import Qt, QRect
+from qtpy.QtGui import QFont, QFontMetrics
+from .lru_cache import LRUCache
+from .constants import TEXT_METRICS_CACHE_SIZE
+
+
+class TextMetricsUtils:
+
+    # Text measurements shared by all toasts
+    __metrics_cache = LRUCache(TEXT_METRICS_CACHE_SIZE)
+
+    @staticmethod
+    def get_text_width(font: QFont, text: str) -> int:
+        """Get the horizontal advance of a single line of text (cached)
+
+        :param font: font of the text
+        :param text: text to measure
+        :return: width in pixels
+        """
+
+        key = (font.key(), text)
+        width = TextMetricsUtils.__metrics_cache.get(key)
+
+        if width is None:
+            width = QFontMetrics(font).width(text)
+            TextMetricsUtils.__metrics_cache.put(key, width)
+        return width
+
+    @staticmethod
+    def get_text_size(font: QFont, text: str, wrap_width: int = None) -> tuple[int, int]:
+        """Get the size of the bounding rect of a text (cached)
+
+        :param font: font of the text
+        :param text: text to measure
+        :param wrap_width: width to word wrap the text at (None for a single line)
+        :return: width and height in pixels
+        """
+
+        key = (font.key(), text, wrap_width)
+        size = TextMetricsUtils.__metrics_cache.get(key)
+
+        if size is None:
+            if wrap_width is None:
+                rect = QFontMetrics(font).boundingRect(text)
+            else:
+                rect = QFontMetrics(font).boundingRect(QRect(0, 0, wrap_width, 0),
+                                                       Qt.TextFlag.TextWordWrap, text)
+            size = (rect.width(), rect.height())
+            TextMetricsUtils.__metrics_cache.put(key, size)
+        return size
+
+    @staticmethod
+    def get_metrics_cache() -> LRUCache:
+        """Get the cache of text measurements (e.g. to read hit / miss counts,
+        change the maximum size, or clear it)
+
+        :return: text metrics cache
+        """
+
+        return TextMetricsUtils.__metrics_cache
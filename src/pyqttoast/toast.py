@@ -1,12 +1,20 @@
 import math
+import time
+from contextlib import contextmanager
 from qtpy.QtGui import QGuiApplication, QScreen
-from qtpy.QtCore import Qt, QPropertyAnimation, QPoint, QTimer, QSize, QMargins, QRect, Signal
-from qtpy.QtGui import QPixmap, QIcon, QFont, QFontMetrics
+from qtpy.QtCore import (Qt, QPropertyAnimation, QPoint, QTimer, QSize, QMargins, QRect,
+                         QElapsedTimer, Signal)
+from qtpy.QtGui import QPixmap, QIcon, QFont, QColor, QPainter
 from qtpy.QtWidgets import QDialog, QPushButton, QLabel, QGraphicsOpacityEffect, QWidget
-from .toast_enums import ToastPreset, ToastIcon, ToastPosition, ToastButtonAlignment
-from .os_utils import OSUtils
+from .toast_enums import (ToastPreset, ToastIcon, ToastPosition, ToastButtonAlignment,
+                          ToastQueueOverflowPolicy, ToastRenderMode)
+from .resource_utils import ResourceUtils
 from .icon_utils import IconUtils
+from .toast_layout import ToastLayoutSpec, ToastGeometry, compute_toast_layout
 from .drop_shadow import DropShadow
+from .toast_queue import ToastQueue
+from .toast_spec import ToastSpec
+from .toast_rate_limiter import ToastRateLimiter, _ALL_CATEGORIES
 from .constants import *
 
 
@@ -22,13 +30,52 @@ class Toast(QDialog):
     __always_on_main_screen = False
     __fixed_screen = None
     __position = ToastPosition.BOTTOM_RIGHT
+    __duration_bar_maximum_update_rate = DURATION_BAR_MAXIMUM_UPDATE_RATE
+    __paused = False
+    __pause_when_inactive = False
+    __application_inactive = False
+    __application_state_connected = False
+    __maximum_queued = 0
+    __queue_overflow_policy = ToastQueueOverflowPolicy.DROP_OLDEST
+    __dropped_count = 0
+    __rejected_count = 0
+    __expired_count = 0
+    __pooling_enabled = False
+    __deduplication_enabled = False
+    __restart_duration_on_duplicate = False
+    __preemption_enabled = False
+    __batch_depth = 0
+    __batch_layout_pending = False
+    __precompute_count = PRECOMPUTE_COUNT
+    __precompute_scheduled = False
+    __render_mode = ToastRenderMode.WIDGETS
 
     __currently_shown = []
-    __queue = []
+
+    # Vertical offset of every shown toast inside the stack (prefix sums of the heights)
+    __stack_offsets = []
+    __stack_indices = {}
+    __stack_offsets_valid = True
+    __queue = ToastQueue()
+    __pool = []
+    __deduplication_index = {}
+    __rate_limiter = ToastRateLimiter()
+
+    # Timers shared by all toasts (created when first needed)
+    __duration_timer = None
+    __duration_bar_timer = None
 
     # Close event
     closed = Signal()
 
+    # Dropped event (toast was removed from the queue without being shown
+    # because the queue was full or its queue time to live expired)
+    dropped = Signal()
+
+    # Rejected event (toast was neither shown nor queued because the queue was
+    # full and the overflow policy is BLOCK, so it can be shown again later)
+    rejected = Signal()
+
     def __init__(self, parent: QWidget = None):
         """Create a new Toast instance
 
@@ -38,60 +85,58 @@ class Toast(QDialog):
         super(Toast, self).__init__(parent)
 
         # Init attributes
-        self.__duration = 5000
-        self.__show_duration_bar = True
-        self.__title = ''
-        self.__text = ''
-        self.__icon = IconUtils.get_icon_from_enum(ToastIcon.INFORMATION)
-        self.__show_icon = False
-        self.__icon_size = QSize(18, 18)
-        self.__show_icon_separator = True
-        self.__icon_separator_width = 2
-        self.__close_button_icon = IconUtils.get_icon_from_enum(ToastIcon.CLOSE)
-        self.__show_close_button = True
-        self.__close_button_icon_size = QSize(10, 10)
-        self.__close_button_size = QSize(24, 24)
-        self.__close_button_alignment = ToastButtonAlignment.TOP
-        self.__fade_in_duration = 250
-        self.__fade_out_duration = 250
-        self.__reset_duration_on_hover = True
-        self.__stay_on_top = True
-        self.__border_radius = 0
-        self.__background_color = DEFAULT_BACKGROUND_COLOR
-        self.__title_color = DEFAULT_TITLE_COLOR
-        self.__text_color = DEFAULT_TEXT_COLOR
-        self.__icon_color = DEFAULT_ACCENT_COLOR
-        self.__icon_separator_color = DEFAULT_ICON_SEPARATOR_COLOR
-        self.__close_button_icon_color = DEFAULT_CLOSE_BUTTON_ICON_COLOR
-        self.__duration_bar_color = DEFAULT_ACCENT_COLOR
-        self.__title_font = QFont('Arial', 9, QFont.Weight.Bold)
-        self.__text_font = QFont('Arial', 9)
-        self.__margins = QMargins(20, 18, 10, 18)
-        self.__icon_margins = QMargins(0, 0, 15, 0)
-        self.__icon_section_margins = QMargins(0, 0, 15, 0)
-        self.__text_section_margins = QMargins(0, 0, 15, 0)
-        self.__close_button_margins = QMargins(0, -8, 0, -8)
-        self.__text_section_spacing = 8
-
-        self.__elapsed_time = 0
-        self.__fading_out = False
-        self.__used = False
+        self.__init_attributes()
 
         # Window settings
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
 
+        # Opacity effect for fading animations
+        self.__opacity_effect = QGraphicsOpacityEffect()
+        self.__opacity_effect.setOpacity(1)
+        self.setGraphicsEffect(self.__opacity_effect)
+
+        # Animations (created once and parented to the toast so they are deleted with it)
+        self.pos_animation = QPropertyAnimation(self, b"pos", self)
+        self.fade_in_animation = QPropertyAnimation(self.__opacity_effect, b"opacity", self)
+        self.fade_in_animation.setStartValue(0)
+        self.fade_in_animation.setEndValue(1)
+        self.fade_out_animation = QPropertyAnimation(self.__opacity_effect, b"opacity", self)
+        self.fade_out_animation.setStartValue(1)
+        self.fade_out_animation.setEndValue(0)
+        self.fade_out_animation.finished.connect(self.__hide)
+
+        # Render mode is fixed for the lifetime of the toast
+        self.__painted = Toast.__render_mode == ToastRenderMode.PAINTED
+        self.__geometry = None
+        self.__static_pixmap = None
+        self.__duration_bar_chunk_width = 0
+        self.__icon_pixmap = None
+        self.__close_button_pixmap = None
+        self.__close_button_pressed = False
+
+        if self.__painted:
+            # Everything is drawn in paintEvent and the close button is hit-tested in the mouse events
+            self.setMouseTracking(True)
+        else:
+            self.__init_widgets()
+
+        # Set defaults
+        self.__apply_defaults()
+
+        # Install event filter on widget if position relative to widget and moving with widget
+        if Toast.__position_relative_to_widget and Toast.__move_position_with_widget:
+            self.__install_widget_event_filter()
+
+    def __init_widgets(self):
+        """Create the child widgets of a toast that is not painted"""
+
         # Toast widget (QLabel because QWidget has weird behaviour with stylesheets)
         self.__toast_widget = QLabel(self)
 
         # Drop shadow
         self.__drop_shadow = DropShadow(self)
 
-        # Opacity effect for fading animations
-        self.__opacity_effect = QGraphicsOpacityEffect()
-        self.__opacity_effect.setOpacity(1)
-        self.setGraphicsEffect(self.__opacity_effect)
-
         # Close button
         self.__close_button = QPushButton(self.__toast_widget)
         self.__close_button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -113,7 +158,7 @@ class Toast(QDialog):
 
         # Duration bar container (used to make border radius possible on 4 px high widget)
         self.__duration_bar_container = QWidget(self.__toast_widget)
-        self.__duration_bar_container.setFixedHeight(4)
+        self.__duration_bar_container.setFixedHeight(DURATION_BAR_HEIGHT)
         self.__duration_bar_container.setStyleSheet('background: transparent;')
 
         # Duration bar
@@ -126,7 +171,75 @@ class Toast(QDialog):
         self.__duration_bar_chunk.setFixedHeight(20)
         self.__duration_bar_chunk.move(0, -16)
 
-        # Set defaults
+        # Inputs of the stylesheets currently set on the child widgets
+        self.__stylesheet_key = None
+
+        # Apply stylesheet
+        self.setStyleSheet(ResourceUtils.get_stylesheet('css/toast.css'))
+
+    def __init_attributes(self):
+        """Set all attributes to their default values"""
+
+        self.__duration = 5000
+        self.__show_duration_bar = True
+        self.__title = ''
+        self.__text = ''
+        self.__icon = IconUtils.get_icon_from_enum(ToastIcon.INFORMATION)
+        self.__show_icon = False
+        self.__icon_size = QSize(18, 18)
+        self.__show_icon_separator = True
+        self.__icon_separator_width = 2
+        self.__close_button_icon = IconUtils.get_icon_from_enum(ToastIcon.CLOSE)
+        self.__show_close_button = True
+        self.__close_button_icon_size = QSize(10, 10)
+        self.__close_button_size = QSize(24, 24)
+        self.__close_button_alignment = ToastButtonAlignment.TOP
+        self.__fade_in_duration = 250
+        self.__fade_out_duration = 250
+        self.__reset_duration_on_hover = True
+        self.__pause_duration_on_hover = False
+        self.__stay_on_top = True
+        self.__border_radius = 0
+        self.__background_color = DEFAULT_BACKGROUND_COLOR
+        self.__title_color = DEFAULT_TITLE_COLOR
+        self.__text_color = DEFAULT_TEXT_COLOR
+        self.__icon_color = DEFAULT_ACCENT_COLOR
+        self.__icon_separator_color = DEFAULT_ICON_SEPARATOR_COLOR
+        self.__close_button_icon_color = DEFAULT_CLOSE_BUTTON_ICON_COLOR
+        self.__duration_bar_color = DEFAULT_ACCENT_COLOR
+        self.__title_font = QFont('Arial', 9, QFont.Weight.Bold)
+        self.__text_font = QFont('Arial', 9)
+        self.__margins = QMargins(20, 18, 10, 18)
+        self.__icon_margins = QMargins(0, 0, 15, 0)
+        self.__icon_section_margins = QMargins(0, 0, 15, 0)
+        self.__text_section_margins = QMargins(0, 0, 15, 0)
+        self.__close_button_margins = QMargins(0, -8, 0, -8)
+        self.__text_section_spacing = 8
+
+        self.__elapsed_timer = QElapsedTimer()
+        self.__elapsed_time_before_pause = 0
+        self.__countdown_started = False
+        self.__countdown_active = False
+        self.__paused_by_hover = False
+        self.__fading_out = False
+        self.__used = False
+        self.__poolable = False
+        self.__auto_delete = self.parent() is None
+        self.__preset = None
+        self.__deduplication_key = None
+        self.__duplicate_count = 1
+        self.__rate_limit_category = None
+        self.__rate_limit_passed = False
+        self.__priority = 0
+        self.__queue_time_to_live = 0
+        self.__queue_deadline = None
+        self.__precomputed_layout = None
+        self.__title_label_text = ''
+        self.__text_label_text = ''
+
+    def __apply_defaults(self):
+        """Apply the default attribute values to the child widgets"""
+
         self.setIcon(self.__icon)
         self.setIconSize(self.__icon_size)
         self.setIconColor(self.__icon_color)
@@ -146,22 +259,6 @@ class Toast(QDialog):
         self.setTitleFont(self.__title_font)
         self.setTextFont(self.__text_font)
 
-        # Timer for hiding the notification after set duration
-        self.__duration_timer = QTimer(self)
-        self.__duration_timer.setSingleShot(True)
-        self.__duration_timer.timeout.connect(self.hide)
-
-        # Timer for updating the duration bar
-        self.__duration_bar_timer = QTimer(self)
-        self.__duration_bar_timer.timeout.connect(self.__update_duration_bar)
-
-        # Apply stylesheet
-        self.setStyleSheet(open(OSUtils.get_current_directory() + '/css/toast.css').read())
-
-        # Install event filter on widget if position relative to widget and moving with widget
-        if Toast.__position_relative_to_widget and Toast.__move_position_with_widget:
-            self.__install_widget_event_filter()
-
     def eventFilter(self, watched, event):
         # Event is on widget, position is set to be relative to widget and moving with widget
         if (Toast.__position_relative_to_widget and watched == Toast.__position_relative_to_widget
@@ -174,35 +271,205 @@ class Toast(QDialog):
 
     def enterEvent(self, event):
         """Event that happens every time the mouse enters this widget.
-        If reset_duration_on_hover is enabled, reset the countdown
+        If reset_duration_on_hover is enabled, reset the countdown,
+        else if pause_duration_on_hover is enabled, pause the countdown
 
         :param event: the event sent by PyQt
         """
 
+        if self.__duration == 0 or not self.__countdown_started:
+            return
+
         # Reset timer if hovered and resetting is enabled
-        if self.__duration != 0 and self.__duration_timer.isActive() and self.__reset_duration_on_hover:
-            self.__duration_timer.stop()
+        if self.__reset_duration_on_hover:
+            self.__stop_countdown()
 
             # Reset duration bar if enabled
             if self.__show_duration_bar:
-                self.__duration_bar_timer.stop()
-                self.__duration_bar_chunk.setFixedWidth(self.width())
-                self.__elapsed_time = 0
+                self.__set_duration_bar_chunk_width(self.width())
+
+        # Pause timer if hovered and pausing is enabled
+        elif self.__pause_duration_on_hover:
+            self.__paused_by_hover = True
+            self.__pause_countdown()
 
     def leaveEvent(self, event):
         """Event that happens every time the mouse leaves this widget.
-        If reset_duration_on_hover is enabled, restart the countdown
+        If reset_duration_on_hover is enabled, restart the countdown,
+        else if the countdown was paused on hover, resume it
 
         :param event: the event sent by PyQt
         """
 
         # Start timer again when leaving notification and reset is enabled
-        if self.__duration != 0 and not self.__duration_timer.isActive() and self.__reset_duration_on_hover:
-            self.__duration_timer.start(self.__duration)
+        if (self.__duration != 0 and not self.__countdown_started and not self.__fading_out
+                and self.__reset_duration_on_hover and self in Toast.__currently_shown):
+            self.__start_countdown()
 
-            # Restart duration bar animation if enabled
-            if self.__show_duration_bar:
-                self.__duration_bar_timer.start(DURATION_BAR_UPDATE_INTERVAL)
+        # Resume timer if it was paused on hover
+        elif self.__paused_by_hover:
+            self.__paused_by_hover = False
+            self.__resume_countdown()
+
+    def paintEvent(self, event):
+        """Event that happens every time the toast is repainted.
+        If the toast is painted, draw the cached static content and the duration bar,
+        else let the child widgets draw themselves
+
+        :param event: the event sent by PyQt
+        """
+
+        if not self.__painted or self.__geometry is None:
+            super().paintEvent(event)
+            return
+
+        # Everything except the duration bar only changes when the layout changes
+        if self.__static_pixmap is None:
+            self.__static_pixmap = self.__render_static_content()
+
+        geometry = self.__geometry
+        offset = geometry.toast_widget_rect.topLeft()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self.__static_pixmap)
+
+        # Duration bar (only the bottom of a taller rounded rect is visible)
+        if geometry.duration_bar_rect is not None:
+            bar_rect = geometry.duration_bar_rect.translated(offset)
+            rounded_rect = QRect(bar_rect.x(), bar_rect.bottom() - 19, bar_rect.width(), 20)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setClipRect(bar_rect)
+
+            bar_color = QColor(self.__duration_bar_color)
+            bar_color.setAlpha(100)
+            painter.setBrush(bar_color)
+            painter.drawRoundedRect(rounded_rect, self.__border_radius, self.__border_radius)
+
+            chunk_width = min(self.__duration_bar_chunk_width, bar_rect.width())
+            if chunk_width > 0:
+                chunk_rect = QRect(rounded_rect.x(), rounded_rect.y(), chunk_width, rounded_rect.height())
+                painter.setBrush(self.__duration_bar_color)
+                painter.drawRoundedRect(chunk_rect, self.__border_radius, self.__border_radius)
+
+                # The right end of the chunk is only rounded if the toast has no duration
+                if self.__duration != 0 and chunk_width < bar_rect.width():
+                    corner_width = min(self.__border_radius, chunk_width)
+                    painter.fillRect(QRect(chunk_rect.right() - corner_width + 1, chunk_rect.y(),
+                                           corner_width, chunk_rect.height()), self.__duration_bar_color)
+
+        painter.end()
+
+    def __render_static_content(self) -> QPixmap:
+        """Draw the drop shadow, background, icon, title, text, and close button of a painted toast
+
+        :return: pixmap with the size of the toast
+        """
+
+        device_pixel_ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * device_pixel_ratio)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        geometry = self.__geometry
+        toast_rect = geometry.toast_widget_rect
+        offset = toast_rect.topLeft()
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        # Drop shadow (five layers that get darker towards the toast)
+        for i, alpha in enumerate(DROP_SHADOW_ALPHAS):
+            painter.setBrush(QColor(0, 0, 0, alpha))
+            painter.drawRoundedRect(self.rect().adjusted(i, i, -i, -i),
+                                    DROP_SHADOW_BORDER_RADIUS, DROP_SHADOW_BORDER_RADIUS)
+
+        # Background
+        painter.setBrush(self.__background_color)
+        painter.drawRoundedRect(toast_rect, self.__border_radius, self.__border_radius)
+
+        # Icon and icon separator
+        if geometry.icon_position is not None:
+            painter.drawPixmap(QRect(geometry.icon_position + offset, self.__icon_size),
+                               self.__icon_pixmap)
+            if geometry.icon_separator_rect.width() > 0:
+                painter.fillRect(geometry.icon_separator_rect.translated(offset),
+                                 self.__icon_separator_color)
+
+        # Title and text
+        flags = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        if geometry.word_wrap:
+            flags |= Qt.TextFlag.TextWordWrap
+
+        for text, font, color, rect in ((self.__title_label_text, self.__title_font,
+                                         self.__title_color, geometry.title_rect),
+                                        (self.__text_label_text, self.__text_font,
+                                         self.__text_color, geometry.text_rect)):
+            if text != '':
+                painter.setFont(font)
+                painter.setPen(color)
+                painter.drawText(rect.translated(offset), int(flags), text)
+
+        # Close button icon (centered inside the close button)
+        if self.__show_close_button:
+            icon_rect = QRect(QPoint(0, 0), self.__close_button_icon_size)
+            icon_rect.moveCenter(self.__get_close_button_rect().center())
+            painter.drawPixmap(icon_rect, self.__close_button_pixmap)
+
+        painter.end()
+        return pixmap
+
+    def mousePressEvent(self, event):
+        """Event that happens every time a mouse button is pressed on this widget.
+        If the toast is painted, remember whether the close button was pressed
+
+        :param event: the event sent by PyQt
+        """
+
+        if self.__painted and event.button() == Qt.MouseButton.LeftButton:
+            self.__close_button_pressed = self.__get_close_button_rect().contains(event.pos())
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """Event that happens every time a mouse button is released on this widget.
+        If the toast is painted and the close button was clicked, hide the toast
+
+        :param event: the event sent by PyQt
+        """
+
+        if self.__painted and event.button() == Qt.MouseButton.LeftButton:
+            clicked = self.__close_button_pressed and self.__get_close_button_rect().contains(event.pos())
+            self.__close_button_pressed = False
+            if clicked:
+                self.hide()
+                return
+        super().mouseReleaseEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """Event that happens every time the mouse moves over this widget.
+        If the toast is painted, show a pointing hand cursor over the close button
+
+        :param event: the event sent by PyQt
+        """
+
+        if self.__painted:
+            if self.__get_close_button_rect().contains(event.pos()):
+                self.setCursor(Qt.CursorShape.PointingHandCursor)
+            else:
+                self.unsetCursor()
+        super().mouseMoveEvent(event)
+
+    def __get_close_button_rect(self) -> QRect:
+        """Get the area of the close button of a painted toast
+
+        :return: rect in toast coordinates (empty if there is no close button)
+        """
+
+        if self.__geometry is None or not self.__show_close_button:
+            return QRect()
+        return QRect(self.__geometry.close_button_position + self.__geometry.toast_widget_rect.topLeft(),
+                     self.__close_button_size)
 
     def show(self):
         """Show the toast notification"""
@@ -211,21 +478,45 @@ class Toast(QDialog):
         if self.__used:
             return
 
+        # Count as duplicate of an identical visible or queued toast instead
+        if Toast.__deduplication_enabled and Toast.__coalesce_duplicate(self):
+            self.__used = True
+            if self.__auto_delete or self.__poolable:
+                self.deleteLater()
+            return
+
+        # Reject the toast before it is indexed or takes a rate limit token
+        # if it can neither be shown nor queued
+        if Toast.__is_queue_blocked():
+            Toast.__reject(self)
+            return
+
+        if Toast.__deduplication_enabled:
+            Toast.__deduplication_index[Toast.__get_deduplication_key(self)] = self
+
+        # Suppress the toast if its category exceeds the rate limit
+        # (only checked once, not again when it is shown from the queue)
+        if not self.__rate_limit_passed:
+            if not Toast.__rate_limiter.acquire(Toast.__get_rate_limit_category(self)):
+                Toast.__forget_duplicate(self)
+                self.__used = True
+                if self.__auto_delete or self.__poolable:
+                    self.deleteLater()
+                return
+            self.__rate_limit_passed = True
+
         # If max notifications on screen not reached, show notification
         if Toast.__maximum_on_screen > len(Toast.__currently_shown):
             self.__used = True
             Toast.__currently_shown.append(self)
+            Toast.__append_stack_offset(self)
 
             # Setup UI
             self.__setup_ui()
 
-            # Start duration timer
+            # Start countdown (also updates the duration bar if enabled)
             if self.__duration != 0:
-                self.__duration_timer.start(self.__duration)
-
-            # Start duration bar update timer
-            if self.__duration != 0 and self.__show_duration_bar:
-                self.__duration_bar_timer.start(DURATION_BAR_UPDATE_INTERVAL)
+                self.__start_countdown()
 
             # Calculate position and show (animate position too if not first notification)
             x, y = self.__calculate_position()
@@ -233,7 +524,7 @@ class Toast(QDialog):
             # If not first toast on screen, also do a fade down/up animation
             if len(Toast.__currently_shown) > 1:
                 # Calculate offset if predecessor toast is still in fade down / up animation
-                predecessor_toast = Toast.__currently_shown[Toast.__currently_shown.index(self) - 1]
+                predecessor_toast = Toast.__currently_shown[-2]
                 predecessor_target_x, predecessor_target_y = predecessor_toast.__calculate_position()
                 predecessor_target_difference_y = abs(predecessor_toast.y() - predecessor_target_y)
 
@@ -250,45 +541,45 @@ class Toast(QDialog):
                     self.move(x, y + int(self.height() / 1.5) + predecessor_target_difference_y)
 
                 # Start fade down / up animation
-                self.pos_animation = QPropertyAnimation(self, b"pos")
-                self.pos_animation.setEndValue(QPoint(x, y))
-                self.pos_animation.setDuration(self.__fade_in_duration)
-                self.pos_animation.start()
+                self.__animate_position(QPoint(x, y), self.__fade_in_duration)
             else:
                 self.move(x, y)
 
             # Fade in
             super().show()
-            self.fade_in_animation = QPropertyAnimation(self.__opacity_effect, b"opacity")
+            self.fade_in_animation.stop()
             self.fade_in_animation.setDuration(self.__fade_in_duration)
-            self.fade_in_animation.setStartValue(0)
-            self.fade_in_animation.setEndValue(1)
             self.fade_in_animation.start()
 
-            # Update every other currently shown notification
-            for toast in Toast.__currently_shown:
-                toast.__update_position_xy()
+            # Update every other currently shown notification (once at the end of a batch)
+            if Toast.__batch_depth > 0:
+                Toast.__batch_layout_pending = True
+            else:
+                Toast.__update_currently_showing_position_xy()
         else:
             # Add notification to queue instead
-            Toast.__queue.append(self)
+            Toast.__enqueue(self)
 
     def hide(self):
-        """Start hiding process of the toast notification"""
+        """Start hiding process of the toast notification
+        (or remove it from the queue if it has not been shown yet)"""
+
+        # A toast hidden from the queue is discarded like a dropped toast, but counts as closed
+        if Toast.__queue.remove(self):
+            Toast.__discard(self, closed=True)
+            return
 
         if not self.__fading_out:
             self.__fading_out = True
             if self.__duration != 0:
-                self.__duration_timer.stop()
+                self.__stop_countdown()
             self.__fade_out()
 
     def __fade_out(self):
         """Start the fade out animation"""
 
-        self.fade_out_animation = QPropertyAnimation(self.__opacity_effect, b"opacity")
+        self.fade_out_animation.stop()
         self.fade_out_animation.setDuration(self.__fade_out_duration)
-        self.fade_out_animation.setStartValue(1)
-        self.fade_out_animation.setEndValue(0)
-        self.fade_out_animation.finished.connect(self.__hide)
         self.fade_out_animation.start()
 
     def __hide(self):
@@ -298,7 +589,8 @@ class Toast(QDialog):
 
         if self in Toast.__currently_shown:
             Toast.__currently_shown.remove(self)
-            self.__elapsed_time = 0
+            Toast.__stack_offsets_valid = False
+            Toast.__forget_duplicate(self)
             self.__fading_out = False
 
             # Emit signal
@@ -309,24 +601,167 @@ class Toast(QDialog):
                 toast.__update_position_y()
 
             # Show next item from queue after updating
-            timer = QTimer(self)
-            timer.setSingleShot(True)
-            timer.timeout.connect(Toast.__show_next_in_queue)
-            timer.start(self.__fade_in_duration)
+            # (not parented to the toast, since the toast may be deleted before)
+            QTimer.singleShot(self.__fade_in_duration, Toast.__show_next_in_queue)
+
+            # Keep toast for reuse if it was taken from the pool, else free it if enabled
+            if (self.__poolable and Toast.__pooling_enabled
+                    and len(Toast.__pool) < Toast.__maximum_on_screen):
+                Toast.__pool.append(self)
+            elif self.__auto_delete or self.__poolable:
+                self.deleteLater()
+
+    def __reset_for_reuse(self, parent: QWidget | None):
+        """Reset a closed toast to the state of a newly created one
+
+        :param parent: the new parent widget
+        """
+
+        if self.parent() is not parent:
+            self.setParent(parent)
+
+        # Disconnect receivers of the previous use
+        for signal in (self.closed, self.dropped):
+            try:
+                signal.disconnect()
+            except (TypeError, RuntimeError):
+                pass
+
+        self.__init_attributes()
+        self.__apply_defaults()
+
+        # Undo the changes made while showing
+        self.pos_animation.stop()
+        self.fade_in_animation.stop()
+        self.fade_out_animation.stop()
+        self.__opacity_effect.setOpacity(1)
+        self.setMinimumSize(0, 0)
+        self.setMaximumSize(MAXIMUM_WIDGET_SIZE, MAXIMUM_WIDGET_SIZE)
+        self.__geometry = None
+        self.__static_pixmap = None
+        self.__close_button_pressed = False
+
+        if not self.__painted:
+            for label in (self.__title_label, self.__text_label):
+                label.setText('')
+                label.setWordWrap(False)
+                label.setMinimumSize(0, 0)
+                label.setMaximumSize(MAXIMUM_WIDGET_SIZE, MAXIMUM_WIDGET_SIZE)
+            self.__icon_widget.setVisible(True)
+            self.__icon_separator.setVisible(True)
+            self.__close_button.setVisible(True)
+
+        if Toast.__position_relative_to_widget and Toast.__move_position_with_widget:
+            self.__install_widget_event_filter()
+
+    def __start_countdown(self):
+        """Start counting down the full duration of the toast
+        (stays paused if the toasts are currently paused)"""
+
+        self.__elapsed_time_before_pause = 0
+        self.__countdown_started = True
+        self.__resume_countdown()
+
+    def __stop_countdown(self):
+        """Stop counting down and discard the elapsed time"""
+
+        self.__elapsed_timer.invalidate()
+        self.__elapsed_time_before_pause = 0
+        self.__countdown_started = False
+        self.__countdown_active = False
+        Toast.__update_shared_timers()
+
+    def __pause_countdown(self):
+        """Pause the countdown while keeping the remaining time"""
+
+        if not self.__countdown_active:
+            return
+
+        self.__elapsed_time_before_pause += self.__elapsed_timer.elapsed()
+        self.__elapsed_timer.invalidate()
+        self.__countdown_active = False
+        Toast.__update_shared_timers()
+
+    def __resume_countdown(self):
+        """Resume a paused countdown unless it should stay paused"""
+
+        if (not self.__countdown_started or self.__countdown_active
+                or self.__paused_by_hover or Toast.__is_paused_globally()):
+            return
+
+        self.__elapsed_timer.start()
+        self.__countdown_active = True
+        Toast.__update_shared_timers()
+
+    def __get_elapsed_time(self) -> int:
+        """Get the time the countdown has been running for (excluding pauses)
+
+        :return: elapsed time in milliseconds
+        """
+
+        if self.__countdown_active:
+            return self.__elapsed_time_before_pause + self.__elapsed_timer.elapsed()
+        return self.__elapsed_time_before_pause
+
+    def __get_remaining_time(self) -> int:
+        """Get the remaining time of the countdown
+
+        :return: remaining time in milliseconds
+        """
+
+        return self.__duration - self.__get_elapsed_time()
 
     def __update_duration_bar(self):
-        """Update the duration bar chunk with the elapsed time"""
+        """Update the duration bar chunk with the elapsed time
+        (measured with a monotonic clock, so skipped ticks do not cause any drift)"""
+
+        elapsed_time = self.__get_elapsed_time()
+
+        if elapsed_time >= self.__duration:
+            return
+
+        bar_width = self.__get_toast_widget_size().width()
+        new_chunk_width = math.floor(bar_width - elapsed_time / self.__duration * bar_width)
+
+        # Only resize (and thereby repaint) if the width in pixels actually changed
+        if new_chunk_width != self.__get_duration_bar_chunk_width():
+            self.__set_duration_bar_chunk_width(new_chunk_width)
+
+    def __get_duration_bar_chunk_width(self) -> int:
+        """Get the width of the remaining part of the duration bar
+
+        :return: width in pixels
+        """
+
+        if self.__painted:
+            return self.__duration_bar_chunk_width
+        return self.__duration_bar_chunk.width()
 
-        self.__elapsed_time += DURATION_BAR_UPDATE_INTERVAL
+    def __set_duration_bar_chunk_width(self, width: int):
+        """Resize the remaining part of the duration bar
+        (painted toasts only repaint the duration bar)
+
+        :param width: new width in pixels
+        """
 
-        if self.__elapsed_time >= self.__duration:
-            self.__duration_bar_timer.stop()
+        if not self.__painted:
+            self.__duration_bar_chunk.setFixedWidth(width)
             return
 
-        new_chunk_width = math.floor(self.__duration_bar_container.width()
-                                     - self.__elapsed_time / self.__duration
-                                     * self.__duration_bar_container.width())
-        self.__duration_bar_chunk.setFixedWidth(new_chunk_width)
+        self.__duration_bar_chunk_width = width
+        if self.__geometry is not None and self.__geometry.duration_bar_rect is not None:
+            self.update(self.__geometry.duration_bar_rect.translated(
+                self.__geometry.toast_widget_rect.topLeft()))
+
+    def __get_toast_widget_size(self) -> QSize:
+        """Get the size of the toast without the drop shadow
+
+        :return: size
+        """
+
+        if self.__painted:
+            return QSize(0, 0) if self.__geometry is None else self.__geometry.toast_widget_rect.size()
+        return self.__toast_widget.size()
 
     def __update_position_xy(self, animate: bool = True):
         """Update the x and y position of the toast with an optional animation
@@ -338,10 +773,7 @@ class Toast(QDialog):
         position = QPoint(x, y)
 
         # Animate position change
-        self.pos_animation = QPropertyAnimation(self, b"pos")
-        self.pos_animation.setEndValue(position)
-        self.pos_animation.setDuration(UPDATE_POSITION_DURATION if animate else 0)
-        self.pos_animation.start()
+        self.__animate_position(position, UPDATE_POSITION_DURATION if animate else 0)
 
     def __update_position_x(self, animate: bool = True):
         """Update the x position of the toast with an optional animation
@@ -353,10 +785,7 @@ class Toast(QDialog):
         position = QPoint(x, self.y())
 
         # Animate position change
-        self.pos_animation = QPropertyAnimation(self, b"pos")
-        self.pos_animation.setEndValue(position)
-        self.pos_animation.setDuration(UPDATE_POSITION_DURATION if animate else 0)
-        self.pos_animation.start()
+        self.__animate_position(position, UPDATE_POSITION_DURATION if animate else 0)
 
     def __update_position_y(self, animate: bool = True):
         """Update the y position of the toast with an optional animation
@@ -368,9 +797,19 @@ class Toast(QDialog):
         position = QPoint(self.x(), y)
 
         # Animate position change
-        self.pos_animation = QPropertyAnimation(self, b"pos")
+        self.__animate_position(position, UPDATE_POSITION_DURATION if animate else 0)
+
+    def __animate_position(self, position: QPoint, duration: int):
+        """Move the toast to a position with an animation
+        (replaces the currently running position animation)
+
+        :param position: target position
+        :param duration: duration of the animation in milliseconds
+        """
+
+        self.pos_animation.stop()
         self.pos_animation.setEndValue(position)
-        self.pos_animation.setDuration(UPDATE_POSITION_DURATION if animate else 0)
+        self.pos_animation.setDuration(duration)
         self.pos_animation.start()
 
     def __get_bounds(self) -> QRect:
@@ -409,35 +848,32 @@ class Toast(QDialog):
         """
 
         # Calculate vertical space taken up by all the currently showing notifications
-        y_offset = 0
-        for toast in Toast.__currently_shown:
-            if toast == self:
-                break
-            y_offset += toast.__toast_widget.height() + Toast.__spacing
+        y_offset = Toast.__get_stack_offset(self)
 
         # Calculate x and y position of notification
         x = 0
         y = 0
         bounds = self.__get_bounds()
+        toast_widget_size = self.__get_toast_widget_size()
 
         if Toast.__position == ToastPosition.BOTTOM_RIGHT:
-            x = (bounds.width() - self.__toast_widget.width()
+            x = (bounds.width() - toast_widget_size.width()
                  - Toast.__offset_x + bounds.x())
-            y = (bounds.height() - self.__toast_widget.height()
+            y = (bounds.height() - toast_widget_size.height()
                  - Toast.__offset_y + bounds.y() - y_offset)
 
         elif Toast.__position == ToastPosition.BOTTOM_LEFT:
             x = bounds.x() + Toast.__offset_x
-            y = (bounds.height() - self.__toast_widget.height()
+            y = (bounds.height() - toast_widget_size.height()
                  - Toast.__offset_y + bounds.y() - y_offset)
 
         elif Toast.__position == ToastPosition.BOTTOM_MIDDLE:
-            x = (bounds.x() + bounds.width() / 2 - self.__toast_widget.width() / 2)
-            y = (bounds.height() - self.__toast_widget.height()
+            x = (bounds.x() + bounds.width() / 2 - toast_widget_size.width() / 2)
+            y = (bounds.height() - toast_widget_size.height()
                  - Toast.__offset_y + bounds.y() - y_offset)
 
         elif Toast.__position == ToastPosition.TOP_RIGHT:
-            x = (bounds.width() - self.__toast_widget.width()
+            x = (bounds.width() - toast_widget_size.width()
                  - Toast.__offset_x + bounds.x())
             y = (bounds.y() + Toast.__offset_y + y_offset)
 
@@ -446,17 +882,17 @@ class Toast(QDialog):
             y = (bounds.y() + Toast.__offset_y + y_offset)
 
         elif Toast.__position == ToastPosition.TOP_MIDDLE:
-            x = (bounds.x() + bounds.width() / 2 - self.__toast_widget.width() / 2)
+            x = (bounds.x() + bounds.width() / 2 - toast_widget_size.width() / 2)
             y = (bounds.y() + Toast.__offset_y + y_offset)
 
         elif Toast.__position == ToastPosition.CENTER:
-            x = (bounds.x() + bounds.width() / 2 - self.__toast_widget.width() / 2)
+            x = (bounds.x() + bounds.width() / 2 - toast_widget_size.width() / 2)
             if y_offset == 0:
                 y = (bounds.y() + bounds.height() / 2
-                     - self.__toast_widget.height() / 2 + y_offset)
+                     - toast_widget_size.height() / 2 + y_offset)
             else:
                 y_start = (bounds.y() + bounds.height() / 2
-                           - self.__currently_shown[0].__toast_widget.height() / 2)
+                           - self.__currently_shown[0].__get_toast_widget_size().height() / 2)
                 y = y_start + y_offset
 
         x = int(x - DROP_SHADOW_SIZE)
@@ -470,320 +906,101 @@ class Toast(QDialog):
         # Update stylesheet
         self.__update_stylesheet()
 
-        # Calculate title and text width and height
-        title_font_metrics = QFontMetrics(self.__title_font)
-        title_width = title_font_metrics.width(self.__title_label.text())
-        title_height = title_font_metrics.boundingRect(self.__title_label.text()).height()
-        text_font_metrics = QFontMetrics(self.__text_font)
-        text_width = text_font_metrics.width(self.__text_label.text())
-        text_height = text_font_metrics.boundingRect(self.__text_label.text()).height()
-        text_section_spacing = self.__text_section_spacing
-        if self.__title == '' or self.__text == '':
-            text_section_spacing = 0
-
-        text_section_height = (self.__text_section_margins.top()
-                               + title_height + text_section_spacing
-                               + text_height + self.__text_section_margins.bottom())
-
-        # Calculate duration bar height
-        duration_bar_height = 0 if not self.__show_duration_bar else self.__duration_bar_container.height()
-
-        # Calculate icon section width and height
-        icon_section_width = 0
-        icon_section_height = 0
-
-        if self.__show_icon:
-            icon_section_width = (self.__icon_section_margins.left()
-                                  + self.__icon_margins.left() + self.__icon_widget.width()
-                                  + self.__icon_margins.right() + self.__icon_separator.width()
-                                  + self.__icon_section_margins.right())
-            icon_section_height = (self.__icon_section_margins.top() + self.__icon_margins.top()
-                                   + self.__icon_widget.height() + self.__icon_margins.bottom()
-                                   + self.__icon_section_margins.bottom())
-
-        # Calculate close button section height
-        close_button_width = self.__close_button.width() if self.__show_close_button else 0
-        close_button_height = self.__close_button.height() if self.__show_close_button else 0
-        close_button_margins = self.__close_button_margins if self.__show_close_button else QMargins(0, 0, 0, 0)
-
-        close_button_section_height = (close_button_margins.top()
-                                       + close_button_height
-                                       + close_button_margins.bottom())
-
-        # Calculate needed width and height
-        width = (self.__margins.left() + icon_section_width + self.__text_section_margins.left()
-                 + max(title_width, text_width) + self.__text_section_margins.right()
-                 + close_button_margins.left() + close_button_width
-                 + close_button_margins.right() + self.__margins.right())
-
-        height = (self.__margins.top()
-                  + max(icon_section_height, text_section_height, close_button_section_height)
-                  + self.__margins.bottom() + duration_bar_height)
-
-        forced_additional_height = 0
-        forced_reduced_height = 0
-
-        # Handle width greater than maximum width
-        if width > self.maximumWidth():
-            # Enable line break for title and text and recalculate size
-            new_title_text_width = max(title_width, text_width) - (width - self.maximumWidth())
-            if new_title_text_width > 0:
-                title_width = new_title_text_width
-                text_width = new_title_text_width
-
-            self.__title_label.setMinimumWidth(title_width)
-            self.__title_label.setWordWrap(True)
-            if self.__title != '':
-                title_height = self.__title_label.sizeHint().height()
-            self.__title_label.setFixedSize(title_width, title_height)
+        # Calculate the whole layout first (unless it was precomputed
+        # while the toast was queued), then apply it in a single step
+        spec = self.__get_layout_spec()
+        if self.__precomputed_layout is not None and self.__precomputed_layout[0] == spec:
+            geometry = self.__precomputed_layout[1]
+        else:
+            geometry = compute_toast_layout(spec)
+        self.__precomputed_layout = None
+        self.__apply_layout(geometry)
 
-            self.__text_label.setMinimumWidth(text_width)
-            self.__text_label.setWordWrap(True)
-            if self.__text != '':
-                text_height = self.__text_label.sizeHint().height()
-            self.__text_label.setFixedSize(text_width, text_height)
+    def __precompute_layout(self):
+        """Apply the stylesheet and calculate the layout of a queued toast ahead of time
+        (the layout is only used if none of its inputs changed until the toast is shown)"""
 
-            # Recalculate width and height
-            width = self.maximumWidth()
+        self.__update_stylesheet()
 
-            text_section_height = (self.__text_section_margins.top()
-                                   + title_height + text_section_spacing
-                                   + text_height + self.__text_section_margins.bottom())
+        spec = self.__get_layout_spec()
+        if self.__precomputed_layout is None or self.__precomputed_layout[0] != spec:
+            self.__precomputed_layout = (spec, compute_toast_layout(spec))
 
-            height = (self.__margins.top()
-                      + max(icon_section_height, text_section_height, close_button_section_height)
-                      + self.__margins.bottom() + duration_bar_height)
+    def __get_layout_spec(self) -> ToastLayoutSpec:
+        """Collect every input of the layout calculation
+        (margins and fonts are copied since their setters change them in place)
 
-        # Handle height less than minimum height
-        if height < self.minimumHeight():
-            # Enable word wrap for title and text labels
-            self.__title_label.setWordWrap(True)
-            self.__text_label.setWordWrap(True)
+        :return: layout spec of the toast
+        """
 
-            # Calculate height with initial label width
-            title_width = (self.__title_label.fontMetrics().boundingRect(
-                QRect(0, 0, 0, 0), Qt.TextFlag.TextWordWrap, self.__title_label.text()).width())
-            text_width = (self.__text_label.fontMetrics().boundingRect(
-                QRect(0, 0, 0, 0), Qt.TextFlag.TextWordWrap, self.__text_label.text()).width())
-            temp_width = max(title_width, text_width)
-
-            title_width = (self.__title_label.fontMetrics().boundingRect(
-                QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__title_label.text()).width())
-            if self.__title != '':
-                title_height = (self.__title_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__title_label.text()).height())
-
-            text_width = (self.__text_label.fontMetrics().boundingRect(
-                QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__text_label.text()).width())
-            if self.__text != '':
-                text_height = (self.__text_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__text_label.text()).height())
-
-            text_section_height = (self.__text_section_margins.top()
-                                   + title_height + text_section_spacing
-                                   + text_height + self.__text_section_margins.bottom())
-
-            height = (self.__margins.top()
-                      + max(icon_section_height, text_section_height, close_button_section_height)
-                      + self.__margins.bottom() + duration_bar_height)
-
-            while temp_width <= width:
-                # Recalculate height with different text widths to find optimal value
-                temp_title_width = (self.__title_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__title_label.text()).width())
-                temp_title_height = (self.__title_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__title_label.text()).height())
-                temp_text_width = (self.__text_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__text_label.text()).width())
-                temp_text_height = (self.__text_label.fontMetrics().boundingRect(
-                    QRect(0, 0, temp_width, 0), Qt.TextFlag.TextWordWrap, self.__text_label.text()).height())
-
-                if self.__title == '':
-                    temp_title_height = 0
-
-                if self.__text == '':
-                    temp_text_height = 0
-
-                temp_text_section_height = (self.__text_section_margins.top()
-                                            + temp_title_height + text_section_spacing
-                                            + temp_text_height + self.__text_section_margins.bottom())
-
-                temp_height = (self.__margins.top()
-                               + max(icon_section_height, temp_text_section_height,
-                                     close_button_section_height)
-                               + self.__margins.bottom() + duration_bar_height)
-
-                # Store values if calculated height is greater than or equal to min height
-                if temp_height >= self.minimumHeight():
-                    title_width = temp_title_width
-                    title_height = temp_title_height
-                    text_width = temp_text_width
-                    text_height = temp_text_height
-                    text_section_height = temp_text_section_height
-                    height = temp_height
-                    temp_width += 1
-
-                # Exit loop if calculated height is less than min height
-                else:
-                    break
+        icon_separator_width = self.__icon_separator_width if self.__show_icon_separator else 0
 
-            # Recalculate width
-            width = (self.__margins.left() + icon_section_width + self.__text_section_margins.left()
-                     + max(title_width, text_width) + self.__text_section_margins.right()
-                     + close_button_margins.left() + close_button_width
-                     + close_button_margins.right() + self.__margins.right())
+        return ToastLayoutSpec(self.__title, self.__text, self.__title_label_text,
+                               self.__text_label_text, QFont(self.__title_font), QFont(self.__text_font),
+                               QMargins(self.__margins), QMargins(self.__text_section_margins),
+                               self.__text_section_spacing, self.__show_icon, QSize(self.__icon_size),
+                               QMargins(self.__icon_margins), QMargins(self.__icon_section_margins),
+                               icon_separator_width, self.__show_close_button,
+                               QSize(self.__close_button_size), QMargins(self.__close_button_margins),
+                               self.__close_button_alignment, self.__show_duration_bar,
+                               DURATION_BAR_HEIGHT, self.minimumWidth(),
+                               self.maximumWidth(), self.minimumHeight(), self.maximumHeight())
 
-            # If min height not met, set height to min height
-            if height < self.minimumHeight():
-                forced_additional_height = self.minimumHeight() - height
-                height = self.minimumHeight()
+    def __apply_layout(self, geometry: ToastGeometry):
+        """Resize and move the toast and all of its child widgets
+        (painted toasts only resize and repaint themselves)
 
-        # Handle width less than minimum width
-        if width < self.minimumWidth():
-            width = self.minimumWidth()
+        :param geometry: geometry calculated by compute_toast_layout
+        """
 
-        # Handle height greater than maximum height
-        if height > self.maximumHeight():
-            forced_reduced_height = height - self.maximumHeight()
-            height = self.maximumHeight()
+        self.__geometry = geometry
+        width = geometry.toast_widget_rect.width()
 
-        # Calculate width and height including space for drop shadow
-        total_width = width + (DROP_SHADOW_SIZE * 2)
-        total_height = height + (DROP_SHADOW_SIZE * 2)
+        if self.__painted:
+            self.__static_pixmap = None
+            super().setFixedSize(geometry.size)
+            self.__duration_bar_chunk_width = width
+            self.update()
+            return
 
         # Resize drop shadow
-        self.__drop_shadow.resize(QSize(total_width, total_height))
+        self.__drop_shadow.resize(geometry.size)
 
         # Resize window
-        super().setFixedSize(total_width, total_height)
-        self.__toast_widget.setFixedSize(width, height)
-        self.__toast_widget.move(DROP_SHADOW_SIZE, DROP_SHADOW_SIZE)
+        super().setFixedSize(geometry.size)
+        self.__toast_widget.setFixedSize(geometry.toast_widget_rect.size())
+        self.__toast_widget.move(geometry.toast_widget_rect.topLeft())
         self.__toast_widget.raise_()
 
-        # Calculate max height of all sections
-        max_section_height = max(icon_section_height, text_section_height, close_button_section_height)
-
-        # Calculate difference between height and height of icon section and text section
-        height_icon_section_height_difference = max_section_height - icon_section_height
-        height_text_section_height_difference = max_section_height - text_section_height
-
-        if self.__show_icon:
-            # Move icon
-            self.__icon_widget.move(self.__margins.left()
-                                    + self.__icon_section_margins.left()
-                                    + self.__icon_margins.left(),
-                                    self.__margins.top()
-                                    + self.__icon_section_margins.top()
-                                    + self.__icon_margins.top()
-                                    + math.ceil(height_icon_section_height_difference / 2)
-                                    + math.ceil(forced_additional_height / 2)
-                                    - math.floor(forced_reduced_height / 2))
-
-            # Move and resize icon separator
-            self.__icon_separator.setFixedHeight(text_section_height)
-            self.__icon_separator.move(self.__margins.left()
-                                       + self.__icon_section_margins.left()
-                                       + self.__icon_margins.left()
-                                       + self.__icon_widget.width()
-                                       + self.__icon_margins.right(),
-                                       self.__margins.top()
-                                       + self.__icon_section_margins.top()
-                                       + math.ceil(height_text_section_height_difference / 2)
-                                       + math.ceil(forced_additional_height / 2)
-                                       - math.floor(forced_reduced_height / 2))
+        if geometry.icon_position is not None:
+            # Move icon and move and resize icon separator
+            self.__icon_widget.move(geometry.icon_position)
+            self.__icon_separator.setFixedHeight(geometry.icon_separator_rect.height())
+            self.__icon_separator.move(geometry.icon_separator_rect.topLeft())
         else:
             # Hide icon section
             self.__icon_widget.setVisible(False)
             self.__icon_separator.setVisible(False)
 
-        # Resize title and text labels
-        self.__title_label.setFixedSize(max(title_width, text_width), title_height)
-        self.__text_label.setFixedSize(max(title_width, text_width), text_height)
-
-        # Move title and text labels
-        if self.__show_icon:
-            self.__title_label.move(self.__margins.left()
-                                    + self.__icon_section_margins.left()
-                                    + self.__icon_margins.left()
-                                    + self.__icon_widget.width()
-                                    + self.__icon_margins.right()
-                                    + self.__icon_separator.width()
-                                    + self.__icon_section_margins.right()
-                                    + self.__text_section_margins.left(),
-                                    self.__margins.top()
-                                    + self.__text_section_margins.top()
-                                    + math.ceil(height_text_section_height_difference / 2)
-                                    + math.ceil(forced_additional_height / 2)
-                                    - math.floor(forced_reduced_height / 2))
-
-            self.__text_label.move(self.__margins.left()
-                                   + self.__icon_section_margins.left()
-                                   + self.__icon_margins.left()
-                                   + self.__icon_widget.width()
-                                   + self.__icon_margins.right()
-                                   + self.__icon_separator.width()
-                                   + self.__icon_section_margins.right()
-                                   + self.__text_section_margins.left(),
-                                   self.__margins.top()
-                                   + self.__text_section_margins.top()
-                                   + title_height + self.__text_section_spacing
-                                   + math.ceil(height_text_section_height_difference / 2)
-                                   + math.ceil(forced_additional_height / 2)
-                                   - math.floor(forced_reduced_height / 2))
-
-        # Position is different if icon hidden
-        else:
-            self.__title_label.move(self.__margins.left()
-                                    + self.__text_section_margins.left(),
-                                    self.__margins.top()
-                                    + self.__text_section_margins.top()
-                                    + math.ceil(height_text_section_height_difference / 2)
-                                    + math.ceil(forced_additional_height / 2)
-                                    - math.floor(forced_reduced_height / 2))
-
-            self.__text_label.move(self.__margins.left()
-                                   + self.__text_section_margins.left(),
-                                   self.__margins.top()
-                                   + self.__text_section_margins.top()
-                                   + title_height + self.__text_section_spacing
-                                   + math.ceil(height_text_section_height_difference / 2)
-                                   + math.ceil(forced_additional_height / 2)
-                                   - math.floor(forced_reduced_height / 2))
-
-        # Adjust label position if either title or text is empty
-        if self.__title == '' and self.__text != '':
-            self.__text_label.move(self.__text_label.x(),
-                                   int((height - text_height - duration_bar_height) / 2))
-
-        elif self.__title != '' and self.__text == '':
-            self.__title_label.move(self.__title_label.x(),
-                                    int((height - title_height - duration_bar_height) / 2))
-
-        # Move close button to top, middle, or bottom position
-        if self.__close_button_alignment == ToastButtonAlignment.TOP:
-            self.__close_button.move(width - close_button_width
-                                     - close_button_margins.right() - self.__margins.right(),
-                                     self.__margins.top() + close_button_margins.top())
-        elif self.__close_button_alignment == ToastButtonAlignment.MIDDLE:
-            self.__close_button.move(width - close_button_width
-                                     - close_button_margins.right() - self.__margins.right(),
-                                     math.ceil((height - close_button_height
-                                               - duration_bar_height) / 2))
-        elif self.__close_button_alignment == ToastButtonAlignment.BOTTOM:
-            self.__close_button.move(width - close_button_width
-                                     - close_button_margins.right() - self.__margins.right(),
-                                     height - close_button_height
-                                     - self.__margins.bottom()
-                                     - close_button_margins.bottom() - duration_bar_height)
-
-        # Hide close button if disabled
+        # Resize and move title and text labels
+        if geometry.word_wrap:
+            self.__title_label.setWordWrap(True)
+            self.__text_label.setWordWrap(True)
+
+        self.__title_label.setFixedSize(geometry.title_rect.size())
+        self.__title_label.move(geometry.title_rect.topLeft())
+        self.__text_label.setFixedSize(geometry.text_rect.size())
+        self.__text_label.move(geometry.text_rect.topLeft())
+
+        # Move close button and hide it if disabled
+        self.__close_button.move(geometry.close_button_position)
         if not self.__show_close_button:
             self.__close_button.setVisible(False)
 
         # Resize, move, and show duration bar if enabled
-        if self.__show_duration_bar:
+        if geometry.duration_bar_rect is not None:
             self.__duration_bar_container.setFixedWidth(width)
-            self.__duration_bar_container.move(0, height - duration_bar_height)
+            self.__duration_bar_container.move(geometry.duration_bar_rect.topLeft())
             self.__duration_bar.setFixedWidth(width)
             self.__duration_bar_chunk.setFixedWidth(width)
             self.__duration_bar_container.setVisible(True)
@@ -882,7 +1099,7 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__title = title
-        self.__title_label.setText(title)
+        self.__update_label_texts()
 
     def getText(self) -> str:
         """Get the text of the toast
@@ -901,7 +1118,7 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__text = text
-        self.__text_label.setText(text)
+        self.__update_label_texts()
 
     def getIcon(self) -> QPixmap:
         """Get the icon of the toast
@@ -925,7 +1142,6 @@ class Toast(QDialog):
         else:
             self.__icon = icon
 
-        self.__icon_widget.setIcon(QIcon(self.__icon))
         self.setIconColor(self.__icon_color)
 
     def isShowIcon(self) -> bool:
@@ -963,8 +1179,9 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__icon_size = size
-        self.__icon_widget.setFixedSize(size)
-        self.__icon_widget.setIconSize(size)
+        if not self.__painted:
+            self.__icon_widget.setFixedSize(size)
+            self.__icon_widget.setIconSize(size)
         self.setIcon(self.__icon)
 
     def isShowIconSeparator(self) -> bool:
@@ -985,6 +1202,9 @@ class Toast(QDialog):
             return
         self.__show_icon_separator = on
 
+        if self.__painted:
+            return
+
         if on:
             self.__icon_separator.setFixedWidth(self.__icon_separator_width)
         else:
@@ -1008,7 +1228,7 @@ class Toast(QDialog):
             return
         self.__icon_separator_width = width
 
-        if self.__show_icon_separator:
+        if self.__show_icon_separator and not self.__painted:
             self.__icon_separator.setFixedWidth(width)
 
     def getCloseButtonIcon(self) -> QPixmap:
@@ -1033,7 +1253,6 @@ class Toast(QDialog):
         else:
             self.__close_button_icon = icon
 
-        self.__close_button.setIcon(QIcon(self.__close_button_icon))
         self.setCloseButtonIconColor(self.__close_button_icon_color)
 
     def isShowCloseButton(self) -> bool:
@@ -1071,7 +1290,8 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__close_button_icon_size = size
-        self.__close_button.setIconSize(size)
+        if not self.__painted:
+            self.__close_button.setIconSize(size)
         self.setCloseButtonIcon(self.__close_button_icon)
 
     def getCloseButtonSize(self) -> QSize:
@@ -1091,7 +1311,8 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__close_button_size = size
-        self.__close_button.setFixedSize(size)
+        if not self.__painted:
+            self.__close_button.setFixedSize(size)
 
     def getCloseButtonWidth(self) -> int:
         """Get the width of the close button
@@ -1110,7 +1331,8 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__close_button_size.setWidth(width)
-        self.__close_button.setFixedSize(self.__close_button_size)
+        if not self.__painted:
+            self.__close_button.setFixedSize(self.__close_button_size)
 
     def getCloseButtonHeight(self) -> int:
         """Get the height of the close button
@@ -1129,7 +1351,8 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__close_button_size.setHeight(height)
-        self.__close_button.setFixedSize(self.__close_button_size)
+        if not self.__painted:
+            self.__close_button.setFixedSize(self.__close_button_size)
 
     def getCloseButtonAlignment(self) -> ToastButtonAlignment:
         """Get the alignment of the close button
@@ -1203,36 +1426,173 @@ class Toast(QDialog):
             return
         self.__reset_duration_on_hover = on
 
-    def isStayOnTop(self) -> bool:
-        """Get whether the toast always stays on top of other windows
+    def isPauseDurationOnHover(self) -> bool:
+        """Get whether the duration pauses on hover
 
-        :return: whether the stay on top option is enabled
+        :return: whether the duration pauses on hover
         """
 
-        return self.__stay_on_top
+        return self.__pause_duration_on_hover
 
-    def setStayOnTop(self, on: bool):
-        """Set whether the toast should always stay on top of other windows
+    def setPauseDurationOnHover(self, on: bool):
+        """Set whether the duration should pause on hover and continue
+        with the remaining time afterwards (only used if the duration
+        does not reset on hover)
 
-        :param on: whether the stay on top option should be enabled
+        :param on: whether the duration should pause on hover
         """
 
         if self.__used:
             return
-        self.__stay_on_top = on
+        self.__pause_duration_on_hover = on
 
-        if on:
-            self.setWindowFlags(Qt.WindowType.Tool |
-                                Qt.WindowType.CustomizeWindowHint |
-                                Qt.WindowType.FramelessWindowHint |
-                                Qt.WindowType.WindowStaysOnTopHint)
-        else:
-            self.setWindowFlags(Qt.WindowType.Tool |
-                                Qt.WindowType.CustomizeWindowHint |
-                                Qt.WindowType.FramelessWindowHint)
+    def isAutoDelete(self) -> bool:
+        """Get whether the toast is deleted once it has been closed
 
-    def getBorderRadius(self) -> int:
-        """Get the border radius of the toast
+        :return: whether the toast is deleted after closing
+        """
+
+        return self.__auto_delete
+
+    def setAutoDelete(self, on: bool):
+        """Set whether the toast should be deleted (together with its child widgets
+        and animations) once it has been closed and the closed signal has been emitted
+        (enabled by default for toasts without a parent)
+
+        :param on: whether the toast should be deleted after closing
+        """
+
+        if self.__used:
+            return
+        self.__auto_delete = on
+
+    def getDeduplicationKey(self):
+        """Get the key that identifies duplicates of the toast
+
+        :return: deduplication key (None if the title, text, and preset are used)
+        """
+
+        return self.__deduplication_key
+
+    def setDeduplicationKey(self, key):
+        """Set the key that identifies duplicates of the toast
+        (only used if deduplication is enabled)
+
+        :param key: hashable deduplication key (None to use the title, text, and preset)
+        """
+
+        if self.__used:
+            return
+        self.__deduplication_key = key
+
+    def getRateLimitCategory(self):
+        """Get the category the rate limit is applied to
+
+        :return: rate limit category (None if the preset is used)
+        """
+
+        return self.__rate_limit_category
+
+    def setRateLimitCategory(self, category):
+        """Set the category the rate limit is applied to (e.g. a channel name)
+
+        :param category: hashable rate limit category (None to use the preset)
+        """
+
+        if self.__used:
+            return
+        self.__rate_limit_category = category
+
+    def getPriority(self) -> int:
+        """Get the queue priority of the toast
+
+        :return: priority
+        """
+
+        return self.__priority
+
+    def setPriority(self, priority: int):
+        """Set the queue priority of the toast (queued toasts with a higher
+        priority are shown first, toasts with the same priority in order)
+
+        :param priority: new priority (default 0)
+        """
+
+        if self.__used:
+            return
+        self.__priority = priority
+
+    def getQueueTimeToLive(self) -> int:
+        """Get the maximum time the toast may stay queued before it expires
+
+        :return: queue time to live in milliseconds (0 for unlimited)
+        """
+
+        return self.__queue_time_to_live
+
+    def setQueueTimeToLive(self, time_to_live: int):
+        """Set the maximum time the toast may stay queued. If it is still queued
+        afterwards, it is discarded instead of being shown (and emits dropped)
+
+        :param time_to_live: queue time to live in milliseconds (0 for unlimited)
+        """
+
+        if self.__used:
+            return
+        self.__queue_time_to_live = time_to_live
+
+    def getDuplicateCount(self) -> int:
+        """Get how many times the toast has been shown including its duplicates
+
+        :return: duplicate count (1 if there were no duplicates)
+        """
+
+        return self.__duplicate_count
+
+    def getRemainingTime(self) -> int:
+        """Get the time left until the toast starts hiding
+
+        :return: remaining time in milliseconds (0 if the toast has no duration)
+        """
+
+        if self.__duration == 0:
+            return 0
+        if not self.__used:
+            return self.__duration
+        if self.__fading_out or self not in Toast.__currently_shown:
+            return 0
+        return max(0, self.__get_remaining_time())
+
+    def isStayOnTop(self) -> bool:
+        """Get whether the toast always stays on top of other windows
+
+        :return: whether the stay on top option is enabled
+        """
+
+        return self.__stay_on_top
+
+    def setStayOnTop(self, on: bool):
+        """Set whether the toast should always stay on top of other windows
+
+        :param on: whether the stay on top option should be enabled
+        """
+
+        if self.__used:
+            return
+        self.__stay_on_top = on
+
+        if on:
+            self.setWindowFlags(Qt.WindowType.Tool |
+                                Qt.WindowType.CustomizeWindowHint |
+                                Qt.WindowType.FramelessWindowHint |
+                                Qt.WindowType.WindowStaysOnTopHint)
+        else:
+            self.setWindowFlags(Qt.WindowType.Tool |
+                                Qt.WindowType.CustomizeWindowHint |
+                                Qt.WindowType.FramelessWindowHint)
+
+    def getBorderRadius(self) -> int:
+        """Get the border radius of the toast
 
         :return: border radius
         """
@@ -1321,10 +1681,11 @@ class Toast(QDialog):
             return
 
         self.__icon_color = color
-        recolored_image = IconUtils.recolor_image(self.__icon_widget.icon().pixmap(
-                                                  self.__icon_widget.iconSize()).toImage(),
-                                                  color)
-        self.__icon_widget.setIcon(QIcon(QPixmap(recolored_image)))
+        recolored_pixmap = IconUtils.get_recolored_pixmap(self.__icon, self.__icon_size, color)
+        if self.__painted:
+            self.__icon_pixmap = recolored_pixmap
+        else:
+            self.__icon_widget.setIcon(QIcon(recolored_pixmap))
 
     def getIconSeparatorColor(self) -> QColor:
         """Get the color of the icon separator
@@ -1362,10 +1723,12 @@ class Toast(QDialog):
             return
 
         self.__close_button_icon_color = color
-        recolored_image = IconUtils.recolor_image(self.__close_button.icon().pixmap(
-                                                  self.__close_button.iconSize()).toImage(),
-                                                  color)
-        self.__close_button.setIcon(QIcon(QPixmap(recolored_image)))
+        recolored_pixmap = IconUtils.get_recolored_pixmap(self.__close_button_icon,
+                                                          self.__close_button_icon_size, color)
+        if self.__painted:
+            self.__close_button_pixmap = recolored_pixmap
+        else:
+            self.__close_button.setIcon(QIcon(recolored_pixmap))
 
     def getDurationBarColor(self) -> QColor:
         """Get the color of the duration bar
@@ -1402,7 +1765,8 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__title_font = font
-        self.__title_label.setFont(font)
+        if not self.__painted:
+            self.__title_label.setFont(font)
 
     def getTextFont(self) -> QFont:
         """Get the font of the text
@@ -1421,7 +1785,8 @@ class Toast(QDialog):
         if self.__used:
             return
         self.__text_font = font
-        self.__text_label.setFont(font)
+        if not self.__painted:
+            self.__text_label.setFont(font)
 
     def getMargins(self) -> QMargins:
         """Get the margins of the toast content
@@ -1899,6 +2264,7 @@ class Toast(QDialog):
 
         if self.__used:
             return
+        self.__preset = preset
 
         if preset == ToastPreset.SUCCESS or preset == ToastPreset.SUCCESS_DARK:
             self.setIcon(ToastIcon.SUCCESS)
@@ -1945,8 +2311,60 @@ class Toast(QDialog):
         self.setShowIconSeparator(True)
         self.setIconSeparatorWidth(2)
 
+    def __update_label_texts(self):
+        """Update the title and text labels including the duplicate counter badge
+        (shown after the title or after the text if there is no title)"""
+
+        badge = '' if self.__duplicate_count <= 1 else '  \u00d7{}'.format(self.__duplicate_count)
+
+        if self.__title != '' or self.__text == '':
+            self.__title_label_text = self.__title + badge
+            self.__text_label_text = self.__text
+        else:
+            self.__title_label_text = self.__title
+            self.__text_label_text = self.__text + badge
+
+        if not self.__painted:
+            self.__title_label.setText(self.__title_label_text)
+            self.__text_label.setText(self.__text_label_text)
+
+    def __add_duplicates(self, count: int):
+        """Count duplicates of the toast and update the counter badge
+
+        :param count: amount of duplicates to add
+        """
+
+        previous_count = self.__duplicate_count
+        self.__duplicate_count += count
+        self.__update_label_texts()
+
+        if self in Toast.__currently_shown:
+            # Only resize if the badge appeared or has more digits than before
+            if previous_count == 1 or len(str(previous_count)) != len(str(self.__duplicate_count)):
+                self.__setup_ui()
+                Toast.__stack_offsets_valid = False
+                Toast.__update_currently_showing_position_xy()
+
+            if Toast.__restart_duration_on_duplicate and self.__countdown_started:
+                self.__stop_countdown()
+                self.__start_countdown()
+                if self.__show_duration_bar:
+                    self.__set_duration_bar_chunk_width(self.__get_toast_widget_size().width())
+
     def __update_stylesheet(self):
-        """Update the stylesheet of the toast"""
+        """Update the stylesheet of the toast (skipped if nothing changed since the last update
+        and for painted toasts, which read the colors while painting)"""
+
+        if self.__painted:
+            return
+
+        stylesheet_key = (self.__background_color.name(), self.__border_radius,
+                          self.__duration_bar_color.name(), self.__duration == 0,
+                          self.__icon_separator_color.name(), self.__title_color.name(),
+                          self.__text_color.name())
+        if stylesheet_key == self.__stylesheet_key:
+            return
+        self.__stylesheet_key = stylesheet_key
 
         self.__toast_widget.setStyleSheet('background: {};'
                                           'border-radius: {}px;'
@@ -1975,6 +2393,53 @@ class Toast(QDialog):
         self.__title_label.setStyleSheet('color: {};'.format(self.__title_color.name()))
         self.__text_label.setStyleSheet('color: {};'.format(self.__text_color.name()))
 
+    @staticmethod
+    def __append_stack_offset(toast: 'Toast'):
+        """Add the offset of a toast that was added to the end of the shown toasts
+
+        :param toast: newly shown toast
+        """
+
+        if not Toast.__stack_offsets_valid:
+            return
+
+        Toast.__stack_indices[id(toast)] = len(Toast.__stack_offsets)
+        Toast.__stack_offsets.append(Toast.__get_stack_height(len(Toast.__stack_offsets)))
+
+    @staticmethod
+    def __get_stack_height(count: int) -> int:
+        """Get the vertical space taken up by the first shown toasts including spacing
+
+        :param count: amount of toasts (must have a valid offset)
+        :return: height in pixels
+        """
+
+        if count == 0:
+            return 0
+        return (Toast.__stack_offsets[count - 1] + Toast.__spacing
+                + Toast.__currently_shown[count - 1].__get_toast_widget_size().height())
+
+    @staticmethod
+    def __get_stack_offset(toast: 'Toast') -> int:
+        """Get the vertical space taken up by the shown toasts before a toast in O(1)
+        (the offsets are only recalculated after a toast was removed or resized)
+
+        :param toast: toast to get the offset of
+        :return: offset in pixels (height of the whole stack if the toast is not shown)
+        """
+
+        if not Toast.__stack_offsets_valid:
+            Toast.__stack_offsets.clear()
+            Toast.__stack_indices.clear()
+            Toast.__stack_offsets_valid = True
+            for shown_toast in Toast.__currently_shown:
+                Toast.__append_stack_offset(shown_toast)
+
+        index = Toast.__stack_indices.get(id(toast))
+        if index is None:
+            return Toast.__get_stack_height(len(Toast.__stack_offsets))
+        return Toast.__stack_offsets[index]
+
     @staticmethod
     def __update_currently_showing_position_xy(animate: bool = True):
         """Update the x and y position of every currently showing toast
@@ -2005,13 +2470,664 @@ class Toast(QDialog):
         for toast in Toast.__currently_shown:
             toast.__update_position_y(animate)
 
+    @staticmethod
+    def __update_shared_timers():
+        """Arm the shared duration timer for the earliest expiry of all
+        running countdowns and run the shared duration bar timer as long
+        as any duration bar is counting down"""
+
+        if Toast.__duration_timer is None:
+            Toast.__duration_timer = QTimer()
+            Toast.__duration_timer.setSingleShot(True)
+            Toast.__duration_timer.setTimerType(Qt.TimerType.PreciseTimer)
+            Toast.__duration_timer.timeout.connect(Toast.__hide_expired)
+
+            Toast.__duration_bar_timer = QTimer()
+            Toast.__duration_bar_timer.timeout.connect(Toast.__update_duration_bars)
+
+        counting_down = [toast for toast in Toast.__currently_shown if toast.__countdown_active]
+
+        # Duration timer
+        if len(counting_down) > 0:
+            remaining_time = min(toast.__get_remaining_time() for toast in counting_down)
+            Toast.__duration_timer.start(max(0, remaining_time))
+        else:
+            Toast.__duration_timer.stop()
+
+        # Duration bar timer (paced by the fastest refresh rate of the
+        # screens with duration bars but never faster than the maximum)
+        refresh_rates = [toast.screen().refreshRate() if toast.screen() is not None else 0
+                         for toast in counting_down if toast.__show_duration_bar]
+        if len(refresh_rates) > 0:
+            update_rate = Toast.__duration_bar_maximum_update_rate
+            if max(refresh_rates) > 0:
+                update_rate = min(update_rate, max(refresh_rates))
+
+            interval = max(1, round(1000 / update_rate))
+            if not Toast.__duration_bar_timer.isActive() or Toast.__duration_bar_timer.interval() != interval:
+                Toast.__duration_bar_timer.start(interval)
+        else:
+            Toast.__duration_bar_timer.stop()
+
+    @staticmethod
+    def __is_paused_globally() -> bool:
+        """Get whether the countdowns of all toasts are currently paused
+
+        :return: whether paused manually or because the application is inactive
+        """
+
+        return Toast.__paused or (Toast.__pause_when_inactive and Toast.__application_inactive)
+
+    @staticmethod
+    def __update_global_pause():
+        """Pause or resume the countdowns of all currently shown toasts"""
+
+        for toast in Toast.__currently_shown:
+            if Toast.__is_paused_globally():
+                toast.__pause_countdown()
+            else:
+                toast.__resume_countdown()
+
+    @staticmethod
+    def __application_state_changed(state: Qt.ApplicationState):
+        """Keep track of whether the application is active
+
+        :param state: new application state
+        """
+
+        Toast.__application_inactive = state != Qt.ApplicationState.ApplicationActive
+        Toast.__update_global_pause()
+
+    @staticmethod
+    def __hide_expired():
+        """Hide every toast whose countdown has expired"""
+
+        for toast in list(Toast.__currently_shown):
+            if toast.__countdown_active and toast.__get_remaining_time() <= 0:
+                toast.hide()
+
+        Toast.__update_shared_timers()
+
+    @staticmethod
+    def __update_duration_bars():
+        """Update the duration bars of all toasts that are counting down in one pass"""
+
+        for toast in Toast.__currently_shown:
+            if toast.__countdown_active and toast.__show_duration_bar:
+                toast.__update_duration_bar()
+
     @staticmethod
     def __show_next_in_queue():
         """Show next toast in queue"""
 
-        if len(Toast.__queue) > 0:
-            next_toast = Toast.__queue.pop(0)
-            next_toast.show()
+        next_item = Toast.__queue.popleft()
+
+        # Skip items that were queued for longer than their time to live
+        while next_item is not None and Toast.__is_expired(next_item):
+            Toast.__expired_count += 1
+            Toast.__discard(next_item)
+            next_item = Toast.__queue.popleft()
+
+        if next_item is not None:
+            Toast.__forget_duplicate(next_item)
+
+        if isinstance(next_item, ToastSpec):
+            toast = Toast.fromSpec(next_item)
+            toast.__rate_limit_passed = True
+            toast.show()
+        elif next_item is not None:
+            next_item.show()
+
+        # Another toast may have moved up to the front of the queue
+        Toast.__schedule_precompute()
+
+    @staticmethod
+    def __enqueue(item: 'Toast | ToastSpec'):
+        """Add a toast or toast spec to the queue while respecting
+        the maximum queue size and the queue overflow policy
+
+        :param item: toast or toast spec to add
+        """
+
+        priority = Toast.__get_priority(item)
+        Toast.__set_queue_deadline(item)
+        Toast.__schedule_precompute()
+
+        if Toast.__maximum_queued <= 0 or len(Toast.__queue) < Toast.__maximum_queued:
+            Toast.__queue.append(item, priority)
+            Toast.__preempt(priority)
+            return
+
+        # The oldest item with the lowest priority is dropped first
+        if Toast.__queue_overflow_policy == ToastQueueOverflowPolicy.DROP_OLDEST:
+            Toast.__drop(Toast.__queue.pop_lowest())
+            Toast.__queue.append(item, priority)
+            Toast.__preempt(priority)
+
+        elif Toast.__queue_overflow_policy == ToastQueueOverflowPolicy.DROP_NEWEST:
+            Toast.__drop(item)
+
+        elif Toast.__queue_overflow_policy == ToastQueueOverflowPolicy.COALESCE:
+            # Drop the new item if an identical one is already queued, else the oldest one
+            key = Toast.__get_deduplication_key(item)
+            for queued_item in Toast.__queue:
+                if Toast.__get_deduplication_key(queued_item) == key:
+                    Toast.__drop(item)
+                    return
+            Toast.__drop(Toast.__queue.pop_lowest())
+            Toast.__queue.append(item, priority)
+            Toast.__preempt(priority)
+
+        else:
+            # ToastQueueOverflowPolicy.BLOCK: reject the item without dropping it,
+            # so that it can be shown again once the queue has space
+            # (show and showSpec already reject items before they get here)
+            Toast.__reject(item)
+
+    @staticmethod
+    def __schedule_precompute():
+        """Precompute the next queued toasts once the event loop is idle
+        (at most one precomputation is scheduled at a time)"""
+
+        if Toast.__precompute_count <= 0 or Toast.__precompute_scheduled:
+            return
+
+        Toast.__precompute_scheduled = True
+        QTimer.singleShot(0, Toast.__precompute_queued)
+
+    @staticmethod
+    def __precompute_queued():
+        """Precompute the stylesheet and layout of the toasts at the front of the queue
+        (toast specs are skipped since they only become widgets once they are shown)"""
+
+        Toast.__precompute_scheduled = False
+
+        for item in Toast.__queue.peek(Toast.__precompute_count):
+            if isinstance(item, Toast):
+                item.__precompute_layout()
+
+    @staticmethod
+    def __preempt(priority: int):
+        """Start hiding the shown toast with the lowest priority (oldest first)
+        if preemption is enabled and its priority is lower than the given one
+
+        :param priority: priority of the newly queued toast or toast spec
+        """
+
+        if not Toast.__preemption_enabled:
+            return
+
+        candidates = [toast for toast in Toast.__currently_shown
+                      if not toast.__fading_out and toast.__priority < priority]
+        if len(candidates) > 0:
+            min(candidates, key=lambda toast: toast.__priority).hide()
+
+    @staticmethod
+    def __get_priority(item: 'Toast | ToastSpec') -> int:
+        """Get the queue priority of a toast or toast spec
+
+        :param item: toast or toast spec
+        :return: priority
+        """
+
+        if isinstance(item, ToastSpec):
+            return item.priority
+        return item.__priority
+
+    @staticmethod
+    def __set_queue_deadline(item: 'Toast | ToastSpec'):
+        """Set the time at which a toast or toast spec that is being queued expires
+
+        :param item: toast or toast spec
+        """
+
+        if isinstance(item, ToastSpec):
+            if item.queue_time_to_live > 0:
+                item.queue_deadline = time.monotonic() + item.queue_time_to_live / 1000
+        elif item.__queue_time_to_live > 0:
+            item.__queue_deadline = time.monotonic() + item.__queue_time_to_live / 1000
+
+    @staticmethod
+    def __is_expired(item: 'Toast | ToastSpec') -> bool:
+        """Get whether a queued toast or toast spec has exceeded its queue time to live
+
+        :param item: toast or toast spec
+        :return: whether the item expired
+        """
+
+        deadline = item.queue_deadline if isinstance(item, ToastSpec) else item.__queue_deadline
+        return deadline is not None and time.monotonic() >= deadline
+
+    @staticmethod
+    def __drop(item: 'Toast | ToastSpec'):
+        """Drop a toast or toast spec without ever showing it
+
+        :param item: toast or toast spec to drop
+        """
+
+        Toast.__dropped_count += 1
+        Toast.__discard(item)
+
+    @staticmethod
+    def __is_queue_blocked() -> bool:
+        """Get whether a new toast or toast spec would be rejected because no more
+        toasts can be shown, the queue is full, and the overflow policy is BLOCK
+
+        :return: whether new toasts are rejected
+        """
+
+        return (Toast.__queue_overflow_policy == ToastQueueOverflowPolicy.BLOCK
+                and Toast.__maximum_on_screen <= len(Toast.__currently_shown)
+                and Toast.isQueueFull())
+
+    @staticmethod
+    def __reject(item: 'Toast | ToastSpec'):
+        """Reject a toast or toast spec without dropping it
+        (a rejected toast is not used up and can be shown again)
+
+        :param item: toast or toast spec to reject
+        """
+
+        Toast.__rejected_count += 1
+        Toast.__forget_duplicate(item)
+
+        if isinstance(item, Toast):
+            item.rejected.emit()
+
+    @staticmethod
+    def __discard(item: 'Toast | ToastSpec', closed: bool = False):
+        """Discard a toast or toast spec that was removed from the queue
+
+        :param item: toast or toast spec to discard
+        :param closed: whether the toast was hidden (emits closed instead of dropped)
+        """
+
+        Toast.__forget_duplicate(item)
+
+        if isinstance(item, Toast):
+            item.__used = True
+            if closed:
+                item.closed.emit()
+            else:
+                item.dropped.emit()
+            if item.__auto_delete or item.__poolable:
+                item.deleteLater()
+
+    @staticmethod
+    def __get_deduplication_key(item: 'Toast | ToastSpec'):
+        """Get the key that identical toasts or toast specs have in common
+
+        :param item: toast or toast spec
+        :return: user-defined key or title, text, and preset
+        """
+
+        if isinstance(item, ToastSpec):
+            if item.deduplication_key is not None:
+                return item.deduplication_key
+            return item.title, item.text, item.preset
+
+        if item.__deduplication_key is not None:
+            return item.__deduplication_key
+        return item.__title, item.__text, item.__preset
+
+    @staticmethod
+    def __get_rate_limit_category(item: 'Toast | ToastSpec'):
+        """Get the category the rate limit of a toast or toast spec is applied to
+
+        :param item: toast or toast spec
+        :return: user-defined category or preset
+        """
+
+        if isinstance(item, ToastSpec):
+            return item.rate_limit_category if item.rate_limit_category is not None else item.preset
+        return item.__rate_limit_category if item.__rate_limit_category is not None else item.__preset
+
+    @staticmethod
+    def __coalesce_duplicate(item: 'Toast | ToastSpec') -> bool:
+        """Count a toast or toast spec as duplicate of an identical toast
+        or toast spec that is currently shown (and not hiding) or queued
+
+        :param item: toast or toast spec
+        :return: whether an identical toast or toast spec was found
+        """
+
+        key = Toast.__get_deduplication_key(item)
+        match = Toast.__deduplication_index.get(key)
+        if match is None or match is item:
+            return False
+
+        # Entries are removed when items leave the screen or queue,
+        # but the key of a queued toast may have been changed since
+        if (Toast.__get_deduplication_key(match) != key
+                or (match not in Toast.__queue
+                    and (match not in Toast.__currently_shown or match.__fading_out))):
+            return False
+
+        count = item.duplicate_count if isinstance(item, ToastSpec) else item.__duplicate_count
+        if isinstance(match, ToastSpec):
+            match.duplicate_count += count
+        else:
+            match.__add_duplicates(count)
+        return True
+
+    @staticmethod
+    def __forget_duplicate(item: 'Toast | ToastSpec'):
+        """Remove a toast or toast spec from the deduplication index
+
+        :param item: toast or toast spec that left the screen or queue
+        """
+
+        if len(Toast.__deduplication_index) == 0:
+            return
+
+        key = Toast.__get_deduplication_key(item)
+        if Toast.__deduplication_index.get(key) is item:
+            del Toast.__deduplication_index[key]
+
+    @staticmethod
+    def __get_shown_and_queued_toasts() -> list:
+        """Get all currently shown and queued toasts (without queued toast specs)
+
+        :return: list of toasts
+        """
+
+        return Toast.__currently_shown + [item for item in Toast.__queue if isinstance(item, Toast)]
+
+    @staticmethod
+    def obtain(parent: QWidget = None) -> 'Toast':
+        """Get a new toast, reusing a closed one from the pool if pooling is
+        enabled (a toast obtained this way must not be used after it closed)
+
+        :param parent: the parent widget
+        :return: new or reset toast
+        """
+
+        if Toast.__pooling_enabled and len(Toast.__pool) > 0:
+            toast = Toast.__pool.pop()
+            toast.__reset_for_reuse(parent)
+        else:
+            toast = Toast(parent)
+
+        toast.__poolable = True
+        return toast
+
+    @staticmethod
+    def isPoolingEnabled() -> bool:
+        """Get whether closed toasts are reused by Toast.obtain()
+
+        :return: whether pooling is enabled
+        """
+
+        return Toast.__pooling_enabled
+
+    @staticmethod
+    def setPoolingEnabled(on: bool):
+        """Set whether closed toasts should be reused by Toast.obtain()
+        (the pool holds at most the maximum amount of toasts on screen)
+
+        :param on: whether pooling should be enabled
+        """
+
+        Toast.__pooling_enabled = on
+
+        if not on:
+            Toast.__clear_pool()
+
+    @staticmethod
+    def getRenderMode() -> ToastRenderMode:
+        """Get how newly created toasts are drawn
+
+        :return: render mode
+        """
+
+        return Toast.__render_mode
+
+    @staticmethod
+    def setRenderMode(mode: ToastRenderMode):
+        """Set how newly created toasts are drawn (existing toasts keep their render mode,
+        pooled toasts are deleted if it changes)
+
+        :param mode: new render mode
+        """
+
+        if mode != Toast.__render_mode:
+            Toast.__clear_pool()
+        Toast.__render_mode = mode
+
+    @staticmethod
+    def getPooledCount() -> int:
+        """Get the amount of closed toasts waiting to be reused
+
+        :return: the amount of pooled toasts
+        """
+
+        return len(Toast.__pool)
+
+    @staticmethod
+    def __clear_pool():
+        """Delete all pooled toasts"""
+
+        for toast in Toast.__pool:
+            toast.deleteLater()
+        Toast.__pool.clear()
+
+    @staticmethod
+    def fromSpec(spec: ToastSpec) -> 'Toast':
+        """Create a toast from a toast spec
+        (reuses a pooled toast if pooling is enabled)
+
+        :param spec: toast spec
+        :return: new toast
+        """
+
+        toast = Toast.obtain(spec.parent)
+        if spec.preset is not None:
+            toast.applyPreset(spec.preset)
+        toast.setTitle(spec.title)
+        toast.setText(spec.text)
+        if spec.duration is not None:
+            toast.setDuration(spec.duration)
+        if spec.icon is not None:
+            toast.setIcon(spec.icon)
+        if spec.show_icon is not None:
+            toast.setShowIcon(spec.show_icon)
+        if spec.background_color is not None:
+            toast.setBackgroundColor(spec.background_color)
+        if spec.title_color is not None:
+            toast.setTitleColor(spec.title_color)
+        if spec.text_color is not None:
+            toast.setTextColor(spec.text_color)
+        if spec.icon_color is not None:
+            toast.setIconColor(spec.icon_color)
+        if spec.duration_bar_color is not None:
+            toast.setDurationBarColor(spec.duration_bar_color)
+        toast.setDeduplicationKey(spec.deduplication_key)
+        toast.setRateLimitCategory(spec.rate_limit_category)
+        toast.setPriority(spec.priority)
+        toast.setQueueTimeToLive(spec.queue_time_to_live)
+        toast.__duplicate_count = spec.duplicate_count
+        toast.__update_label_texts()
+        return toast
+
+    @staticmethod
+    def showSpec(spec: ToastSpec) -> 'Toast | None':
+        """Show a toast described by a toast spec. If the maximum amount of
+        toasts on screen is reached, only the spec is queued and the toast
+        is created once it can be shown
+
+        :param spec: toast spec
+        :return: the toast if it was shown right away, else None
+            (also None if it was counted as a duplicate, rejected, or suppressed)
+        """
+
+        # Only count duplicates without creating a toast
+        if Toast.__deduplication_enabled and Toast.__coalesce_duplicate(spec):
+            return None
+
+        # Reject the spec before it takes a rate limit token if it can neither be shown nor queued
+        if Toast.__is_queue_blocked():
+            Toast.__reject(spec)
+            return None
+
+        # Suppress the spec if its category exceeds the rate limit
+        if not Toast.__rate_limiter.acquire(Toast.__get_rate_limit_category(spec)):
+            return None
+
+        if Toast.__maximum_on_screen > len(Toast.__currently_shown):
+            toast = Toast.fromSpec(spec)
+            toast.__rate_limit_passed = True
+            toast.show()
+            return toast
+
+        if Toast.__deduplication_enabled:
+            Toast.__deduplication_index[Toast.__get_deduplication_key(spec)] = spec
+        Toast.__enqueue(spec)
+        return None
+
+    @staticmethod
+    def isDeduplicationEnabled() -> bool:
+        """Get whether duplicates of shown or queued toasts are coalesced
+
+        :return: whether deduplication is enabled
+        """
+
+        return Toast.__deduplication_enabled
+
+    @staticmethod
+    def setDeduplicationEnabled(on: bool):
+        """Set whether a toast that is identical to a shown or queued toast
+        (same deduplication key or same title, text, and preset) should only
+        increase the duplicate counter of that toast instead of being shown
+
+        :param on: whether deduplication should be enabled
+        """
+
+        Toast.__deduplication_enabled = on
+
+        if not on:
+            Toast.__deduplication_index.clear()
+
+    @staticmethod
+    def isRestartDurationOnDuplicate() -> bool:
+        """Get whether the duration of a shown toast restarts when a duplicate is coalesced
+
+        :return: whether the duration restarts on duplicates
+        """
+
+        return Toast.__restart_duration_on_duplicate
+
+    @staticmethod
+    def setRestartDurationOnDuplicate(on: bool):
+        """Set whether the duration of a shown toast should restart
+        when a duplicate is coalesced into it
+
+        :param on: whether the duration should restart on duplicates
+        """
+
+        Toast.__restart_duration_on_duplicate = on
+
+    @staticmethod
+    def isPreemptionEnabled() -> bool:
+        """Get whether queued toasts can preempt shown toasts with a lower priority
+
+        :return: whether preemption is enabled
+        """
+
+        return Toast.__preemption_enabled
+
+    @staticmethod
+    def setPreemptionEnabled(on: bool):
+        """Set whether a toast that has to be queued should start hiding the shown
+        toast with the lowest priority if that priority is lower than its own
+
+        :param on: whether preemption should be enabled
+        """
+
+        Toast.__preemption_enabled = on
+
+    @staticmethod
+    def getRateLimit() -> tuple[float, int]:
+        """Get the rate limit that is applied to each category of toasts
+
+        :return: toasts allowed per second and burst size
+        """
+
+        return Toast.__rate_limiter.get_rate(), Toast.__rate_limiter.get_burst()
+
+    @staticmethod
+    def setRateLimit(rate: float, burst: int = 1):
+        """Set how many toasts per category (preset or rate limit category) are
+        accepted per second. Toasts exceeding the limit are not shown or queued
+
+        :param rate: toasts allowed per second (0 to disable rate limiting)
+        :param burst: amount of toasts allowed in quick succession
+        """
+
+        Toast.__rate_limiter.set_limit(rate, burst)
+
+    @staticmethod
+    def getSuppressedCount(category=_ALL_CATEGORIES) -> int:
+        """Get the amount of toasts suppressed by the rate limit
+
+        :param category: category to get the count of (all categories if not given,
+            None for toasts without preset and rate limit category)
+        :return: the amount of suppressed toasts
+        """
+
+        return Toast.__rate_limiter.get_suppressed_count(category)
+
+    @staticmethod
+    def getRateLimiter() -> ToastRateLimiter:
+        """Get the rate limiter (e.g. to connect to its suppressed signal)
+
+        :return: rate limiter
+        """
+
+        return Toast.__rate_limiter
+
+    @staticmethod
+    @contextmanager
+    def batch():
+        """Context manager that delays repositioning the shown toasts until
+        the end of the block, so showing many toasts only moves each toast once
+
+        Example::
+
+            with Toast.batch():
+                for toast in toasts:
+                    toast.show()
+        """
+
+        Toast.__batch_depth += 1
+        try:
+            yield
+        finally:
+            Toast.__batch_depth -= 1
+            if Toast.__batch_depth == 0 and Toast.__batch_layout_pending:
+                Toast.__batch_layout_pending = False
+                Toast.__update_currently_showing_position_xy()
+
+    @staticmethod
+    def showMany(items: list):
+        """Show or queue many toasts and toast specs at once
+        with a single repositioning pass at the end
+
+        :param items: toasts and toast specs to show
+        """
+
+        with Toast.batch():
+            for item in items:
+                if isinstance(item, ToastSpec):
+                    Toast.showSpec(item)
+                else:
+                    item.show()
+
+    @staticmethod
+    def preloadIcons():
+        """Load all bundled icons ahead of time (e.g. at application startup)
+        so that showing the first toasts does not have to read them from disk"""
+
+        IconUtils.preload_icons()
 
     @staticmethod
     def getMaximumOnScreen():
@@ -2037,6 +3153,105 @@ class Toast(QDialog):
             for i in range(freed_spaces):
                 Toast.__show_next_in_queue()
 
+    @staticmethod
+    def getMaximumQueued() -> int:
+        """Get the maximum amount of toasts allowed to be in the queue
+
+        :return: maximum queue size (0 if unlimited)
+        """
+
+        return Toast.__maximum_queued
+
+    @staticmethod
+    def setMaximumQueued(maximum_queued: int):
+        """Set the maximum amount of toasts allowed to be in the queue
+        (toasts exceeding it are handled by the queue overflow policy)
+
+        :param maximum_queued: new maximum queue size (0 for unlimited)
+        """
+
+        Toast.__maximum_queued = maximum_queued
+
+        # Drop the oldest toasts with the lowest priority if the queue is already too big
+        while 0 < maximum_queued < len(Toast.__queue):
+            Toast.__drop(Toast.__queue.pop_lowest())
+
+    @staticmethod
+    def getQueueOverflowPolicy() -> ToastQueueOverflowPolicy:
+        """Get what happens to new toasts if the queue is full
+
+        :return: queue overflow policy
+        """
+
+        return Toast.__queue_overflow_policy
+
+    @staticmethod
+    def setQueueOverflowPolicy(policy: ToastQueueOverflowPolicy):
+        """Set what happens to new toasts if the queue is full
+
+        :param policy: new queue overflow policy
+        """
+
+        Toast.__queue_overflow_policy = policy
+
+    @staticmethod
+    def isQueueFull() -> bool:
+        """Get whether the queue has reached its maximum size
+
+        :return: whether the queue is full
+        """
+
+        return 0 < Toast.__maximum_queued <= len(Toast.__queue)
+
+    @staticmethod
+    def getDroppedCount() -> int:
+        """Get the amount of toasts that were dropped because the queue was full
+
+        :return: the amount of dropped toasts
+        """
+
+        return Toast.__dropped_count
+
+    @staticmethod
+    def getRejectedCount() -> int:
+        """Get the amount of toasts that were rejected because the queue
+        was full and the queue overflow policy is BLOCK
+
+        :return: the amount of rejected toasts
+        """
+
+        return Toast.__rejected_count
+
+    @staticmethod
+    def getExpiredCount() -> int:
+        """Get the amount of toasts that were discarded because they
+        were queued for longer than their queue time to live
+
+        :return: the amount of expired toasts
+        """
+
+        return Toast.__expired_count
+
+    @staticmethod
+    def getPrecomputeCount() -> int:
+        """Get the amount of queued toasts that are laid out ahead of time
+
+        :return: amount of precomputed toasts (0 if disabled)
+        """
+
+        return Toast.__precompute_count
+
+    @staticmethod
+    def setPrecomputeCount(count: int):
+        """Set the amount of queued toasts that are laid out ahead of time
+        (while the event loop is idle, so that showing them only has to move and fade them)
+
+        :param count: amount of precomputed toasts (0 to disable)
+        """
+
+        Toast.__precompute_count = count
+        Toast.__schedule_precompute()
+
     @staticmethod
     def getSpacing() -> int:
         """Get the spacing between toast notifications
@@ -2054,6 +3269,7 @@ class Toast(QDialog):
         """
 
         Toast.__spacing = spacing
+        Toast.__stack_offsets_valid = False
         Toast.__update_currently_showing_position_y()
 
     @staticmethod
@@ -2133,14 +3349,14 @@ class Toast(QDialog):
 
         if widget is None:
             # Remove event filters
-            for toast in Toast.__currently_shown + Toast.__queue:
+            for toast in Toast.__get_shown_and_queued_toasts():
                 toast.__remove_widget_event_filter()
 
         Toast.__position_relative_to_widget = widget
 
         if widget is not None:
             # Install event filters
-            for toast in Toast.__currently_shown + Toast.__queue:
+            for toast in Toast.__get_shown_and_queued_toasts():
                 toast.__install_widget_event_filter()
 
         Toast.__update_currently_showing_position_xy()
@@ -2165,11 +3381,11 @@ class Toast(QDialog):
 
         if on:
             # Install event filters
-            for toast in Toast.__currently_shown + Toast.__queue:
+            for toast in Toast.__get_shown_and_queued_toasts():
                 toast.__install_widget_event_filter()
         else:
             # Remove event filters
-            for toast in Toast.__currently_shown + Toast.__queue:
+            for toast in Toast.__get_shown_and_queued_toasts():
                 toast.__remove_widget_event_filter()
 
     @staticmethod
@@ -2229,6 +3445,74 @@ class Toast(QDialog):
         Toast.__position = position
         Toast.__update_currently_showing_position_xy()
 
+    @staticmethod
+    def getDurationBarMaximumUpdateRate() -> int:
+        """Get the maximum rate at which the duration bars are updated
+
+        :return: maximum update rate in updates per second
+        """
+
+        return Toast.__duration_bar_maximum_update_rate
+
+    @staticmethod
+    def setDurationBarMaximumUpdateRate(update_rate: int):
+        """Set the maximum rate at which the duration bars are updated
+        (the refresh rate of the screen is used if it is lower)
+
+        :param update_rate: new maximum update rate in updates per second
+        """
+
+        Toast.__duration_bar_maximum_update_rate = max(1, update_rate)
+
+    @staticmethod
+    def isPaused() -> bool:
+        """Get whether the countdowns of all toasts are paused
+
+        :return: whether the countdowns are paused
+        """
+
+        return Toast.__paused
+
+    @staticmethod
+    def setPaused(on: bool):
+        """Pause or resume the countdowns of all toasts
+        (the remaining time of every toast is kept while paused)
+
+        :param on: whether the countdowns should be paused
+        """
+
+        Toast.__paused = on
+        Toast.__update_global_pause()
+
+    @staticmethod
+    def isPauseWhenInactive() -> bool:
+        """Get whether the countdowns of all toasts pause while the application is inactive
+
+        :return: whether the countdowns pause while the application is inactive
+        """
+
+        return Toast.__pause_when_inactive
+
+    @staticmethod
+    def setPauseWhenInactive(on: bool):
+        """Set whether the countdowns of all toasts should pause while the
+        application is inactive (e.g. another application is focused or,
+        on most platforms, the screen is locked)
+
+        :param on: whether the countdowns should pause while the application is inactive
+        """
+
+        application = QGuiApplication.instance()
+        if on and not Toast.__application_state_connected and application is not None:
+            application.applicationStateChanged.connect(Toast.__application_state_changed)
+            Toast.__application_state_connected = True
+
+        if application is not None:
+            Toast.__application_inactive = (QGuiApplication.applicationState()
+                                            != Qt.ApplicationState.ApplicationActive)
+        Toast.__pause_when_inactive = on
+        Toast.__update_global_pause()
+
     @staticmethod
     def getCount() -> int:
         """Get the amount of toasts that are either currently visible
@@ -2272,6 +3556,24 @@ class Toast(QDialog):
         Toast.__always_on_main_screen = False
         Toast.__fixed_screen = None
         Toast.__position = ToastPosition.BOTTOM_RIGHT
+        Toast.__duration_bar_maximum_update_rate = DURATION_BAR_MAXIMUM_UPDATE_RATE
+        Toast.__paused = False
+        Toast.__pause_when_inactive = False
+        Toast.__maximum_queued = 0
+        Toast.__queue_overflow_policy = ToastQueueOverflowPolicy.DROP_OLDEST
+        Toast.__dropped_count = 0
+        Toast.__rejected_count = 0
+        Toast.__expired_count = 0
+        Toast.__pooling_enabled = False
+        Toast.__clear_pool()
+        Toast.__render_mode = ToastRenderMode.WIDGETS
+        Toast.__deduplication_enabled = False
+        Toast.__restart_duration_on_duplicate = False
+        Toast.__deduplication_index.clear()
+        Toast.__rate_limiter.reset()
+        Toast.__preemption_enabled = False
+        Toast.__batch_layout_pending = False
+        Toast.__precompute_count = PRECOMPUTE_COUNT
 
         # Hide currently showing toasts and clear queue
         for toast in Toast.__currently_shown:
@@ -2279,4 +3581,12 @@ class Toast(QDialog):
             toast.deleteLater()
 
         Toast.__currently_shown.clear()
+        Toast.__stack_offsets.clear()
+        Toast.__stack_indices.clear()
+        Toast.__stack_offsets_valid = True
         Toast.__queue.clear()
+
+        # Stop shared timers
+        if Toast.__duration_timer is not None:
+            Toast.__duration_timer.stop()
+            Toast.__duration_bar_timer.stop()
@@ -34,3 +34,15 @@ class ToastButtonAlignment(Enum):
     TOP = 1
     MIDDLE = 2
     BOTTOM = 3
+
+
+class ToastQueueOverflowPolicy(Enum):
+    DROP_OLDEST = 1
+    DROP_NEWEST = 2
+    COALESCE = 3
+    BLOCK = 4
+
+
+class ToastRenderMode(Enum):
+    WIDGETS = 1
+    PAINTED = 2
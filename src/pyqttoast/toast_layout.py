@@ -0,0 +1,401 @@
+import math
+from typing import NamedTuple
+from qtpy.QtCore import QMargins, QPoint, QRect, QSize
+from qtpy.QtGui import QFont
+from .toast_enums import ToastButtonAlignment
+from .text_metrics_utils import TextMetricsUtils
+from .constants import DROP_SHADOW_SIZE, MAXIMUM_WIDGET_SIZE
+
+
+class ToastLayoutSpec:
+
+    # Only data, so that a layout can be computed without touching any widget
+    __slots__ = ('title', 'text', 'title_label_text', 'text_label_text', 'title_font', 'text_font',
+                 'margins', 'text_section_margins', 'text_section_spacing', 'show_icon', 'icon_size',
+                 'icon_margins', 'icon_section_margins', 'icon_separator_width', 'show_close_button',
+                 'close_button_size', 'close_button_margins', 'close_button_alignment',
+                 'show_duration_bar', 'duration_bar_height', 'minimum_width', 'maximum_width',
+                 'minimum_height', 'maximum_height')
+
+    def __init__(self, title: str = '', text: str = '', title_label_text: str = None,
+                 text_label_text: str = None, title_font: QFont = None, text_font: QFont = None,
+                 margins: QMargins = None, text_section_margins: QMargins = None,
+                 text_section_spacing: int = 8, show_icon: bool = False, icon_size: QSize = None,
+                 icon_margins: QMargins = None, icon_section_margins: QMargins = None,
+                 icon_separator_width: int = 2, show_close_button: bool = True,
+                 close_button_size: QSize = None, close_button_margins: QMargins = None,
+                 close_button_alignment: ToastButtonAlignment = ToastButtonAlignment.TOP,
+                 show_duration_bar: bool = True, duration_bar_height: int = 4,
+                 minimum_width: int = 0, maximum_width: int = MAXIMUM_WIDGET_SIZE,
+                 minimum_height: int = 0, maximum_height: int = MAXIMUM_WIDGET_SIZE):
+        """Create a new ToastLayoutSpec instance (every input of the toast layout)
+
+        :param title: title of the toast (used to check whether there is a title)
+        :param text: text of the toast (used to check whether there is a text)
+        :param title_label_text: text shown in the title label (None for the title)
+        :param text_label_text: text shown in the text label (None for the text)
+        :param title_font: font of the title
+        :param text_font: font of the text
+        :param margins: margins of the toast
+        :param text_section_margins: margins of the text section
+        :param text_section_spacing: spacing between the title and the text
+        :param show_icon: whether the icon is shown
+        :param icon_size: size of the icon
+        :param icon_margins: margins of the icon
+        :param icon_section_margins: margins of the icon section
+        :param icon_separator_width: width of the icon separator (0 if hidden)
+        :param show_close_button: whether the close button is shown
+        :param close_button_size: size of the close button
+        :param close_button_margins: margins of the close button
+        :param close_button_alignment: vertical alignment of the close button
+        :param show_duration_bar: whether the duration bar is shown
+        :param duration_bar_height: height of the duration bar
+        :param minimum_width: minimum width of the toast
+        :param maximum_width: maximum width of the toast
+        :param minimum_height: minimum height of the toast
+        :param maximum_height: maximum height of the toast
+        """
+
+        self.title = title
+        self.text = text
+        self.title_label_text = title if title_label_text is None else title_label_text
+        self.text_label_text = text if text_label_text is None else text_label_text
+        self.title_font = QFont('Arial', 9, QFont.Weight.Bold) if title_font is None else title_font
+        self.text_font = QFont('Arial', 9) if text_font is None else text_font
+        self.margins = QMargins(20, 18, 10, 18) if margins is None else margins
+        self.text_section_margins = QMargins(0, 0, 15, 0) if text_section_margins is None \
+            else text_section_margins
+        self.text_section_spacing = text_section_spacing
+        self.show_icon = show_icon
+        self.icon_size = QSize(18, 18) if icon_size is None else icon_size
+        self.icon_margins = QMargins(0, 0, 15, 0) if icon_margins is None else icon_margins
+        self.icon_section_margins = QMargins(0, 0, 15, 0) if icon_section_margins is None \
+            else icon_section_margins
+        self.icon_separator_width = icon_separator_width
+        self.show_close_button = show_close_button
+        self.close_button_size = QSize(24, 24) if close_button_size is None else close_button_size
+        self.close_button_margins = QMargins(0, -8, 0, -8) if close_button_margins is None \
+            else close_button_margins
+        self.close_button_alignment = close_button_alignment
+        self.show_duration_bar = show_duration_bar
+        self.duration_bar_height = duration_bar_height
+        self.minimum_width = minimum_width
+        self.maximum_width = maximum_width
+        self.minimum_height = minimum_height
+        self.maximum_height = maximum_height
+
+    def __eq__(self, other):
+        if not isinstance(other, ToastLayoutSpec):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+
+class WrappedMeasurement(NamedTuple):
+    """Title and text wrapped at a width and the resulting toast height"""
+
+    title_width: int
+    title_height: int
+    text_width: int
+    text_height: int
+    text_section_height: int
+    height: int
+
+
+class ToastGeometry:
+
+    __slots__ = ('size', 'toast_widget_rect', 'word_wrap', 'icon_position', 'icon_separator_rect',
+                 'title_rect', 'text_rect', 'close_button_position', 'duration_bar_rect')
+
+    def __init__(self, size: QSize, toast_widget_rect: QRect, word_wrap: bool,
+                 icon_position: QPoint | None, icon_separator_rect: QRect | None,
+                 title_rect: QRect, text_rect: QRect, close_button_position: QPoint,
+                 duration_bar_rect: QRect | None):
+        """Create a new ToastGeometry instance (result of a layout computation)
+
+        :param size: size of the toast window including the drop shadow
+        :param toast_widget_rect: rect of the toast widget inside the window
+        :param word_wrap: whether the title and text labels have to word wrap
+        :param icon_position: position of the icon (None if hidden)
+        :param icon_separator_rect: rect of the icon separator (None if hidden)
+        :param title_rect: rect of the title label
+        :param text_rect: rect of the text label
+        :param close_button_position: position of the close button
+        :param duration_bar_rect: rect of the duration bar (None if hidden)
+        """
+
+        self.size = size
+        self.toast_widget_rect = toast_widget_rect
+        self.word_wrap = word_wrap
+        self.icon_position = icon_position
+        self.icon_separator_rect = icon_separator_rect
+        self.title_rect = title_rect
+        self.text_rect = text_rect
+        self.close_button_position = close_button_position
+        self.duration_bar_rect = duration_bar_rect
+
+
+def compute_toast_layout(spec: ToastLayoutSpec, metrics=TextMetricsUtils) -> ToastGeometry:
+    """Calculate the best toast size and the geometry of every child widget
+    (side effect free, the result is applied to the widgets in a single step)
+
+    :param spec: inputs of the layout
+    :param metrics: text measurement provider with get_text_width and get_text_size
+    :return: geometry of the toast
+    """
+
+    # Calculate title and text width and height
+    title_width = metrics.get_text_width(spec.title_font, spec.title_label_text)
+    title_height = metrics.get_text_size(spec.title_font, spec.title_label_text)[1]
+    text_width = metrics.get_text_width(spec.text_font, spec.text_label_text)
+    text_height = metrics.get_text_size(spec.text_font, spec.text_label_text)[1]
+    text_section_spacing = spec.text_section_spacing
+    if spec.title == '' or spec.text == '':
+        text_section_spacing = 0
+
+    text_section_height = (spec.text_section_margins.top()
+                           + title_height + text_section_spacing
+                           + text_height + spec.text_section_margins.bottom())
+
+    # Calculate duration bar height
+    duration_bar_height = spec.duration_bar_height if spec.show_duration_bar else 0
+
+    # Calculate icon section width and height
+    icon_section_width = 0
+    icon_section_height = 0
+
+    if spec.show_icon:
+        icon_section_width = (spec.icon_section_margins.left()
+                              + spec.icon_margins.left() + spec.icon_size.width()
+                              + spec.icon_margins.right() + spec.icon_separator_width
+                              + spec.icon_section_margins.right())
+        icon_section_height = (spec.icon_section_margins.top() + spec.icon_margins.top()
+                               + spec.icon_size.height() + spec.icon_margins.bottom()
+                               + spec.icon_section_margins.bottom())
+
+    # Calculate close button section height
+    close_button_width = spec.close_button_size.width() if spec.show_close_button else 0
+    close_button_height = spec.close_button_size.height() if spec.show_close_button else 0
+    close_button_margins = spec.close_button_margins if spec.show_close_button else QMargins(0, 0, 0, 0)
+
+    close_button_section_height = (close_button_margins.top()
+                                   + close_button_height
+                                   + close_button_margins.bottom())
+
+    # Calculate needed width and height
+    horizontal_extra = (spec.margins.left() + icon_section_width + spec.text_section_margins.left()
+                        + spec.text_section_margins.right() + close_button_margins.left()
+                        + close_button_width + close_button_margins.right() + spec.margins.right())
+    width = horizontal_extra + max(title_width, text_width)
+
+    height = (spec.margins.top()
+              + max(icon_section_height, text_section_height, close_button_section_height)
+              + spec.margins.bottom() + duration_bar_height)
+
+    word_wrap = False
+    forced_additional_height = 0
+    forced_reduced_height = 0
+
+    # Handle width greater than maximum width
+    if width > spec.maximum_width:
+        # Enable line break for title and text and recalculate size
+        word_wrap = True
+        new_title_text_width = max(title_width, text_width) - (width - spec.maximum_width)
+        if new_title_text_width > 0:
+            title_width = new_title_text_width
+            text_width = new_title_text_width
+
+        # Both labels end up as wide as the wider one, so wrap at that width
+        label_width = max(title_width, text_width)
+        if spec.title != '':
+            title_height = metrics.get_text_size(spec.title_font, spec.title_label_text, label_width)[1]
+        if spec.text != '':
+            text_height = metrics.get_text_size(spec.text_font, spec.text_label_text, label_width)[1]
+
+        # Recalculate width and height
+        width = spec.maximum_width
+
+        text_section_height = (spec.text_section_margins.top()
+                               + title_height + text_section_spacing
+                               + text_height + spec.text_section_margins.bottom())
+
+        height = (spec.margins.top()
+                  + max(icon_section_height, text_section_height, close_button_section_height)
+                  + spec.margins.bottom() + duration_bar_height)
+
+    # Handle height less than minimum height
+    if height < spec.minimum_height:
+        # Enable word wrap for title and text labels
+        word_wrap = True
+
+        # Calculate height with initial label width
+        title_width = metrics.get_text_size(spec.title_font, spec.title_label_text, 0)[0]
+        text_width = metrics.get_text_size(spec.text_font, spec.text_label_text, 0)[0]
+        temp_width = max(title_width, text_width)
+
+        title_size = metrics.get_text_size(spec.title_font, spec.title_label_text, temp_width)
+        title_width = title_size[0]
+        if spec.title != '':
+            title_height = title_size[1]
+
+        text_size = metrics.get_text_size(spec.text_font, spec.text_label_text, temp_width)
+        text_width = text_size[0]
+        if spec.text != '':
+            text_height = text_size[1]
+
+        text_section_height = (spec.text_section_margins.top()
+                               + title_height + text_section_spacing
+                               + text_height + spec.text_section_margins.bottom())
+
+        height = (spec.margins.top()
+                  + max(icon_section_height, text_section_height, close_button_section_height)
+                  + spec.margins.bottom() + duration_bar_height)
+
+        # Find the greatest width at which the height is still greater than or equal
+        # to the min height (the wrapped height never grows with the width, so
+        # bisection needs O(log width) measurements instead of one per pixel)
+        if temp_width <= width:
+            measurement = _measure_wrapped(spec, metrics, temp_width, text_section_spacing,
+                                           icon_section_height, close_button_section_height,
+                                           duration_bar_height)
+
+            if measurement.height >= spec.minimum_height:
+                lower_width = temp_width
+                upper_width = width + 1
+
+                while upper_width - lower_width > 1:
+                    middle_width = (lower_width + upper_width) // 2
+                    middle_measurement = _measure_wrapped(spec, metrics, middle_width, text_section_spacing,
+                                                          icon_section_height, close_button_section_height,
+                                                          duration_bar_height)
+                    if middle_measurement.height >= spec.minimum_height:
+                        lower_width = middle_width
+                        measurement = middle_measurement
+                    else:
+                        upper_width = middle_width
+
+                (title_width, title_height, text_width, text_height,
+                 text_section_height, height) = measurement
+
+        # Recalculate width
+        width = horizontal_extra + max(title_width, text_width)
+
+        # If min height not met, set height to min height
+        if height < spec.minimum_height:
+            forced_additional_height = spec.minimum_height - height
+            height = spec.minimum_height
+
+    # Handle width less than minimum width
+    if width < spec.minimum_width:
+        width = spec.minimum_width
+
+    # Handle height greater than maximum height
+    if height > spec.maximum_height:
+        forced_reduced_height = height - spec.maximum_height
+        height = spec.maximum_height
+
+    # Calculate max height of all sections
+    max_section_height = max(icon_section_height, text_section_height, close_button_section_height)
+
+    # Vertical shift caused by a forced min or max height
+    forced_offset = math.ceil(forced_additional_height / 2) - math.floor(forced_reduced_height / 2)
+
+    # Calculate difference between height and height of icon section and text section
+    height_icon_section_height_difference = max_section_height - icon_section_height
+    height_text_section_height_difference = max_section_height - text_section_height
+
+    icon_position = None
+    icon_separator_rect = None
+    label_x = spec.margins.left() + spec.text_section_margins.left()
+
+    if spec.show_icon:
+        icon_position = QPoint(spec.margins.left()
+                               + spec.icon_section_margins.left()
+                               + spec.icon_margins.left(),
+                               spec.margins.top()
+                               + spec.icon_section_margins.top()
+                               + spec.icon_margins.top()
+                               + math.ceil(height_icon_section_height_difference / 2)
+                               + forced_offset)
+
+        icon_separator_rect = QRect(spec.margins.left()
+                                    + spec.icon_section_margins.left()
+                                    + spec.icon_margins.left()
+                                    + spec.icon_size.width()
+                                    + spec.icon_margins.right(),
+                                    spec.margins.top()
+                                    + spec.icon_section_margins.top()
+                                    + math.ceil(height_text_section_height_difference / 2)
+                                    + forced_offset,
+                                    spec.icon_separator_width, text_section_height)
+
+        label_x += icon_section_width
+
+    # Title and text labels have the same width
+    label_width = max(title_width, text_width)
+    title_y = (spec.margins.top() + spec.text_section_margins.top()
+               + math.ceil(height_text_section_height_difference / 2) + forced_offset)
+    text_y = title_y + title_height + spec.text_section_spacing
+
+    # Center the label vertically if either title or text is empty
+    if spec.title == '' and spec.text != '':
+        text_y = int((height - text_height - duration_bar_height) / 2)
+    elif spec.title != '' and spec.text == '':
+        title_y = int((height - title_height - duration_bar_height) / 2)
+
+    # Close button at top, middle, or bottom position
+    close_button_x = width - close_button_width - close_button_margins.right() - spec.margins.right()
+    close_button_y = 0
+    if spec.close_button_alignment == ToastButtonAlignment.TOP:
+        close_button_y = spec.margins.top() + close_button_margins.top()
+    elif spec.close_button_alignment == ToastButtonAlignment.MIDDLE:
+        close_button_y = math.ceil((height - close_button_height - duration_bar_height) / 2)
+    elif spec.close_button_alignment == ToastButtonAlignment.BOTTOM:
+        close_button_y = (height - close_button_height - spec.margins.bottom()
+                          - close_button_margins.bottom() - duration_bar_height)
+
+    duration_bar_rect = None
+    if spec.show_duration_bar:
+        duration_bar_rect = QRect(0, height - duration_bar_height, width, duration_bar_height)
+
+    return ToastGeometry(QSize(width + DROP_SHADOW_SIZE * 2, height + DROP_SHADOW_SIZE * 2),
+                         QRect(DROP_SHADOW_SIZE, DROP_SHADOW_SIZE, width, height), word_wrap,
+                         icon_position, icon_separator_rect,
+                         QRect(label_x, title_y, label_width, title_height),
+                         QRect(label_x, text_y, label_width, text_height),
+                         QPoint(close_button_x, close_button_y), duration_bar_rect)
+
+
+def _measure_wrapped(spec: ToastLayoutSpec, metrics, wrap_width: int, text_section_spacing: int,
+                     icon_section_height: int, close_button_section_height: int,
+                     duration_bar_height: int) -> WrappedMeasurement:
+    """Measure the title and text wrapped at a width
+
+    :param spec: inputs of the layout
+    :param metrics: text measurement provider
+    :param wrap_width: width to wrap the title and text at
+    :param text_section_spacing: spacing between the title and the text
+    :param icon_section_height: height of the icon section
+    :param close_button_section_height: height of the close button section
+    :param duration_bar_height: height of the duration bar
+    :return: measurement of the title, text, text section, and toast
+    """
+
+    title_width, title_height = metrics.get_text_size(spec.title_font, spec.title_label_text, wrap_width)
+    text_width, text_height = metrics.get_text_size(spec.text_font, spec.text_label_text, wrap_width)
+
+    if spec.title == '':
+        title_height = 0
+
+    if spec.text == '':
+        text_height = 0
+
+    text_section_height = (spec.text_section_margins.top()
+                           + title_height + text_section_spacing
+                           + text_height + spec.text_section_margins.bottom())
+
+    height = (spec.margins.top()
+              + max(icon_section_height, text_section_height, close_button_section_height)
+              + spec.margins.bottom() + duration_bar_height)
+
+    return WrappedMeasurement(title_width, title_height, text_width, text_height,
+                              text_section_height, height)
@@ -0,0 +1,106 @@
+import heapq
+
+
+class ToastQueue:
+
+    def __init__(self):
+        """Create a new ToastQueue instance (priority queue that is FIFO within
+        a priority, with O(log n) append and popleft and O(1) remove and membership checks)"""
+
+        # Heap of (-priority, sequence, item) entries. Removed items stay in the heap
+        # until they reach the top and are skipped there, the index only contains live items
+        self.__entries = []
+        self.__index = {}
+        self.__sequence = 0
+
+    def __len__(self):
+        return len(self.__index)
+
+    def __contains__(self, item):
+        return id(item) in self.__index
+
+    def __iter__(self):
+        for negative_priority, sequence, item in sorted(self.__get_live_entries(),
+                                                        key=lambda entry: entry[:2]):
+            yield item
+
+    def append(self, item, priority: int = 0):
+        """Add an item behind all items with the same or a higher priority
+
+        :param item: item to add
+        :param priority: priority of the item (higher is shown first)
+        """
+
+        self.remove(item)
+        self.__sequence += 1
+        self.__index[id(item)] = self.__sequence
+        heapq.heappush(self.__entries, (-priority, self.__sequence, item))
+
+    def popleft(self):
+        """Remove and return the first item of the queue
+        (highest priority, oldest first)
+
+        :return: first item or None if the queue is empty
+        """
+
+        while len(self.__entries) > 0:
+            negative_priority, sequence, item = heapq.heappop(self.__entries)
+            if self.__index.get(id(item)) == sequence:
+                del self.__index[id(item)]
+                return item
+        return None
+
+    def peek(self, count: int) -> list:
+        """Get the first items of the queue without removing them in O(n log count)
+
+        :param count: maximum amount of items
+        :return: list of items (highest priority, oldest first)
+        """
+
+        return [entry[2] for entry in heapq.nsmallest(count, self.__get_live_entries(),
+                                                      key=lambda entry: entry[:2])]
+
+    def pop_lowest(self):
+        """Remove and return the last item of the queue
+        (lowest priority, oldest first) in O(n)
+
+        :return: lowest priority item or None if the queue is empty
+        """
+
+        entries = self.__get_live_entries()
+        if len(entries) == 0:
+            return None
+
+        item = max(entries, key=lambda entry: (entry[0], -entry[1]))[2]
+        self.remove(item)
+        return item
+
+    def remove(self, item) -> bool:
+        """Remove an item from the queue
+
+        :param item: item to remove
+        :return: whether the item was in the queue
+        """
+
+        if self.__index.pop(id(item), None) is None:
+            return False
+
+        # Drop skipped entries once they make up most of the heap
+        if len(self.__entries) > 2 * len(self.__index) + 32:
+            self.__entries = self.__get_live_entries()
+            heapq.heapify(self.__entries)
+        return True
+
+    def clear(self):
+        """Remove all items from the queue"""
+
+        self.__entries.clear()
+        self.__index.clear()
+
+    def __get_live_entries(self) -> list:
+        """Get all heap entries of items that have not been removed
+
+        :return: list of entries (not ordered)
+        """
+
+        return [entry for entry in self.__entries if self.__index.get(id(entry[2])) == entry[1]]
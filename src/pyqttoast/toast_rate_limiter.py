@@ -0,0 +1,106 @@
+import time
+from qtpy.QtCore import QObject, Signal
+
+
+# Default category of get_suppressed_count (None is the category of uncategorized toasts)
+_ALL_CATEGORIES = object()
+
+
+class ToastRateLimiter(QObject):
+
+    # Suppressed event (category and total amount of suppressed toasts in that category)
+    suppressed = Signal(object, int)
+
+    def __init__(self, rate: float = 0, burst: int = 1):
+        """Create a new ToastRateLimiter instance (token bucket per category)
+
+        :param rate: tokens refilled per second (0 to disable rate limiting)
+        :param burst: maximum amount of tokens that can be saved up
+        """
+
+        super(ToastRateLimiter, self).__init__()
+
+        self.__rate = rate
+        self.__burst = burst
+
+        # Category -> [available tokens, time of the last refill]
+        self.__buckets = {}
+        self.__suppressed_counts = {}
+
+    def acquire(self, category, now: float = None) -> bool:
+        """Take a token from the bucket of a category
+        (emits the suppressed signal if there is none left)
+
+        :param category: hashable category (e.g. a preset or a channel name)
+        :param now: current monotonic time in seconds (defaults to time.monotonic())
+        :return: whether a token was available
+        """
+
+        if self.__rate <= 0:
+            return True
+
+        if now is None:
+            now = time.monotonic()
+
+        bucket = self.__buckets.get(category)
+        if bucket is None:
+            bucket = [self.__burst, now]
+            self.__buckets[category] = bucket
+        else:
+            bucket[0] = min(self.__burst, bucket[0] + (now - bucket[1]) * self.__rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return True
+
+        suppressed_count = self.__suppressed_counts.get(category, 0) + 1
+        self.__suppressed_counts[category] = suppressed_count
+        self.suppressed.emit(category, suppressed_count)
+        return False
+
+    def get_rate(self) -> float:
+        """Get the amount of tokens refilled per second
+
+        :return: refill rate (0 if rate limiting is disabled)
+        """
+
+        return self.__rate
+
+    def get_burst(self) -> int:
+        """Get the maximum amount of tokens that can be saved up
+
+        :return: burst size
+        """
+
+        return self.__burst
+
+    def set_limit(self, rate: float, burst: int):
+        """Set the refill rate and burst size (resets all buckets)
+
+        :param rate: tokens refilled per second (0 to disable rate limiting)
+        :param burst: maximum amount of tokens that can be saved up
+        """
+
+        self.__rate = rate
+        self.__burst = max(1, burst)
+        self.__buckets.clear()
+
+    def get_suppressed_count(self, category=_ALL_CATEGORIES) -> int:
+        """Get the amount of suppressed toasts
+
+        :param category: category to get the count of (all categories if not given)
+        :return: amount of suppressed toasts
+        """
+
+        if category is _ALL_CATEGORIES:
+            return sum(self.__suppressed_counts.values())
+        return self.__suppressed_counts.get(category, 0)
+
+    def reset(self):
+        """Disable rate limiting and clear all buckets and counts"""
+
+        self.__rate = 0
+        self.__burst = 1
+        self.__buckets.clear()
+        self.__suppressed_counts.clear()
@@ -0,0 +1,66 @@
+from qtpy.QtGui import QPixmap, QColor
+from qtpy.QtWidgets import QWidget
+from .toast_enums import ToastPreset, ToastIcon
+
+
+class ToastSpec:
+
+    # Only data, so that queued specs take up as little memory as possible
+    __slots__ = ('parent', 'title', 'text', 'duration', 'preset', 'icon', 'show_icon',
+                 'background_color', 'title_color', 'text_color', 'icon_color',
+                 'duration_bar_color', 'deduplication_key', 'duplicate_count',
+                 'rate_limit_category', 'priority', 'queue_time_to_live', 'queue_deadline')
+
+    def __init__(self, parent: QWidget = None, title: str = '', text: str = '',
+                 duration: int = None, preset: ToastPreset = None,
+                 icon: QPixmap | ToastIcon = None, show_icon: bool = None,
+                 background_color: QColor = None, title_color: QColor = None,
+                 text_color: QColor = None, icon_color: QColor = None,
+                 duration_bar_color: QColor = None, deduplication_key=None,
+                 rate_limit_category=None, priority: int = 0, queue_time_to_live: int = 0):
+        """Create a new ToastSpec instance (a lightweight description of a toast
+        that is only turned into a widget once it can be shown)
+
+        :param parent: the parent widget of the toast
+        :param title: title of the toast
+        :param text: text of the toast
+        :param duration: duration in milliseconds (None for the default)
+        :param preset: style preset that is applied before the other options
+        :param icon: icon of the toast (None for the default)
+        :param show_icon: whether the icon should be shown (None for the default)
+        :param background_color: background color (None for the default)
+        :param title_color: title color (None for the default)
+        :param text_color: text color (None for the default)
+        :param icon_color: icon color (None for the default)
+        :param duration_bar_color: duration bar color (None for the default)
+        :param deduplication_key: key identifying duplicates
+            (None to use the title, text, and preset)
+        :param rate_limit_category: category the rate limit is applied to
+            (None to use the preset)
+        :param priority: queue priority (higher is shown first)
+        :param queue_time_to_live: maximum time in milliseconds the spec
+            may stay queued before it expires (0 for unlimited)
+        """
+
+        self.parent = parent
+        self.title = title
+        self.text = text
+        self.duration = duration
+        self.preset = preset
+        self.icon = icon
+        self.show_icon = show_icon
+        self.background_color = background_color
+        self.title_color = title_color
+        self.text_color = text_color
+        self.icon_color = icon_color
+        self.duration_bar_color = duration_bar_color
+        self.deduplication_key = deduplication_key
+        self.rate_limit_category = rate_limit_category
+        self.priority = priority
+        self.queue_time_to_live = queue_time_to_live
+
+        # Amount of duplicates coalesced into this spec while it was queued
+        self.duplicate_count = 1
+
+        # Monotonic time in seconds at which the spec expires while queued
+        self.queue_deadline = None
@@ -1,5 +1,6 @@
 import os
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QPixmap, QImage, QColor
 from src.pyqttoast import ToastIcon
 from src.pyqttoast.icon_utils import IconUtils
 
@@ -21,3 +22,106 @@ def test_get_icon_from_enum(qtbot):
     assert IconUtils.get_icon_from_enum(ToastIcon.WARNING).toImage() == warning_image
     assert IconUtils.get_icon_from_enum(ToastIcon.ERROR).toImage() == error_image
     assert IconUtils.get_icon_from_enum(ToastIcon.CLOSE).toImage() == close_image
+
+
+def test_recolor_image(qtbot):
+    """Test recoloring an image while keeping the alpha of every pixel"""
+
+    image = QImage(4, 4, QImage.Format.Format_ARGB32)
+    image.fill(QColor(10, 20, 30, 0))
+    image.setPixelColor(1, 1, QColor(10, 20, 30, 255))
+    image.setPixelColor(2, 2, QColor(10, 20, 30, 128))
+
+    recolored_image = IconUtils.recolor_image(image, QColor('#BA2626'))
+
+    assert recolored_image.pixelColor(1, 1) == QColor(186, 38, 38, 255)
+    assert recolored_image.pixelColor(2, 2).alpha() == 128
+    assert recolored_image.pixelColor(0, 0).alpha() == 0
+    assert image.pixelColor(1, 1) == QColor(10, 20, 30, 255)
+
+
+def test_recolor_pixmap(qtbot):
+    """Test recoloring a pixmap"""
+
+    pixmap = IconUtils.get_icon_from_enum(ToastIcon.SUCCESS)
+    recolored_pixmap = IconUtils.recolor_pixmap(pixmap, QColor('#007FFF'))
+    recolored_image = recolored_pixmap.toImage()
+    original_image = pixmap.toImage()
+
+    assert recolored_pixmap.size() == pixmap.size()
+    for x in range(0, original_image.width(), 7):
+        for y in range(0, original_image.height(), 7):
+            assert recolored_image.pixelColor(x, y).alpha() == original_image.pixelColor(x, y).alpha()
+            if original_image.pixelColor(x, y).alpha() == 255:
+                assert recolored_image.pixelColor(x, y).rgb() == QColor('#007FFF').rgb()
+
+
+
+def test_recolor_null(qtbot, qtlog):
+    """Test that recoloring a null image or pixmap does not try to paint on it"""
+
+    assert IconUtils.recolor_image(QImage(), QColor('#007FFF')).isNull()
+    assert IconUtils.recolor_pixmap(QPixmap(), QColor('#007FFF')).isNull()
+    assert IconUtils.get_recolored_pixmap(QPixmap(), QSize(18, 18), QColor('#007FFF')).isNull()
+    assert [record.message for record in qtlog.records if 'QPainter' in record.message] == []
+
+
+def test_get_recolored_pixmap(qtbot):
+    """Test getting recolored pixmaps from the shared cache"""
+
+    cache = IconUtils.get_pixmap_cache()
+    cache.clear()
+    icon = IconUtils.get_icon_from_enum(ToastIcon.ERROR)
+
+    pixmap_1 = IconUtils.get_recolored_pixmap(icon, QSize(18, 18), QColor('#BA2626'))
+    pixmap_2 = IconUtils.get_recolored_pixmap(icon, QSize(18, 18), QColor('#BA2626'))
+    pixmap_3 = IconUtils.get_recolored_pixmap(icon, QSize(18, 18), QColor('#3E9141'))
+
+    assert pixmap_1.cacheKey() == pixmap_2.cacheKey()
+    assert pixmap_1.cacheKey() != pixmap_3.cacheKey()
+    assert cache.get_hits() == 1
+    assert cache.get_misses() == 2
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get_hits() == 0
+    assert cache.get_misses() == 0
+
+
+def test_get_recolored_pixmap_device_pixel_ratio(qtbot):
+    """Test that recolored pixmaps are created and cached for a device pixel ratio"""
+
+    cache = IconUtils.get_pixmap_cache()
+    cache.clear()
+    icon = IconUtils.get_icon_from_enum(ToastIcon.ERROR)
+
+    pixmap_1 = IconUtils.get_recolored_pixmap(icon, QSize(18, 18), QColor('#BA2626'), 1.0)
+    pixmap_2 = IconUtils.get_recolored_pixmap(icon, QSize(18, 18), QColor('#BA2626'), 2.0)
+
+    assert pixmap_1.devicePixelRatio() == 1.0
+    assert pixmap_1.size() == QSize(18, 18)
+    assert pixmap_2.devicePixelRatio() == 2.0
+    assert pixmap_2.size() == QSize(36, 36)
+    assert pixmap_1.cacheKey() != pixmap_2.cacheKey()
+    assert cache.get_misses() == 2
+    assert len(cache) == 2
+
+    assert IconUtils.get_recolored_pixmap(icon, QSize(18, 18), QColor('#BA2626'), 2.0).cacheKey() \
+        == pixmap_2.cacheKey()
+    assert cache.get_hits() == 1
+
+
+def test_get_icon_from_enum_shared(qtbot):
+    """Test that bundled icons are only decoded once and shared"""
+
+    IconUtils.preload_icons()
+    icon_1 = IconUtils.get_icon_from_enum(ToastIcon.WARNING)
+    icon_2 = IconUtils.get_icon_from_enum(ToastIcon.WARNING)
+
+    assert icon_1.cacheKey() == icon_2.cacheKey()
+
+    # Modifying a returned icon must not change the shared one
+    icon_1.fill(QColor('#000000'))
+    assert icon_1.cacheKey() != icon_2.cacheKey()
+    assert IconUtils.get_icon_from_enum(ToastIcon.WARNING).cacheKey() == icon_2.cacheKey()
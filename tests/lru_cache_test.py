@@ -0,0 +1,32 @@
+from src.pyqttoast.lru_cache import LRUCache
+
+
+def test_lru_cache_eviction():
+    """Test that the least recently used entry is evicted first"""
+
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.get('b') is None
+    assert cache.get_hits() == 1
+    assert cache.get_misses() == 1
+
+
+def test_lru_cache_set_maximum_size():
+    """Test shrinking the maximum size of a cache"""
+
+    cache = LRUCache(3)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('c', 3)
+    cache.set_maximum_size(1)
+
+    assert len(cache) == 1
+    assert cache.get_maximum_size() == 1
+    assert cache.get('c') == 3
@@ -0,0 +1,54 @@
+import os
+import importlib.util
+from unittest.mock import patch
+from PyQt6.QtGui import QPixmap
+from src.pyqttoast.resource_utils import ResourceUtils, RESOURCE_FILES
+
+
+ROOT_PATH = os.path.abspath(os.curdir)
+
+
+def test_read_resources():
+    """Test reading bundled resources"""
+
+    with open(ROOT_PATH + '/src/pyqttoast/css/toast.css', 'r') as file:
+        assert ResourceUtils.read_text('css/toast.css') == file.read()
+
+    with open(ROOT_PATH + '/src/pyqttoast/icons/close.png', 'rb') as file:
+        assert ResourceUtils.read_binary('icons/close.png') == file.read()
+
+
+def test_compile_resources(qtbot, tmp_path):
+    """Test compiling the bundled resources into an importable module"""
+
+    output_path = ResourceUtils.compile_resources(str(tmp_path / 'compiled_resources.py'))
+
+    spec = importlib.util.spec_from_file_location('compiled_resources', output_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert sorted(module.RESOURCES.keys()) == sorted(RESOURCE_FILES)
+    for path in RESOURCE_FILES:
+        with open(ROOT_PATH + '/src/pyqttoast/' + path, 'rb') as file:
+            assert module.RESOURCES[path] == file.read()
+
+    pixmap = QPixmap()
+    assert pixmap.loadFromData(module.RESOURCES['icons/success.png'])
+    assert pixmap.toImage() == QPixmap(ROOT_PATH + '/src/pyqttoast/icons/success.png').toImage()
+
+
+def test_get_stylesheet():
+    """Test that stylesheets are only read once until the cache is cleared"""
+
+    ResourceUtils.clear_stylesheet_cache()
+    stylesheet = ResourceUtils.get_stylesheet('css/toast.css')
+
+    with patch.object(ResourceUtils, 'read_text', return_value='') as read_text:
+        assert ResourceUtils.get_stylesheet('css/toast.css') == stylesheet
+        assert read_text.call_count == 0
+
+        ResourceUtils.clear_stylesheet_cache()
+        assert ResourceUtils.get_stylesheet('css/toast.css') == ''
+        assert read_text.call_count == 1
+
+    ResourceUtils.clear_stylesheet_cache()
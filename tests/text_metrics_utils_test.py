@@ -0,0 +1,42 @@
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QFont, QFontMetrics
+from src.pyqttoast.text_metrics_utils import TextMetricsUtils
+
+
+def test_get_text_width(qtbot):
+    """Test measuring the width of a single line of text"""
+
+    font = QFont('Arial', 9)
+
+    assert TextMetricsUtils.get_text_width(font, 'Some text') == QFontMetrics(font).horizontalAdvance('Some text')
+
+
+def test_get_text_size(qtbot):
+    """Test measuring the bounding rect of a text with and without word wrap"""
+
+    font = QFont('Arial', 9, QFont.Weight.Bold)
+    text = 'Some longer text that has to be wrapped'
+    rect = QFontMetrics(font).boundingRect(text)
+    wrapped_rect = QFontMetrics(font).boundingRect(QRect(0, 0, 60, 0), Qt.TextFlag.TextWordWrap, text)
+
+    assert TextMetricsUtils.get_text_size(font, text) == (rect.width(), rect.height())
+    assert TextMetricsUtils.get_text_size(font, text, 60) == (wrapped_rect.width(), wrapped_rect.height())
+
+
+def test_metrics_cache(qtbot):
+    """Test that identical measurements are only made once"""
+
+    cache = TextMetricsUtils.get_metrics_cache()
+    cache.clear()
+    font = QFont('Arial', 9)
+
+    size = TextMetricsUtils.get_text_size(font, 'cached', 100)
+    assert TextMetricsUtils.get_text_size(QFont('Arial', 9), 'cached', 100) == size
+    assert cache.get_misses() == 1
+    assert cache.get_hits() == 1
+
+    # Different fonts and wrap widths are measured separately
+    TextMetricsUtils.get_text_size(QFont('Arial', 12), 'cached', 100)
+    TextMetricsUtils.get_text_size(font, 'cached', 50)
+    assert cache.get_misses() == 3
+    assert len(cache) == 3
@@ -0,0 +1,141 @@
+from PyQt6.QtCore import QMargins, QSize
+from src.pyqttoast import Toast, ToastButtonAlignment
+from src.pyqttoast.toast_layout import ToastLayoutSpec, compute_toast_layout, _measure_wrapped
+from src.pyqttoast.text_metrics_utils import TextMetricsUtils
+from src.pyqttoast.constants import DROP_SHADOW_SIZE
+
+
+class FixedMetrics:
+    """Measures every character as 10x10 pixels and wraps at any character"""
+
+    @staticmethod
+    def get_text_width(font, text):
+        return len(text) * 10
+
+    @staticmethod
+    def get_text_size(font, text, wrap_width=None):
+        if text == '':
+            return 0, 0
+        if wrap_width is None or wrap_width >= len(text) * 10:
+            return len(text) * 10, 10
+        characters_per_line = max(1, wrap_width // 10)
+        lines = -(-len(text) // characters_per_line)
+        return characters_per_line * 10, lines * 10
+
+
+def test_compute_layout(qtbot):
+    """Test the geometry of a toast that fits on a single line"""
+
+    spec = ToastLayoutSpec(title='Title', text='Some text', margins=QMargins(10, 10, 10, 10),
+                           text_section_margins=QMargins(0, 0, 0, 0), text_section_spacing=5,
+                           show_icon=False, show_close_button=False, duration_bar_height=4)
+    geometry = compute_toast_layout(spec, FixedMetrics)
+
+    assert not geometry.word_wrap
+    assert geometry.toast_widget_rect.size() == QSize(10 + 90 + 10, 10 + 25 + 10 + 4)
+    assert geometry.size == QSize(110 + DROP_SHADOW_SIZE * 2, 49 + DROP_SHADOW_SIZE * 2)
+    assert geometry.icon_position is None
+    assert geometry.icon_separator_rect is None
+    assert (geometry.title_rect.x(), geometry.title_rect.y()) == (10, 10)
+    assert geometry.title_rect.size() == geometry.text_rect.size() == QSize(90, 10)
+    assert geometry.text_rect.y() == 25
+    assert geometry.duration_bar_rect.y() == 45
+    assert geometry.duration_bar_rect.width() == 110
+
+
+def test_compute_layout_maximum_width(qtbot):
+    """Test that the title and text wrap if the toast is wider than the maximum width"""
+
+    spec = ToastLayoutSpec(title='Title', text='x' * 20, margins=QMargins(0, 0, 0, 0),
+                           text_section_margins=QMargins(0, 0, 0, 0), text_section_spacing=0,
+                           show_icon=False, show_close_button=False, show_duration_bar=False,
+                           maximum_width=100)
+    geometry = compute_toast_layout(spec, FixedMetrics)
+
+    assert geometry.word_wrap
+    assert geometry.toast_widget_rect.size() == QSize(100, 10 + 20)
+    assert geometry.text_rect.size() == QSize(100, 20)
+    assert geometry.duration_bar_rect is None
+
+
+def scan_minimum_height_width(spec, metrics, unwrapped_width):
+    """Find the wrapped title and text for the minimum height by growing the
+    wrap width pixel by pixel (the way the layout did it before bisection)"""
+
+    text_section_spacing = 0 if spec.title == '' or spec.text == '' else spec.text_section_spacing
+    close_button_section_height = (spec.close_button_margins.top() + spec.close_button_size.height()
+                                   + spec.close_button_margins.bottom()) if spec.show_close_button else 0
+    duration_bar_height = spec.duration_bar_height if spec.show_duration_bar else 0
+
+    wrap_width = max(metrics.get_text_size(spec.title_font, spec.title, 0)[0],
+                     metrics.get_text_size(spec.text_font, spec.text, 0)[0])
+    measurement = _measure_wrapped(spec, metrics, wrap_width, text_section_spacing, 0,
+                                   close_button_section_height, duration_bar_height)
+
+    while wrap_width + 1 <= unwrapped_width:
+        next_measurement = _measure_wrapped(spec, metrics, wrap_width + 1, text_section_spacing, 0,
+                                            close_button_section_height, duration_bar_height)
+        if next_measurement.height < spec.minimum_height:
+            break
+        measurement = next_measurement
+        wrap_width += 1
+
+    return measurement
+
+
+def test_compute_layout_minimum_height(qtbot):
+    """Test that bisecting the wrap width for the minimum height gives
+    the same result as growing the width pixel by pixel"""
+
+    texts = ['x' * 40, 'Some text that is long enough to be wrapped over several lines',
+             ' '.join('word{}'.format(i) for i in range(60))]
+
+    for metrics in (FixedMetrics, TextMetricsUtils):
+        for text in texts:
+            unwrapped = compute_toast_layout(ToastLayoutSpec(title='Title', text=text), metrics)
+            unwrapped_width = unwrapped.toast_widget_rect.width()
+            unwrapped_height = unwrapped.toast_widget_rect.height()
+
+            for additional_height in (1, 15, 40, 120, 1000):
+                minimum_height = unwrapped_height + additional_height
+                spec = ToastLayoutSpec(title='Title', text=text, minimum_height=minimum_height)
+                geometry = compute_toast_layout(spec, metrics)
+                measurement = scan_minimum_height_width(spec, metrics, unwrapped_width)
+                label_width = max(measurement.title_width, measurement.text_width)
+
+                assert geometry.word_wrap
+                assert geometry.title_rect.size() == QSize(label_width, measurement.title_height)
+                assert geometry.text_rect.size() == QSize(label_width, measurement.text_height)
+                assert geometry.toast_widget_rect.height() == max(measurement.height, minimum_height)
+
+
+def test_compute_layout_close_button_alignment(qtbot):
+    """Test the close button position for every alignment"""
+
+    positions = []
+    for alignment in [ToastButtonAlignment.TOP, ToastButtonAlignment.MIDDLE, ToastButtonAlignment.BOTTOM]:
+        spec = ToastLayoutSpec(title='Title', text='Text', close_button_alignment=alignment,
+                               minimum_height=100)
+        geometry = compute_toast_layout(spec, FixedMetrics)
+        assert geometry.close_button_position.x() == geometry.toast_widget_rect.width() - 24 - 10
+        positions.append(geometry.close_button_position.y())
+
+    assert positions[0] < positions[1] < positions[2]
+
+
+def test_layout_matches_toast(qtbot):
+    """Test that a shown toast uses the computed geometry"""
+
+    toast = Toast()
+    qtbot.addWidget(toast)
+    toast.setTitle('Title')
+    toast.setText('A longer text that has to be wrapped because of the maximum width')
+    toast.setMaximumWidth(250)
+    toast.setAutoDelete(False)
+    toast.show()
+
+    spec = ToastLayoutSpec(title='Title', text=toast.getText(), maximum_width=250)
+    geometry = compute_toast_layout(spec, TextMetricsUtils)
+
+    assert toast.size() == geometry.size
+    toast.hide()
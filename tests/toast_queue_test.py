@@ -0,0 +1,89 @@
+from src.pyqttoast.toast_queue import ToastQueue
+
+
+class Item:
+    pass
+
+
+def test_fifo_order():
+    """Test that items are dequeued in the order they were added"""
+
+    queue = ToastQueue()
+    items = [Item() for i in range(5)]
+    for item in items:
+        queue.append(item)
+
+    assert len(queue) == 5
+    assert list(queue) == items
+    assert [queue.popleft() for i in range(5)] == items
+    assert queue.popleft() is None
+    assert len(queue) == 0
+
+
+def test_remove():
+    """Test removing items from the middle of the queue"""
+
+    queue = ToastQueue()
+    items = [Item() for i in range(100)]
+    for item in items:
+        queue.append(item)
+
+    for item in items[:90]:
+        assert queue.remove(item) == True
+    assert queue.remove(items[0]) == False
+
+    assert items[0] not in queue
+    assert items[95] in queue
+    assert len(queue) == 10
+    assert list(queue) == items[90:]
+    assert queue.popleft() is items[90]
+
+
+def test_append_twice():
+    """Test that adding an item again moves it to the end of the queue"""
+
+    queue = ToastQueue()
+    item_1 = Item()
+    item_2 = Item()
+    queue.append(item_1)
+    queue.append(item_2)
+    queue.append(item_1)
+
+    assert len(queue) == 2
+    assert list(queue) == [item_2, item_1]
+
+
+def test_priority():
+    """Test that items with a higher priority are dequeued first (FIFO within a priority)"""
+
+    queue = ToastQueue()
+    low_1, low_2, high_1, high_2, normal = [Item() for i in range(5)]
+    queue.append(low_1, -1)
+    queue.append(normal)
+    queue.append(high_1, 5)
+    queue.append(low_2, -1)
+    queue.append(high_2, 5)
+
+    assert list(queue) == [high_1, high_2, normal, low_1, low_2]
+    assert queue.pop_lowest() is low_1
+    assert queue.popleft() is high_1
+    queue.remove(high_2)
+    assert [queue.popleft() for i in range(3)] == [normal, low_2, None]
+    assert queue.pop_lowest() is None
+
+
+def test_peek():
+    """Test getting the first items without removing them"""
+
+    queue = ToastQueue()
+    low, normal_1, normal_2, high = [Item() for i in range(4)]
+    queue.append(low, -1)
+    queue.append(normal_1)
+    queue.append(high, 1)
+    queue.append(normal_2)
+    queue.remove(normal_1)
+
+    assert queue.peek(2) == [high, normal_2]
+    assert queue.peek(10) == [high, normal_2, low]
+    assert queue.peek(0) == []
+    assert len(queue) == 3
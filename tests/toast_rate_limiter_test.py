@@ -0,0 +1,55 @@
+from src.pyqttoast.toast_rate_limiter import ToastRateLimiter
+
+
+def test_disabled():
+    """Test that a rate of 0 never suppresses anything"""
+
+    rate_limiter = ToastRateLimiter()
+
+    assert all(rate_limiter.acquire('category', now=0) for i in range(1000))
+    assert rate_limiter.get_suppressed_count() == 0
+
+
+def test_burst_and_refill():
+    """Test that a burst is allowed and tokens are refilled over time"""
+
+    rate_limiter = ToastRateLimiter(rate=2, burst=3)
+    suppressed = []
+    rate_limiter.suppressed.connect(lambda category, count: suppressed.append((category, count)))
+
+    assert [rate_limiter.acquire('a', now=10) for i in range(4)] == [True, True, True, False]
+    assert suppressed == [('a', 1)]
+
+    # Half a second refills one token
+    assert rate_limiter.acquire('a', now=10.5) == True
+    assert rate_limiter.acquire('a', now=10.5) == False
+
+    # Refill is capped at the burst size
+    assert [rate_limiter.acquire('a', now=100) for i in range(4)] == [True, True, True, False]
+    assert rate_limiter.get_suppressed_count('a') == 3
+
+
+def test_categories():
+    """Test that every category has its own bucket"""
+
+    rate_limiter = ToastRateLimiter()
+    rate_limiter.set_limit(1, 1)
+
+    assert rate_limiter.acquire('a', now=0) == True
+    assert rate_limiter.acquire('a', now=0) == False
+    assert rate_limiter.acquire('b', now=0) == True
+    assert rate_limiter.acquire(None, now=0) == True
+    assert rate_limiter.acquire(None, now=0) == False
+    assert rate_limiter.acquire(None, now=0) == False
+    assert rate_limiter.get_suppressed_count('a') == 1
+    assert rate_limiter.get_suppressed_count('b') == 0
+
+    # None is the category of uncategorized toasts, not all categories
+    assert rate_limiter.get_suppressed_count(None) == 2
+    assert rate_limiter.get_suppressed_count() == 3
+    assert rate_limiter.get_rate() == 1
+    assert rate_limiter.get_burst() == 1
+
+    rate_limiter.reset()
+    assert rate_limiter.get_rate() == 0
+    assert rate_limiter.get_suppressed_count() == 0
@@ -1,10 +1,14 @@
+import gc
 import os
 import pytest
 from unittest.mock import patch
-from PyQt6.QtWidgets import QMainWindow
-from PyQt6.QtCore import QSize, QMargins, Qt, QRect
+from PyQt6.QtWidgets import QMainWindow, QApplication, QWidget, QPushButton
+from PyQt6.QtCore import (QSize, QMargins, Qt, QRect, QPoint, QCoreApplication, QEvent,
+                          QAbstractAnimation)
 from PyQt6.QtGui import QColor, QFont, QGuiApplication, QPixmap
-from src.pyqttoast import Toast, ToastPosition, ToastButtonAlignment, ToastPreset, ToastIcon
+from src.pyqttoast import (Toast, ToastPosition, ToastButtonAlignment, ToastPreset, ToastIcon,
+                           ToastQueueOverflowPolicy, ToastRenderMode, ToastSpec)
+from src.pyqttoast.toast_layout import compute_toast_layout
 from src.pyqttoast.constants import DROP_SHADOW_SIZE
 
 
@@ -52,6 +56,8 @@ def test_initial_values(qtbot):
     assert toast.getFadeInDuration() == 250
     assert toast.getFadeOutDuration() == 250
     assert toast.isResetDurationOnHover() == True
+    assert toast.isPauseDurationOnHover() == False
+    assert toast.getRemainingTime() == 5000
     assert toast.isStayOnTop() == True
     assert toast.getBorderRadius() == 0
     assert toast.getBackgroundColor() == QColor('#E7F4F9')
@@ -268,6 +274,142 @@ def test_set_maximum_on_screen_while_toasts_are_shown(qtbot):
     assert toast_5.isVisible() == False
 
 
+def create_queue_overflow_toasts(qtbot, count: int):
+    """Create toasts with different titles for the queue overflow tests"""
+
+    toasts = []
+    for i in range(count):
+        toast = Toast()
+        toast.setTitle('toast {}'.format(i))
+        qtbot.addWidget(toast)
+        toasts.append(toast)
+    return toasts
+
+
+def test_set_maximum_queued_drop_oldest(qtbot):
+    """Test dropping the oldest queued toast if the queue is full"""
+
+    Toast.setMaximumOnScreen(1)
+    Toast.setMaximumQueued(2)
+    toasts = create_queue_overflow_toasts(qtbot, 5)
+    dropped = []
+    toasts[1].dropped.connect(lambda: dropped.append(1))
+    toasts[2].dropped.connect(lambda: dropped.append(2))
+
+    for toast in toasts:
+        toast.show()
+
+    assert Toast.getMaximumQueued() == 2
+    assert Toast.isQueueFull() == True
+    assert Toast.getQueuedCount() == 2
+    assert Toast.getDroppedCount() == 2
+    assert dropped == [1, 2]
+
+
+def test_set_maximum_queued_drop_newest(qtbot):
+    """Test dropping new toasts if the queue is full"""
+
+    Toast.setMaximumOnScreen(1)
+    Toast.setMaximumQueued(2)
+    Toast.setQueueOverflowPolicy(ToastQueueOverflowPolicy.DROP_NEWEST)
+    toasts = create_queue_overflow_toasts(qtbot, 5)
+    dropped = []
+    toasts[4].dropped.connect(lambda: dropped.append(4))
+
+    for toast in toasts:
+        toast.show()
+
+    assert Toast.getQueueOverflowPolicy() == ToastQueueOverflowPolicy.DROP_NEWEST
+    assert Toast.getQueuedCount() == 2
+    assert Toast.getDroppedCount() == 2
+    assert dropped == [4]
+
+
+def test_set_maximum_queued_coalesce(qtbot):
+    """Test dropping new toasts that are identical to a queued one"""
+
+    Toast.setMaximumOnScreen(1)
+    Toast.setMaximumQueued(2)
+    Toast.setQueueOverflowPolicy(ToastQueueOverflowPolicy.COALESCE)
+    toasts = create_queue_overflow_toasts(qtbot, 4)
+    toasts[3].setTitle('toast 1')
+    dropped = []
+    toasts[3].dropped.connect(lambda: dropped.append(3))
+
+    for toast in toasts:
+        toast.show()
+
+    assert Toast.getQueuedCount() == 2
+    assert Toast.getDroppedCount() == 1
+    assert dropped == [3]
+
+
+def test_set_maximum_queued_block(qtbot):
+    """Test rejecting new toasts without dropping them if the queue is full"""
+
+    Toast.setMaximumOnScreen(1)
+    Toast.setMaximumQueued(1)
+    Toast.setQueueOverflowPolicy(ToastQueueOverflowPolicy.BLOCK)
+    toasts = create_queue_overflow_toasts(qtbot, 3)
+    rejected = []
+    toasts[2].rejected.connect(lambda: rejected.append(2))
+
+    for toast in toasts:
+        toast.show()
+
+    assert Toast.getQueuedCount() == 1
+    assert Toast.getDroppedCount() == 0
+    assert Toast.getRejectedCount() == 1
+    assert rejected == [2]
+
+    # Rejected toast specs are counted too
+    assert Toast.showSpec(ToastSpec(title='toast 3')) is None
+    assert Toast.getRejectedCount() == 2
+
+    # Rejected toast can be shown once the queue has space
+    Toast.setMaximumOnScreen(3)
+    toasts[2].show()
+    assert toasts[2].isVisible() == True
+
+
+def test_set_maximum_queued_block_duplicate(qtbot):
+    """Test that a rejected toast is neither coalesced with later duplicates
+    nor uses up a rate limit token"""
+
+    Toast.setMaximumOnScreen(1)
+    Toast.setMaximumQueued(1)
+    Toast.setQueueOverflowPolicy(ToastQueueOverflowPolicy.BLOCK)
+    Toast.setDeduplicationEnabled(True)
+    Toast.setRateLimit(0.001, 3)
+    toasts = create_queue_overflow_toasts(qtbot, 3)
+    toasts[0].setAutoDelete(False)
+    toasts[0].setFadeOutDuration(0)
+
+    for toast in toasts:
+        toast.show()
+
+    # A duplicate of the rejected toast is rejected as well instead of being coalesced
+    duplicate = Toast()
+    qtbot.addWidget(duplicate)
+    duplicate.setTitle('toast 2')
+    duplicate.setFadeInDuration(0)
+    duplicate.show()
+    assert Toast.getRejectedCount() == 2
+    assert toasts[2].getDuplicateCount() == 1
+    assert Toast.getSuppressedCount() == 0
+
+    # Once there is space, the duplicate is shown with the token the rejections did not use
+    toasts[0].hide()
+    qtbot.waitUntil(lambda: Toast.getQueuedCount() == 0, timeout=1000)
+    duplicate.show()
+    assert Toast.getQueuedCount() == 1
+    assert Toast.getSuppressedCount() == 0
+
+    Toast.setMaximumOnScreen(2)
+    assert duplicate.isVisible() == True
+    assert duplicate.getDuplicateCount() == 1
+
+
 def test_set_spacing(qtbot):
     """Test setting the spacing of the toasts"""
 
@@ -521,6 +663,12 @@ def test_reset(qtbot):
     Toast.setAlwaysOnMainScreen(True)
     Toast.setFixedScreen(QGuiApplication.primaryScreen())
     Toast.setPosition(ToastPosition.CENTER)
+    Toast.setDurationBarMaximumUpdateRate(20)
+    Toast.setPaused(True)
+    Toast.setPauseWhenInactive(True)
+    Toast.setMaximumQueued(5)
+    Toast.setQueueOverflowPolicy(ToastQueueOverflowPolicy.BLOCK)
+    Toast.setPoolingEnabled(True)
 
     toast = Toast()
     qtbot.addWidget(toast)
@@ -535,6 +683,15 @@ def test_reset(qtbot):
     assert Toast.isAlwaysOnMainScreen() == False
     assert Toast.getFixedScreen() is None
     assert Toast.getPosition() == ToastPosition.BOTTOM_RIGHT
+    assert Toast.getDurationBarMaximumUpdateRate() == 60
+    assert Toast.isPaused() == False
+    assert Toast.isPauseWhenInactive() == False
+    assert Toast.getMaximumQueued() == 0
+    assert Toast.getQueueOverflowPolicy() == ToastQueueOverflowPolicy.DROP_OLDEST
+    assert Toast.getDroppedCount() == 0
+    assert Toast.getRejectedCount() == 0
+    assert Toast.isPoolingEnabled() == False
+    assert Toast.getPooledCount() == 0
     assert Toast.getCount() == 0
     assert Toast.getQueuedCount() == 0
     assert Toast.getVisibleCount() == 0
@@ -569,6 +726,69 @@ def test_set_show_duration_bar(qtbot):
     assert toast_1.height() - toast_2.height() == 4
 
 
+def test_set_duration_bar_maximum_update_rate(qtbot):
+    """Test limiting the update rate of the duration bar and only resizing
+    the duration bar chunk if its width in pixels changed"""
+
+    Toast.setDurationBarMaximumUpdateRate(30)
+    assert Toast.getDurationBarMaximumUpdateRate() == 30
+
+    # Long duration, so that most ticks do not change the chunk width
+    toast = Toast()
+    qtbot.addWidget(toast)
+    toast.setAutoDelete(False)
+    toast.setDuration(100000)
+    toast.setFadeInDuration(0)
+    toast.setFadeOutDuration(0)
+
+    update_duration_bar = Toast._Toast__update_duration_bar
+    set_chunk_width = Toast._Toast__set_duration_bar_chunk_width
+
+    with patch.object(Toast, '_Toast__update_duration_bar', autospec=True,
+                      side_effect=update_duration_bar) as tick, \
+            patch.object(Toast, '_Toast__set_duration_bar_chunk_width', autospec=True,
+                         side_effect=set_chunk_width) as resize:
+        toast.show()
+
+        refresh_rate = toast.screen().refreshRate() if toast.screen() is not None else 0
+        update_rate = min(30, refresh_rate) if refresh_rate > 0 else 30
+        duration_bar_timer = Toast._Toast__duration_bar_timer
+        assert duration_bar_timer.isActive()
+        assert duration_bar_timer.interval() == round(1000 / update_rate)
+
+        qtbot.waitUntil(lambda: tick.call_count >= 5, timeout=2000)
+
+    widths = [call.args[1] for call in resize.call_args_list]
+    assert len(widths) == len(set(widths))
+    assert len(widths) < tick.call_count
+
+    # The timer stops once no duration bar is counting down anymore
+    toast.hide()
+    qtbot.waitUntil(lambda: not toast.isVisible(), timeout=1000)
+    assert not duration_bar_timer.isActive()
+
+
+def test_durations_with_shared_timer(qtbot):
+    """Test that toasts with different durations hide independently"""
+
+    toast_1 = Toast()
+    toast_2 = Toast()
+    toast_1.setAutoDelete(False)
+    toast_2.setAutoDelete(False)
+    toast_1.setDuration(400)
+    toast_2.setDuration(100)
+    toast_1.setFadeOutDuration(0)
+    toast_2.setFadeOutDuration(0)
+    toast_1.show()
+    toast_2.show()
+    qtbot.addWidget(toast_1)
+    qtbot.addWidget(toast_2)
+
+    qtbot.waitUntil(lambda: not toast_2.isVisible(), timeout=1000)
+    assert toast_1.isVisible() == True
+    qtbot.waitUntil(lambda: not toast_1.isVisible(), timeout=1000)
+
+
 def test_set_title(qtbot):
     """Test setting the title of a toast"""
 
@@ -806,6 +1026,49 @@ def test_set_reset_duration_on_hover(qtbot):
     assert toast.isResetDurationOnHover() == False
 
 
+def test_set_pause_duration_on_hover(qtbot):
+    """Test pausing the duration of a toast on hover"""
+
+    toast = Toast()
+    toast.setDuration(1000)
+    toast.setResetDurationOnHover(False)
+    toast.setPauseDurationOnHover(True)
+    toast.show()
+    qtbot.addWidget(toast)
+
+    assert toast.isPauseDurationOnHover() == True
+
+    toast.enterEvent(None)
+    remaining_time = toast.getRemainingTime()
+    qtbot.wait(100)
+    assert toast.getRemainingTime() == remaining_time
+
+    toast.leaveEvent(None)
+    qtbot.wait(100)
+    assert toast.getRemainingTime() < remaining_time
+
+
+def test_set_paused(qtbot):
+    """Test pausing the durations of all toasts"""
+
+    toast = Toast()
+    toast.setAutoDelete(False)
+    toast.setDuration(150)
+    toast.setFadeOutDuration(0)
+    toast.show()
+    qtbot.addWidget(toast)
+
+    Toast.setPaused(True)
+    assert Toast.isPaused() == True
+    qtbot.wait(300)
+    assert toast.isVisible() == True
+    assert toast.getRemainingTime() > 0
+
+    Toast.setPaused(False)
+    qtbot.waitUntil(lambda: not toast.isVisible(), timeout=1000)
+    assert toast.getRemainingTime() == 0
+
+
 def test_set_stay_on_top(qtbot):
     """Test disabling the stay on top option of a toast"""
 
@@ -1161,3 +1424,590 @@ def test_hide(qtbot):
     toast_1.hide()
     assert toast_1.isVisible() == False
     assert toast_2.isVisible() == True
+
+
+def test_hide_queued(qtbot):
+    """Test hiding a toast that is still in the queue"""
+
+    Toast.setMaximumOnScreen(1)
+    toast_1 = Toast()
+    toast_2 = Toast()
+    toast_1.show()
+    toast_2.show()
+    qtbot.addWidget(toast_1)
+    qtbot.addWidget(toast_2)
+
+    assert Toast.getQueuedCount() == 1
+    toast_2.hide()
+    assert Toast.getQueuedCount() == 0
+    assert toast_2.isVisible() == False
+
+
+def test_from_spec(qtbot):
+    """Test creating a toast from a toast spec"""
+
+    spec = ToastSpec(title='title', text='text', duration=2000,
+                     preset=ToastPreset.ERROR, title_color=QColor('#123456'))
+    toast = Toast.fromSpec(spec)
+    qtbot.addWidget(toast)
+
+    assert toast.getTitle() == 'title'
+    assert toast.getText() == 'text'
+    assert toast.getDuration() == 2000
+    assert toast.getIconColor() == QColor('#BA2626')
+    assert toast.getTitleColor() == QColor('#123456')
+    assert toast.getTextColor() == QColor('#5C5C5C')
+
+
+def test_show_spec(qtbot):
+    """Test showing toast specs (only queued as specs if no space on screen)"""
+
+    Toast.setMaximumOnScreen(1)
+    # Toasts created from specs are deleted after closing, so they are not added to qtbot
+    toast = Toast.showSpec(ToastSpec(title='first', duration=100))
+    toast.setFadeOutDuration(0)
+
+    assert toast.isVisible() == True
+    assert Toast.showSpec(ToastSpec(title='second')) is None
+    assert Toast.getQueuedCount() == 1
+
+    qtbot.waitUntil(lambda: Toast.getQueuedCount() == 0, timeout=2000)
+    assert Toast.getVisibleCount() == 1
+
+
+def test_pooling(qtbot):
+    """Test reusing closed toasts from the pool"""
+
+    Toast.setPoolingEnabled(True)
+    closed = []
+    toast = Toast.obtain()
+    qtbot.addWidget(toast)
+    toast.setTitle('title')
+    toast.setFadeInDuration(0)
+    toast.setFadeOutDuration(0)
+    toast.setShowIcon(True)
+    toast.closed.connect(lambda: closed.append(toast))
+    toast.show()
+    toast.hide()
+
+    assert Toast.isPoolingEnabled() == True
+    assert Toast.getPooledCount() == 1
+    assert closed == [toast]
+
+    reused_toast = Toast.obtain()
+    assert reused_toast is toast
+    assert Toast.getPooledCount() == 0
+    assert reused_toast.getTitle() == ''
+    assert reused_toast.isShowIcon() == False
+    assert reused_toast.getFadeInDuration() == 250
+
+    reused_toast.setFadeOutDuration(0)
+    reused_toast.show()
+    assert reused_toast.isVisible() == True
+    reused_toast.hide()
+    assert closed == [toast]
+
+    Toast.setPoolingEnabled(False)
+    assert Toast.getPooledCount() == 0
+
+
+def test_pooling_only_obtained(qtbot):
+    """Test that toasts created directly are never pooled"""
+
+    Toast.setPoolingEnabled(True)
+    toast = Toast()
+    qtbot.addWidget(toast)
+    toast.setFadeOutDuration(0)
+    toast.show()
+    toast.hide()
+
+    assert Toast.getPooledCount() == 0
+
+
+def test_auto_delete(qtbot):
+    """Test that closed toasts without a parent are deleted by default"""
+
+    parent = QMainWindow()
+    qtbot.addWidget(parent)
+    toast = Toast()
+    toast_with_parent = Toast(parent)
+
+    assert toast.isAutoDelete() == True
+    assert toast_with_parent.isAutoDelete() == False
+
+    toast_with_parent.setAutoDelete(True)
+    assert toast_with_parent.isAutoDelete() == True
+    toast_with_parent.setAutoDelete(False)
+
+    deleted = []
+    toast.destroyed.connect(lambda: deleted.append(True))
+    toast.setFadeOutDuration(0)
+    toast.show()
+    toast.hide()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert deleted == [True]
+
+    toast_with_parent.setFadeOutDuration(0)
+    toast_with_parent.show()
+    toast_with_parent.hide()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert toast_with_parent.isVisible() == False
+
+
+
+def test_auto_delete_hide_queued(qtbot):
+    """Test that a toast hidden from the queue is closed and deleted like a shown toast"""
+
+    Toast.setMaximumOnScreen(1)
+    toast_1 = Toast()
+    toast_2 = Toast()
+    qtbot.addWidget(toast_1)
+    toast_1.show()
+    toast_2.show()
+
+    closed = []
+    deleted = []
+    toast_2.closed.connect(lambda: closed.append(True))
+    toast_2.destroyed.connect(lambda: deleted.append(True))
+    toast_2.hide()
+    assert Toast.getQueuedCount() == 0
+    assert closed == [True]
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert deleted == [True]
+
+    # A toast hidden from the queue can not be shown again
+    toast_3 = Toast()
+    qtbot.addWidget(toast_3)
+    toast_3.setAutoDelete(False)
+    toast_3.show()
+    toast_3.hide()
+    toast_3.show()
+    assert Toast.getQueuedCount() == 0
+    assert toast_3.isVisible() == False
+
+
+def test_auto_delete_object_count(qtbot):
+    """Test that the amount of objects returns to the baseline after many toasts"""
+
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    gc.collect()
+    widget_count = len(QApplication.allWidgets())
+    toast_count = len([item for item in gc.get_objects() if isinstance(item, Toast)])
+
+    for i in range(10000):
+        toast = Toast()
+        toast.setFadeInDuration(0)
+        toast.setFadeOutDuration(0)
+        toast.show()
+        toast.hide()
+        QCoreApplication.processEvents()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    del toast
+
+    QCoreApplication.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    gc.collect()
+    assert len(QApplication.allWidgets()) == widget_count
+    assert len([item for item in gc.get_objects() if isinstance(item, Toast)]) == toast_count
+
+
+def test_deduplication(qtbot):
+    """Test coalescing duplicates of shown and queued toasts"""
+
+    Toast.setDeduplicationEnabled(True)
+    Toast.setMaximumOnScreen(1)
+    assert Toast.isDeduplicationEnabled() == True
+
+    toast = Toast()
+    qtbot.addWidget(toast)
+    toast.setTitle('title')
+    toast.setText('text')
+    toast.show()
+
+    duplicate = Toast()
+    duplicate.setTitle('title')
+    duplicate.setText('text')
+    duplicate.show()
+    assert toast.getDuplicateCount() == 2
+    assert Toast.getVisibleCount() == 1
+    assert Toast.getQueuedCount() == 0
+
+    # Different preset is no duplicate
+    other = Toast()
+    qtbot.addWidget(other)
+    other.setTitle('title')
+    other.setText('text')
+    other.applyPreset(ToastPreset.ERROR)
+    other.show()
+    assert Toast.getQueuedCount() == 1
+
+    # Duplicates of queued specs are only counted
+    spec = ToastSpec(title='spec', deduplication_key='key')
+    assert Toast.showSpec(spec) is None
+    assert Toast.showSpec(ToastSpec(title='other title', deduplication_key='key')) is None
+    assert Toast.showSpec(ToastSpec(title='other title', deduplication_key='key')) is None
+    assert Toast.getQueuedCount() == 2
+    assert spec.duplicate_count == 3
+    assert Toast.fromSpec(spec).getDuplicateCount() == 3
+
+
+def test_restart_duration_on_duplicate(qtbot):
+    """Test restarting the duration of a shown toast when a duplicate is coalesced"""
+
+    Toast.setDeduplicationEnabled(True)
+    Toast.setRestartDurationOnDuplicate(True)
+    assert Toast.isRestartDurationOnDuplicate() == True
+
+    toast = Toast()
+    qtbot.addWidget(toast)
+    toast.setDeduplicationKey('key')
+    toast.setDuration(5000)
+    toast.show()
+    qtbot.wait(100)
+    remaining_time = toast.getRemainingTime()
+
+    duplicate = Toast()
+    duplicate.setDeduplicationKey('key')
+    duplicate.show()
+    assert toast.getDeduplicationKey() == 'key'
+    assert toast.getDuplicateCount() == 2
+    assert toast.getRemainingTime() > remaining_time
+
+
+def test_rate_limit(qtbot):
+    """Test suppressing toasts that exceed the rate limit of their category"""
+
+    Toast.setRateLimit(0.001, 2)
+    Toast.setMaximumOnScreen(1)
+    suppressed = []
+    rate_limiter = Toast.getRateLimiter()
+
+    def on_suppressed(category, count):
+        suppressed.append(category)
+
+    # The rate limiter is shared by all tests, so always disconnect the slot again
+    rate_limiter.suppressed.connect(on_suppressed)
+    try:
+        assert Toast.getRateLimit() == (0.001, 2)
+
+        toasts = []
+        for i in range(3):
+            toast = Toast()
+            qtbot.addWidget(toast)
+            toast.setAutoDelete(False)
+            toast.setFadeOutDuration(0)
+            toast.applyPreset(ToastPreset.ERROR)
+            toast.show()
+            toasts.append(toast)
+
+        # First toast is shown, the second one queued, and the third one suppressed
+        assert Toast.getVisibleCount() == 1
+        assert Toast.getQueuedCount() == 1
+        assert Toast.getSuppressedCount() == 1
+        assert Toast.getSuppressedCount(ToastPreset.ERROR) == 1
+        assert suppressed == [ToastPreset.ERROR]
+
+        # Other categories have their own limit
+        toast = Toast()
+        qtbot.addWidget(toast)
+        toast.setRateLimitCategory('channel')
+        toast.show()
+        assert toast.getRateLimitCategory() == 'channel'
+        assert Toast.getQueuedCount() == 2
+
+        assert Toast.showSpec(ToastSpec(rate_limit_category='channel')) is None
+        assert Toast.showSpec(ToastSpec(rate_limit_category='channel')) is None
+        assert Toast.getQueuedCount() == 3
+        assert Toast.getSuppressedCount('channel') == 1
+
+        # Queued toasts are not limited again when they are shown
+        toasts[0].hide()
+        qtbot.waitUntil(lambda: Toast.getQueuedCount() == 2, timeout=1000)
+        assert Toast.getSuppressedCount() == 2
+
+    finally:
+        rate_limiter.suppressed.disconnect(on_suppressed)
+
+
+def test_rate_limit_uncategorized(qtbot):
+    """Test reading the suppressed count of toasts without preset and rate limit category"""
+
+    Toast.setRateLimit(0.001, 1)
+    Toast.setMaximumOnScreen(1)
+
+    for i in range(3):
+        toast = Toast()
+        qtbot.addWidget(toast)
+        toast.show()
+
+    error_toast = Toast()
+    qtbot.addWidget(error_toast)
+    error_toast.applyPreset(ToastPreset.ERROR)
+    error_toast.show()
+    error_toast = Toast()
+    qtbot.addWidget(error_toast)
+    error_toast.applyPreset(ToastPreset.ERROR)
+    error_toast.show()
+
+    assert Toast.getSuppressedCount(None) == 2
+    assert Toast.getSuppressedCount(ToastPreset.ERROR) == 1
+    assert Toast.getSuppressedCount() == 3
+
+
+def test_priority(qtbot):
+    """Test that queued toasts with a higher priority are shown first"""
+
+    Toast.setMaximumOnScreen(1)
+    toast = Toast()
+    qtbot.addWidget(toast)
+    toast.setAutoDelete(False)
+    toast.setFadeOutDuration(0)
+    toast.setFadeInDuration(0)
+    toast.show()
+
+    low_priority_toast = Toast()
+    qtbot.addWidget(low_priority_toast)
+    low_priority_toast.show()
+
+    high_priority_toast = Toast()
+    qtbot.addWidget(high_priority_toast)
+    high_priority_toast.setPriority(10)
+    high_priority_toast.show()
+    assert high_priority_toast.getPriority() == 10
+
+    Toast.showSpec(ToastSpec(title='spec', priority=5))
+    assert Toast.getQueuedCount() == 3
+
+    toast.hide()
+    qtbot.waitUntil(lambda: high_priority_toast.isVisible(), timeout=1000)
+    assert low_priority_toast.isVisible() == False
+    assert Toast.getQueuedCount() == 2
+
+
+def test_preemption(qtbot):
+    """Test that a queued toast with a higher priority hides the least important shown toast"""
+
+    Toast.setMaximumOnScreen(2)
+    Toast.setPreemptionEnabled(True)
+    assert Toast.isPreemptionEnabled() == True
+
+    toasts = []
+    for priority in (1, 0, 5):
+        toast = Toast()
+        qtbot.addWidget(toast)
+        toast.setAutoDelete(False)
+        toast.setFadeInDuration(0)
+        toast.setFadeOutDuration(0)
+        toast.setPriority(priority)
+        toast.show()
+        toasts.append(toast)
+
+    qtbot.waitUntil(lambda: toasts[2].isVisible(), timeout=1000)
+    assert toasts[0].isVisible() == True
+    assert toasts[1].isVisible() == False
+    assert Toast.getQueuedCount() == 0
+
+    # Toasts with the same or a lower priority do not preempt
+    toast = Toast()
+    qtbot.addWidget(toast)
+    toast.setPriority(1)
+    toast.show()
+    assert Toast.getQueuedCount() == 1
+    assert toasts[0].isVisible() == True
+
+
+def test_queue_time_to_live(qtbot):
+    """Test that queued toasts expire after their queue time to live"""
+
+    Toast.setMaximumOnScreen(1)
+    toast = Toast()
+    qtbot.addWidget(toast)
+    toast.setAutoDelete(False)
+    toast.setFadeInDuration(0)
+    toast.setFadeOutDuration(0)
+    toast.show()
+
+    expired_toast = Toast()
+    qtbot.addWidget(expired_toast)
+    expired_toast.setAutoDelete(False)
+    expired_toast.setQueueTimeToLive(50)
+    dropped = []
+    expired_toast.dropped.connect(lambda: dropped.append(expired_toast))
+    expired_toast.show()
+    assert expired_toast.getQueueTimeToLive() == 50
+
+    Toast.showSpec(ToastSpec(title='expired', queue_time_to_live=50))
+    Toast.showSpec(ToastSpec(title='not expired', queue_time_to_live=10000))
+    assert Toast.getQueuedCount() == 3
+
+    qtbot.wait(100)
+    toast.hide()
+    qtbot.waitUntil(lambda: Toast.getQueuedCount() == 0, timeout=1000)
+    assert Toast.getExpiredCount() == 2
+    assert Toast.getDroppedCount() == 0
+    assert Toast.getVisibleCount() == 1
+    assert expired_toast.isVisible() == False
+    assert dropped == [expired_toast]
+
+
+def test_show_many(qtbot):
+    """Test that showing a batch of toasts repositions each toast only once"""
+
+    def record_states(states):
+        return lambda state, old_state: states.append(state)
+
+    Toast.setMaximumOnScreen(5)
+    toasts = []
+    position_animations = []
+    slots = []
+    for i in range(5):
+        toast = Toast()
+        qtbot.addWidget(toast)
+        toast.setAutoDelete(False)
+        toasts.append(toast)
+        position_animations.append([])
+        slots.append(record_states(position_animations[-1]))
+        toast.pos_animation.stateChanged.connect(slots[-1])
+
+    def get_position_animation_counts():
+        return [states.count(QAbstractAnimation.State.Running) for states in position_animations]
+
+    try:
+        # Every toast except the first one also starts its fade down / up animation when shown
+        Toast.showMany(toasts[:4] + [ToastSpec(title='spec'), ToastSpec(title='queued')])
+        assert get_position_animation_counts() == [1, 2, 2, 2, 0]
+
+        assert Toast.getVisibleCount() == 5
+        assert Toast.getQueuedCount() == 1
+
+        # Toasts are only repositioned at the end of the outermost batch
+        Toast.reset()
+        Toast.setMaximumOnScreen(5)
+        with Toast.batch():
+            with Toast.batch():
+                toasts[4].show()
+            assert get_position_animation_counts()[4] == 0
+        assert get_position_animation_counts()[4] == 1
+    finally:
+        for toast, slot in zip(toasts, slots):
+            toast.pos_animation.stateChanged.disconnect(slot)
+
+
+def test_stack_offsets(qtbot):
+    """Test that the cached stack offsets match the heights of the shown toasts"""
+
+    Toast.setMaximumOnScreen(10)
+    Toast.setSpacing(7)
+    toasts = []
+    for i in range(6):
+        toast = Toast()
+        qtbot.addWidget(toast)
+        toast.setAutoDelete(False)
+        toast.setFadeOutDuration(0)
+        toast.setTitle('title')
+        toast.setText('text\n' * i)
+        toast.show()
+        toasts.append(toast)
+
+    def assert_offsets(shown_toasts):
+        # Compare the target positions, since moving up is animated
+        for lower_toast, upper_toast in zip(shown_toasts, shown_toasts[1:]):
+            spacing = (lower_toast.pos_animation.endValue().y() - upper_toast.pos_animation.endValue().y()
+                       - upper_toast.height() + 2 * DROP_SHADOW_SIZE)
+            assert spacing == Toast.getSpacing()
+
+    assert_offsets(toasts)
+
+    toasts[2].hide()
+    assert_offsets(toasts[:2] + toasts[3:])
+
+    Toast.setSpacing(3)
+    assert_offsets(toasts[:2] + toasts[3:])
+
+
+def test_precompute(qtbot):
+    """Test that the layout of queued toasts is calculated ahead of time"""
+
+    Toast.setMaximumOnScreen(1)
+    assert Toast.getPrecomputeCount() == 3
+
+    with patch('src.pyqttoast.toast.compute_toast_layout', wraps=compute_toast_layout) as compute:
+        def get_computed_titles():
+            return [call.args[0].title for call in compute.call_args_list]
+
+        toast = Toast()
+        qtbot.addWidget(toast)
+        toast.setAutoDelete(False)
+        toast.setTitle('Shown')
+        toast.setFadeInDuration(0)
+        toast.setFadeOutDuration(0)
+        toast.show()
+
+        queued_toasts = []
+        for i in range(4):
+            queued_toast = Toast()
+            qtbot.addWidget(queued_toast)
+            queued_toast.setAutoDelete(False)
+            queued_toast.setTitle('Queued {}'.format(i))
+            queued_toast.setFadeInDuration(0)
+            queued_toast.setFadeOutDuration(0)
+            queued_toast.show()
+            queued_toasts.append(queued_toast)
+
+        qtbot.waitUntil(lambda: len(get_computed_titles()) == 4, timeout=1000)
+        qtbot.wait(50)
+        assert get_computed_titles() == ['Shown', 'Queued 0', 'Queued 1', 'Queued 2']
+
+        # Stop precomputing, so that only showing the toasts calculates layouts
+        Toast.setPrecomputeCount(0)
+        assert Toast.getPrecomputeCount() == 0
+
+        # A precomputed layout is only used if the toast did not change after it was calculated
+        # (margins are changed in place, so the precomputed spec must not share them)
+        queued_toasts[1].setText('Changed text')
+        queued_toasts[2].setMarginLeft(40)
+
+        for hidden_toast, next_toast in zip([toast] + queued_toasts, queued_toasts):
+            hidden_toast.hide()
+            qtbot.waitUntil(next_toast.isVisible, timeout=1000)
+
+        assert get_computed_titles()[4:] == ['Queued 1', 'Queued 2', 'Queued 3']
+        queued_toasts[3].hide()
+
+
+def test_painted_render_mode(qtbot):
+    """Test that a painted toast has no child widgets, the same size as
+    a toast made of widgets, and can be closed with its close button"""
+
+    assert Toast.getRenderMode() == ToastRenderMode.WIDGETS
+    widget_toast = Toast()
+    qtbot.addWidget(widget_toast)
+    widget_toast.setAutoDelete(False)
+    widget_toast.setTitle('Title')
+    widget_toast.setText('Text of a toast')
+    widget_toast.show()
+
+    Toast.setRenderMode(ToastRenderMode.PAINTED)
+    assert Toast.getRenderMode() == ToastRenderMode.PAINTED
+    painted_toast = Toast()
+    qtbot.addWidget(painted_toast)
+    painted_toast.setAutoDelete(False)
+    painted_toast.setTitle('Title')
+    painted_toast.setText('Text of a toast')
+    painted_toast.setFadeOutDuration(0)
+    assert painted_toast.findChildren(QWidget) == []
+
+    painted_toast.show()
+    assert painted_toast.size() == widget_toast.size()
+    assert not painted_toast.grab().isNull()
+
+    # Only clicks on the close button hide the toast
+    qtbot.mouseClick(painted_toast, Qt.MouseButton.LeftButton, pos=QPoint(30, 30))
+    assert painted_toast.isVisible()
+
+    # The close button is painted where the toast made of widgets has its close button
+    close_button = widget_toast.findChild(QPushButton)
+    close_button_center = close_button.mapTo(widget_toast, close_button.rect().center())
+    qtbot.mouseClick(painted_toast, Qt.MouseButton.LeftButton, pos=close_button_center)
+    qtbot.waitUntil(lambda: not painted_toast.isVisible(), timeout=1000)
+    widget_toast.hide()